@@ -0,0 +1,28 @@
+"""add_content_hash_to_itglue_entities
+
+Revision ID: 8c4e2f1a9b7d
+Revises: 3717823b23b8
+Create Date: 2026-10-16 09:15:12.481220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2f1a9b7d'
+down_revision: Union[str, None] = '3717823b23b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Hash of canonicalized attributes + relationships, used by sync to skip
+    # writes, embedding queue inserts and graph updates for unchanged entities
+    op.add_column('itglue_entities', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('itglue_entities', 'content_hash')
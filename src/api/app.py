@@ -6,13 +6,15 @@ from typing import Optional
 
 from fastapi import BackgroundTasks, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from src.cache import CacheManager
 from src.config.settings import settings
 from src.data import db_manager
 from src.query import QueryEngine
 from src.search import SemanticSearch
+from src.search.qdrant import close_qdrant_clients
+from src.services.itglue import ITGlueClient
 from src.sync import SyncOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -39,6 +41,7 @@ class QueryRequest(BaseModel):
     """Query request model."""
     query: str
     company: Optional[str] = None
+    offset: int = Field(0, ge=0, description="next_offset from the previous page")
 
 
 class SyncRequest(BaseModel):
@@ -55,6 +58,7 @@ class CacheInvalidateRequest(BaseModel):
 
 
 # Global instances
+itglue_client: Optional[ITGlueClient] = None
 query_engine: Optional[QueryEngine] = None
 sync_orchestrator: Optional[SyncOrchestrator] = None
 cache_manager: Optional[CacheManager] = None
@@ -64,7 +68,7 @@ semantic_search: Optional[SemanticSearch] = None
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
-    global query_engine, sync_orchestrator, cache_manager, semantic_search
+    global itglue_client, query_engine, sync_orchestrator, cache_manager, semantic_search
 
     logger.info("Starting FastAPI application")
 
@@ -73,8 +77,9 @@ async def startup_event():
         await db_manager.initialize()
         await db_manager.create_tables()
 
-        # Initialize cache
-        cache_manager = CacheManager()
+        # Initialize cache; cached IT Glue resources are reloaded through the client
+        itglue_client = ITGlueClient()
+        cache_manager = CacheManager(loaders=itglue_client.cache_loaders())
         await cache_manager.connect()
 
         # Initialize search
@@ -83,11 +88,12 @@ async def startup_event():
 
         # Initialize query engine
         query_engine = QueryEngine(
-            cache=cache_manager
+            cache=cache_manager,
+            itglue_client=itglue_client
         )
 
         # Initialize sync orchestrator
-        sync_orchestrator = SyncOrchestrator()
+        sync_orchestrator = SyncOrchestrator(itglue_client=itglue_client)
 
         logger.info("All services initialized")
 
@@ -102,10 +108,18 @@ async def shutdown_event():
     logger.info("Shutting down FastAPI application")
 
     try:
+        if query_engine:
+            await query_engine.close()
+
         if cache_manager:
             await cache_manager.disconnect()
 
+        # Shared by queries, cache refreshes and syncs; closed after all of them
+        if itglue_client:
+            await itglue_client.disconnect()
+
         await db_manager.close()
+        await close_qdrant_clients()
 
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
@@ -183,7 +197,8 @@ async def execute_query(request: QueryRequest):
     try:
         result = await query_engine.process_query(
             query=request.query,
-            company=request.company
+            company=request.company,
+            offset=request.offset
         )
         return result
 
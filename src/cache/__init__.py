@@ -1,6 +1,7 @@
 """Cache management for query results."""
 
 from .cache_warmer import CacheWarmer, WarmingQuery
+from .codec import ValueCodec
 from .manager import CacheManager as LegacyCacheManager
 from .redis_cache import CacheEntry, CacheManager, CacheStrategy, QueryType, RedisCache
 
@@ -11,6 +12,7 @@ __all__ = [
     'QueryType',
     'CacheStrategy',
     'CacheEntry',
+    'ValueCodec',
     'CacheWarmer',
     'WarmingQuery'
 ]
@@ -0,0 +1,247 @@
+"""Binary value codecs for Redis cache entries."""
+
+import json
+import logging
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.config.settings import settings
+
+# Faster serializers and compressors are used when installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Encoded values start with MAGIC, a serializer byte and a compressor byte.
+# 0xC1 never starts UTF-8 text, so headerless JSON written before the codec
+# existed is still recognized and decoded.
+MAGIC = b"\xc1\xce"
+HEADER_SIZE = len(MAGIC) + 2
+
+SERIALIZERS = {"json": b"j", "orjson": b"o", "msgpack": b"m"}
+COMPRESSORS = {"none": b"n", "zlib": b"z", "zstd": b"s", "lz4": b"4"}
+
+_SERIALIZER_NAMES = {code: name for name, code in SERIALIZERS.items()}
+_COMPRESSOR_NAMES = {code: name for name, code in COMPRESSORS.items()}
+
+
+def _available_serializer(name: str) -> bool:
+    return (
+        name == "json"
+        or (name == "orjson" and ORJSON_AVAILABLE)
+        or (name == "msgpack" and MSGPACK_AVAILABLE)
+    )
+
+
+def _available_compressor(name: str) -> bool:
+    return (
+        name in ("none", "zlib")
+        or (name == "zstd" and ZSTD_AVAILABLE)
+        or (name == "lz4" and LZ4_AVAILABLE)
+    )
+
+
+@dataclass
+class CodecMetrics:
+    """Encoding statistics for one query type."""
+
+    entries: int = 0
+    compressed: int = 0
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+    encode_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize metrics."""
+        return {
+            'entries': self.entries,
+            'compressed': self.compressed,
+            'raw_bytes': self.raw_bytes,
+            'stored_bytes': self.stored_bytes,
+            'compression_ratio': self.raw_bytes / self.stored_bytes if self.stored_bytes else 1.0,
+            'avg_encode_ms': self.encode_ms / self.entries if self.entries else 0.0
+        }
+
+
+class ValueCodec:
+    """Serializes cache values to compact, self-describing bytes.
+
+    Values are serialized with orjson, msgpack or the standard library
+    json module and, above ``compression_threshold`` bytes, compressed
+    with zstd, lz4 or zlib. A four byte header records both choices, so
+    entries written with other settings, or before the codec existed,
+    decode correctly.
+    """
+
+    def __init__(
+        self,
+        serializer: Optional[str] = None,
+        compression: Optional[str] = None,
+        compression_threshold: Optional[int] = None
+    ):
+        """Initialize codec.
+
+        Args:
+            serializer: "auto", "orjson", "msgpack" or "json"
+            compression: "auto", "zstd", "lz4", "zlib" or "none"
+            compression_threshold: Serialized size in bytes above which
+                values are compressed
+        """
+        serializer = serializer or settings.cache_serializer
+        compression = compression or settings.cache_compression
+
+        if serializer == "auto":
+            serializer = "orjson" if ORJSON_AVAILABLE else "json"
+        if compression == "auto":
+            compression = next(
+                name for name in ("zstd", "lz4", "zlib") if _available_compressor(name)
+            )
+
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown cache serializer: {serializer}")
+        if compression not in COMPRESSORS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+        if not _available_serializer(serializer):
+            logger.warning(f"Cache serializer {serializer} not installed, using json")
+            serializer = "json"
+        if not _available_compressor(compression):
+            logger.warning(f"Cache compression {compression} not installed, using zlib")
+            compression = "zlib"
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_threshold = (
+            compression_threshold if compression_threshold is not None
+            else settings.cache_compression_threshold
+        )
+
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if compression == "zstd" else None
+        self._metrics: dict[str, CodecMetrics] = {}
+
+    def encode(self, value: Any, query_type: Optional[str] = None) -> bytes:
+        """Encode a value for storage.
+
+        Args:
+            value: JSON-compatible value; other types are stored as strings
+            query_type: Query type the encoding is recorded under in metrics
+
+        Returns:
+            Header followed by the serialized, possibly compressed, value
+        """
+        started = time.perf_counter()
+
+        payload = self._serialize(value)
+        raw_size = len(payload)
+
+        compression = "none"
+        if self.compression != "none" and raw_size > self.compression_threshold:
+            compressed = self._compress(payload)
+            # Incompressible payloads are stored as they are
+            if len(compressed) < raw_size:
+                payload = compressed
+                compression = self.compression
+
+        data = MAGIC + SERIALIZERS[self.serializer] + COMPRESSORS[compression] + payload
+
+        metrics = self._metrics.setdefault(query_type or "default", CodecMetrics())
+        metrics.entries += 1
+        metrics.compressed += compression != "none"
+        metrics.raw_bytes += raw_size
+        metrics.stored_bytes += len(data)
+        metrics.encode_ms += (time.perf_counter() - started) * 1000
+
+        return data
+
+    def decode(self, data: Any) -> Any:
+        """Decode a stored value.
+
+        Args:
+            data: Encoded bytes, or headerless JSON written before the codec
+
+        Returns:
+            Decoded value
+        """
+        if isinstance(data, str):
+            return json.loads(data)
+        if not data.startswith(MAGIC):
+            return json.loads(data)
+
+        serializer = _SERIALIZER_NAMES.get(data[2:3])
+        compression = _COMPRESSOR_NAMES.get(data[3:4])
+        if serializer is None or compression is None:
+            raise ValueError(f"Unknown cache value header: {data[:HEADER_SIZE]!r}")
+
+        payload = self._decompress(data[HEADER_SIZE:], compression)
+        return self._deserialize(payload, serializer)
+
+    def _serialize(self, value: Any) -> bytes:
+        if self.serializer == "orjson":
+            return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+        if self.serializer == "msgpack":
+            return msgpack.packb(value, default=str, use_bin_type=True)
+        return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+    @staticmethod
+    def _deserialize(payload: bytes, serializer: str) -> Any:
+        if serializer == "msgpack":
+            if not MSGPACK_AVAILABLE:
+                raise ValueError("Cache value was written with msgpack, which is not installed")
+            return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+        if serializer == "orjson" and ORJSON_AVAILABLE:
+            return orjson.loads(payload)
+        # orjson writes plain JSON, so json can read it too
+        return json.loads(payload)
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zstd":
+            return self._zstd_compressor.compress(payload)
+        if self.compression == "lz4":
+            return lz4.frame.compress(payload)
+        return zlib.compress(payload, level=1)
+
+    @staticmethod
+    def _decompress(payload: bytes, compression: str) -> bytes:
+        if compression == "none":
+            return payload
+        if not _available_compressor(compression):
+            raise ValueError(
+                f"Cache value was compressed with {compression}, which is not installed"
+            )
+        if compression == "zstd":
+            return zstandard.ZstdDecompressor().decompress(payload)
+        if compression == "lz4":
+            return lz4.frame.decompress(payload)
+        return zlib.decompress(payload)
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """Get encoding metrics per query type.
+
+        Returns:
+            Query type to entries, bytes before and after encoding,
+            compression ratio and average encode time
+        """
+        return {query_type: m.to_dict() for query_type, m in self._metrics.items()}
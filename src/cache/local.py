@@ -0,0 +1,292 @@
+"""In-process L1 cache tier and cross-process invalidation."""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from fnmatch import fnmatchcase
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds before a dropped invalidation subscription is re-established
+RESUBSCRIBE_DELAY = 1.0
+
+
+class LocalCache:
+    """Bounded in-process cache with per-entry expiry.
+
+    Entries are evicted least recently used first once ``max_entries`` is
+    reached. Values larger than ``max_value_bytes`` are not held, so the
+    tier stays small and only absorbs reads of small, hot keys.
+    """
+
+    def __init__(self, max_entries: int, max_value_bytes: Optional[int] = None):
+        """Initialize local cache.
+
+        Args:
+            max_entries: Maximum entries held
+            max_value_bytes: Largest value (by ``len``) worth holding
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_value_bytes = max_value_bytes
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get an unexpired value, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> bool:
+        """Hold a value for ``ttl`` seconds.
+
+        Returns:
+            True if the value was stored
+        """
+        if ttl <= 0 or (self.max_value_bytes is not None and len(value) > self.max_value_bytes):
+            self._entries.pop(key, None)
+            return False
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def delete(self, *keys: str) -> int:
+        """Drop entries by key."""
+        return sum(self._entries.pop(key, None) is not None for key in keys)
+
+    def evict(self, predicate: Callable[[str, Any], bool]) -> int:
+        """Drop every entry for which ``predicate(key, value)`` is true."""
+        matching = [key for key, (_, value) in self._entries.items() if predicate(key, value)]
+        return self.delete(*matching)
+
+    def clear(self) -> int:
+        """Drop all entries."""
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get size and hit-rate statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups * 100 if lookups else 0
+        }
+
+
+class InvalidationChannel:
+    """Redis pub/sub channel that keeps L1 caches coherent across processes.
+
+    Every process publishes the invalidations it performs and applies the
+    ones published by others. If the subscription drops, invalidations may
+    have been missed, so the handler is asked to clear everything before
+    the channel resubscribes.
+    """
+
+    def __init__(self, channel: str, handler: Callable[[dict[str, Any]], None]):
+        """Initialize invalidation channel.
+
+        Args:
+            channel: Redis pub/sub channel name
+            handler: Applies an invalidation message to the local cache;
+                ``{"all": True}`` means drop everything
+        """
+        self.channel = channel
+        self.handler = handler
+        self.origin = uuid.uuid4().hex
+
+        self._client = None
+        self._task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.received = 0
+
+    async def start(self, client) -> None:
+        """Subscribe in the background.
+
+        Args:
+            client: Connected Redis client
+        """
+        self._client = client
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def publish(self, **message: Any) -> None:
+        """Tell other processes to invalidate their local entries.
+
+        Args:
+            message: Invalidation, e.g. ``keys=[...]``, ``pattern="..."`` or ``all=True``
+        """
+        if self._client is None:
+            return
+        try:
+            await self._client.publish(
+                self.channel, json.dumps({**message, 'origin': self.origin})
+            )
+            self.published += 1
+        except Exception as e:
+            logger.warning(f"Failed to publish cache invalidation on {self.channel}: {e}")
+
+    async def _listen(self) -> None:
+        """Apply invalidations from other processes until stopped."""
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message.get('type') != 'message':
+                        continue
+                    data = json.loads(message['data'])
+                    if data.get('origin') == self.origin:
+                        continue
+                    self.received += 1
+                    self.handler(data)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation subscription on {self.channel} lost: {e}")
+
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+            # Anything published while disconnected was missed
+            self.handler({'all': True})
+            await asyncio.sleep(RESUBSCRIBE_DELAY)
+
+
+class CoherentLocalCache(LocalCache):
+    """LocalCache kept coherent with other processes over an InvalidationChannel.
+
+    Invalidations made here are applied locally and published; those
+    published by other processes are applied as they arrive. Every
+    invalidation bumps ``generation``, so a reader can tell whether one
+    overtook its Redis read before holding the value.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        max_entries: int,
+        max_value_bytes: Optional[int] = None
+    ):
+        """Initialize coherent local cache.
+
+        Args:
+            channel: Redis pub/sub channel shared by every process's copy
+            max_entries: Maximum entries held
+            max_value_bytes: Largest value (by ``len``) worth holding
+        """
+        super().__init__(max_entries, max_value_bytes)
+        self.invalidations = InvalidationChannel(channel, self.apply_invalidation)
+        self.generation = 0
+
+    async def start(self, client) -> None:
+        """Start applying invalidations from other processes.
+
+        Args:
+            client: Connected Redis client
+        """
+        await self.invalidations.start(client)
+
+    async def stop(self) -> None:
+        """Stop listening and drop everything, as invalidations would be missed."""
+        await self.invalidations.stop()
+        self.clear()
+
+    def apply_invalidation(self, message: dict[str, Any]) -> None:
+        """Drop entries named by an invalidation message."""
+        self.generation += 1
+
+        if message.get('all'):
+            self.clear()
+            return
+        if message.get('keys'):
+            self.delete(*message['keys'])
+        if message.get('pattern'):
+            pattern = message['pattern']
+            self.evict(lambda key, _: fnmatchcase(key, pattern))
+
+    async def invalidate(
+        self,
+        keys: Optional[Iterable[str]] = None,
+        pattern: Optional[str] = None,
+        everything: bool = False
+    ) -> None:
+        """Drop entries here and in every other process.
+
+        Args:
+            keys: Keys to drop
+            pattern: Glob pattern of keys to drop
+            everything: Drop all entries
+        """
+        message: dict[str, Any] = {}
+        if keys:
+            message['keys'] = list(keys)
+        if pattern:
+            message['pattern'] = pattern
+        if everything:
+            message['all'] = True
+        if not message:
+            return
+
+        self.apply_invalidation(message)
+        await self.invalidations.publish(**message)
+
+    def hold(self, key: str, value: Any, ttl: float, generation: int) -> bool:
+        """Hold a value read from Redis unless an invalidation overtook the read.
+
+        Args:
+            key: Cache key
+            value: Value read
+            ttl: Seconds to hold it
+            generation: ``generation`` when the read started
+
+        Returns:
+            True if the value was stored
+        """
+        if generation != self.generation:
+            return False
+        return self.set(key, value, ttl)
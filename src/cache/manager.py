@@ -10,6 +10,8 @@ import redis.asyncio as redis
 
 from src.config.settings import settings
 
+from .local import CoherentLocalCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +36,16 @@ class CacheManager:
         self.max_cache_size = max_cache_size
         self.redis: Optional[redis.Redis] = None
 
+        # In-process L1 tier of serialized responses, kept coherent over pub/sub
+        self.l1: Optional[CoherentLocalCache] = None
+        self.l1_ttl = settings.cache_l1_ttl_seconds
+        if settings.cache_l1_max_entries > 0:
+            self.l1 = CoherentLocalCache(
+                "cache:invalidations",
+                settings.cache_l1_max_entries,
+                settings.cache_l1_max_value_bytes
+            )
+
     async def connect(self):
         """Connect to Redis."""
         if not self.redis:
@@ -48,6 +60,9 @@ class CacheManager:
                 await self.redis.ping()
                 logger.info("Connected to Redis cache")
 
+                if self.l1 is not None:
+                    await self.l1.start(self.redis)
+
             except Exception as e:
                 logger.error(f"Failed to connect to Redis: {e}")
                 self.redis = None
@@ -56,6 +71,8 @@ class CacheManager:
     async def disconnect(self):
         """Disconnect from Redis."""
         if self.redis:
+            if self.l1 is not None:
+                await self.l1.stop()
             await self.redis.aclose()
             self.redis = None
             logger.info("Disconnected from Redis cache")
@@ -100,13 +117,23 @@ class CacheManager:
         try:
             cache_key = self._generate_cache_key(query, company)
 
-            # Get from Redis
-            cached_data = await self.redis.get(f"cache:{cache_key}")
+            # Hot entries are served from process memory
+            cached_data = self.l1.get(cache_key) if self.l1 is not None else None
 
-            if cached_data:
-                # Update hit counter
-                await self.redis.incr(f"hits:{cache_key}")
+            if cached_data is None:
+                # Get from Redis
+                generation = self.l1.generation if self.l1 is not None else 0
+                cached_data = await self.redis.get(f"cache:{cache_key}")
+
+                if cached_data:
+                    # Update hit counter
+                    await self.redis.incr(f"hits:{cache_key}")
 
+                    # Hold it locally unless an invalidation overtook the read
+                    if self.l1 is not None:
+                        self.l1.hold(cache_key, cached_data, self.l1_ttl, generation)
+
+            if cached_data:
                 # Parse JSON
                 response = json.loads(cached_data)
 
@@ -161,11 +188,13 @@ class CacheManager:
             }
 
             # Store in Redis
-            await self.redis.setex(
-                f"cache:{cache_key}",
-                ttl,
-                json.dumps(cache_data)
-            )
+            serialized = json.dumps(cache_data)
+            await self.redis.setex(f"cache:{cache_key}", ttl, serialized)
+
+            if self.l1 is not None:
+                # Other processes may hold the previous response
+                await self._invalidate_l1(keys=[cache_key])
+                self.l1.set(cache_key, serialized, min(self.l1_ttl, ttl))
 
             # Store metadata
             await self.redis.hset(
@@ -223,6 +252,8 @@ class CacheManager:
                 # Invalidate specific query
                 cache_key = self._generate_cache_key(query, company)
 
+                await self._invalidate_l1(keys=[cache_key])
+
                 if await self.redis.delete(
                     f"cache:{cache_key}",
                     f"meta:{cache_key}",
@@ -234,6 +265,7 @@ class CacheManager:
             elif company:
                 # Invalidate all queries for company
                 cache_keys = await self.redis.smembers("cache:keys")
+                invalidated_keys = []
 
                 for key in cache_keys:
                     meta = await self.redis.hgetall(f"meta:{key}")
@@ -245,8 +277,11 @@ class CacheManager:
                             f"hits:{key}"
                         )
                         await self.redis.srem("cache:keys", key)
+                        invalidated_keys.append(key)
                         count += 1
 
+                await self._invalidate_l1(keys=invalidated_keys)
+
             else:
                 # Invalidate all cache
                 cache_keys = await self.redis.smembers("cache:keys")
@@ -263,6 +298,8 @@ class CacheManager:
                 # Clear index
                 await self.redis.delete("cache:keys")
 
+                await self._invalidate_l1(everything=True)
+
             logger.info(f"Invalidated {count} cache entries")
             return count
 
@@ -299,18 +336,27 @@ class CacheManager:
             info = await self.redis.info("memory")
             memory_used = info.get("used_memory_human", "Unknown")
 
-            return {
+            stats = {
                 "total_entries": total_entries,
                 "total_hits": total_hits,
                 "memory_used": memory_used,
                 "max_entries": self.max_cache_size,
                 "default_ttl": self.default_ttl
             }
+            if self.l1 is not None:
+                stats["l1"] = self.l1.get_stats()
+
+            return stats
 
         except Exception as e:
             logger.error(f"Failed to get cache stats: {e}")
             return {"error": str(e)}
 
+    async def _invalidate_l1(self, **invalidation: Any):
+        """Drop entries from L1 here and in every other process."""
+        if self.l1 is not None:
+            await self.l1.invalidate(**invalidation)
+
     async def _enforce_cache_limit(self):
         """Enforce maximum cache size."""
         try:
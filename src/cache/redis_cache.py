@@ -4,7 +4,9 @@ import asyncio
 import hashlib
 import json
 import logging
-from collections.abc import Callable
+import random
+import uuid
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -12,8 +14,33 @@ from typing import Any, Optional
 
 import redis.asyncio as redis
 
+from src.config.settings import settings
+
+from .codec import ValueCodec
+from .local import CoherentLocalCache
+from .refresh import RefreshScheduler
+
 logger = logging.getLogger(__name__)
 
+ACCESS_TRACKING_MODES = ("buffered", "sync", "off")
+
+# Access statistics outlive the longest cache strategy TTL (documentation)
+ACCESS_STATS_TTL = 86400
+
+# Reads needed before an entry counts as popular enough to refresh ahead
+REFRESH_MIN_ACCESS_COUNT = 5
+
+# Seconds between checks for a value another process is fetching
+LOCK_POLL_INTERVAL = 0.05
+
+# Deletes a lock only if it still holds this process's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
 
 class QueryType(Enum):
     """Query types with associated cache strategies."""
@@ -23,6 +50,7 @@ class QueryType(Enum):
     DOCUMENTATION = "documentation"  # Static docs, procedures
     REPORT = "report"  # Analytics, summaries
     SEARCH = "search"  # General searches
+    REFERENCE = "reference"  # Asset types, other slow-changing lookups
 
 
 @dataclass
@@ -33,6 +61,7 @@ class CacheStrategy:
     refresh_before_expiry: bool = False
     invalidate_on_update: bool = True
     max_entries: Optional[int] = None
+    l1_ttl_seconds: int = 0  # Time in the in-process tier; 0 keeps entries out of it
 
     @classmethod
     def for_query_type(cls, query_type: QueryType) -> 'CacheStrategy':
@@ -43,42 +72,56 @@ class CacheStrategy:
                 warm_on_startup=True,
                 refresh_before_expiry=True,
                 invalidate_on_update=True,
-                max_entries=100
+                max_entries=100,
+                l1_ttl_seconds=0  # Never hold passwords in process memory
             ),
             QueryType.INVESTIGATION: cls(
                 ttl_seconds=300,  # 5 minutes for investigation
                 warm_on_startup=False,
                 refresh_before_expiry=True,
                 invalidate_on_update=True,
-                max_entries=500
+                max_entries=500,
+                l1_ttl_seconds=10
             ),
             QueryType.OPERATIONAL: cls(
                 ttl_seconds=900,  # 15 minutes for operational
                 warm_on_startup=True,
                 refresh_before_expiry=False,
                 invalidate_on_update=True,
-                max_entries=1000
+                max_entries=1000,
+                l1_ttl_seconds=60
             ),
             QueryType.DOCUMENTATION: cls(
                 ttl_seconds=86400,  # 24 hours for documentation
                 warm_on_startup=True,
                 refresh_before_expiry=False,
                 invalidate_on_update=False,
-                max_entries=2000
+                max_entries=2000,
+                l1_ttl_seconds=300
             ),
             QueryType.REPORT: cls(
                 ttl_seconds=3600,  # 1 hour for reports
                 warm_on_startup=False,
                 refresh_before_expiry=False,
                 invalidate_on_update=True,
-                max_entries=100
+                max_entries=100,
+                l1_ttl_seconds=60
             ),
             QueryType.SEARCH: cls(
                 ttl_seconds=600,  # 10 minutes for general search
                 warm_on_startup=False,
                 refresh_before_expiry=False,
                 invalidate_on_update=False,
-                max_entries=5000
+                max_entries=5000,
+                l1_ttl_seconds=30
+            ),
+            QueryType.REFERENCE: cls(
+                ttl_seconds=3600,  # 1 hour, renewed while in use
+                warm_on_startup=False,
+                refresh_before_expiry=True,
+                invalidate_on_update=True,
+                max_entries=100,
+                l1_ttl_seconds=300
             )
         }
         return strategies.get(query_type, cls(ttl_seconds=600))
@@ -106,7 +149,13 @@ class RedisCache:
         redis_url: str = "redis://localhost:6379",
         db: int = 0,
         key_prefix: str = "itglue:",
-        max_connections: int = 50
+        max_connections: int = 50,
+        access_tracking: Optional[str] = None,
+        access_sample_rate: Optional[float] = None,
+        access_flush_interval: Optional[float] = None,
+        codec: Optional[ValueCodec] = None,
+        l1_max_entries: int = 0,
+        single_flight_lock: Optional[bool] = None
     ):
         """Initialize Redis cache.
 
@@ -115,12 +164,44 @@ class RedisCache:
             db: Redis database number
             key_prefix: Prefix for all cache keys
             max_connections: Maximum connection pool size
+            access_tracking: How cache hits are counted - "buffered" (in
+                process, flushed periodically), "sync" (on every hit) or "off"
+            access_sample_rate: Fraction of hits recorded in buffered mode
+            access_flush_interval: Seconds between buffered flushes
+            codec: Value codec; defaults to one configured from settings
+            l1_max_entries: Entries held in an in-process tier in front of
+                Redis; 0 disables it
+            single_flight_lock: Coalesce cache misses across processes with
+                a short-lived Redis lock
         """
         self.redis_url = redis_url
         self.db = db
         self.key_prefix = key_prefix
         self.max_connections = max_connections
 
+        self.access_tracking = access_tracking or settings.cache_access_tracking
+        if self.access_tracking not in ACCESS_TRACKING_MODES:
+            raise ValueError(f"Unknown access tracking mode: {self.access_tracking}")
+        sample_rate = (
+            access_sample_rate if access_sample_rate is not None
+            else settings.cache_access_sample_rate
+        )
+        self.access_sample_rate = min(1.0, max(sample_rate, 0.001))
+        self.access_flush_interval = (
+            access_flush_interval or settings.cache_access_flush_interval
+        )
+
+        self.codec = codec or ValueCodec()
+
+        # In-process L1 tier, kept coherent across processes over pub/sub
+        self.l1: Optional[CoherentLocalCache] = None
+        if l1_max_entries > 0:
+            self.l1 = CoherentLocalCache(
+                f"{key_prefix}invalidations:{db}",
+                l1_max_entries,
+                settings.cache_l1_max_value_bytes
+            )
+
         self.client: Optional[redis.Redis] = None
         self.connected = False
 
@@ -136,8 +217,23 @@ class RedisCache:
         # Invalidation subscriptions
         self.invalidation_patterns: dict[str, list[str]] = {}
 
-        # Background tasks
-        self.background_tasks = set()
+        # Refresh-ahead of popular entries, reloaded by per-namespace loaders
+        self.refresh_scheduler = RefreshScheduler()
+        self._loaders: dict[str, Callable[[str], Awaitable[Any]]] = {}
+
+        # Single-flight fetches: cache key -> fetch shared by concurrent misses
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.single_flight_lock = (
+            single_flight_lock if single_flight_lock is not None
+            else settings.cache_single_flight_lock
+        )
+        self.lock_lease_seconds = settings.cache_lock_lease_seconds
+        self.single_flight_stats = {'coalesced': 0, 'lock_waits': 0, 'stale_served': 0}
+
+        # Buffered access tracking: full key -> hits and last access since flush
+        self._pending_hits: dict[str, int] = {}
+        self._pending_last_access: dict[str, str] = {}
+        self._access_flush_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -146,7 +242,7 @@ class RedisCache:
                 self.redis_url,
                 db=self.db,
                 max_connections=self.max_connections,
-                decode_responses=True
+                decode_responses=False  # Values are binary encoded
             )
 
             # Test connection
@@ -154,6 +250,9 @@ class RedisCache:
             self.connected = True
             logger.info(f"Connected to Redis at {self.redis_url}")
 
+            if self.l1 is not None:
+                await self.l1.start(self.client)
+
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
@@ -161,9 +260,16 @@ class RedisCache:
     async def disconnect(self) -> None:
         """Disconnect from Redis."""
         if self.client:
-            # Cancel background tasks
-            for task in self.background_tasks:
-                task.cancel()
+            await self.refresh_scheduler.stop()
+
+            # Write out hits buffered since the last flush
+            if self._access_flush_task:
+                self._access_flush_task.cancel()
+                self._access_flush_task = None
+            await self.flush_access_stats()
+
+            if self.l1 is not None:
+                await self.l1.stop()
 
             await self.client.close()
             self.connected = False
@@ -175,6 +281,11 @@ class RedisCache:
             return f"{self.key_prefix}{namespace}:{key}"
         return f"{self.key_prefix}{key}"
 
+    @staticmethod
+    def _key_str(key: Any) -> str:
+        """Decode a key returned by Redis."""
+        return key.decode() if isinstance(key, bytes) else key
+
     def _generate_cache_key(
         self,
         query: str,
@@ -222,18 +333,23 @@ class RedisCache:
         full_key = self._make_key(key, namespace)
 
         try:
-            # Get value
-            value_str = await self.client.get(full_key)
+            # Get value, from the in-process tier if it holds it
+            data = self.l1.get(full_key) if self.l1 is not None else None
+            if data is None:
+                data = await self._get_from_redis(full_key)
 
-            if value_str is None:
+            if data is None:
                 self.stats['misses'] += 1
                 return None
 
             # Update access count and timestamp
-            await self._update_access_metadata(full_key)
+            if self.access_tracking == "sync":
+                await self._update_access_metadata(full_key)
+            elif self.access_tracking == "buffered":
+                self._record_access(full_key)
 
             # Deserialize value
-            value = json.loads(value_str)
+            value = self.codec.decode(data)
 
             self.stats['hits'] += 1
             logger.debug(f"Cache hit: {full_key}")
@@ -252,7 +368,8 @@ class RedisCache:
         query_type: QueryType = QueryType.SEARCH,
         namespace: Optional[str] = None,
         ttl_override: Optional[int] = None,
-        tags: Optional[list[str]] = None
+        tags: Optional[list[str]] = None,
+        keep_stale: bool = False
     ) -> bool:
         """Set a value in cache with intelligent TTL.
 
@@ -263,6 +380,8 @@ class RedisCache:
             namespace: Optional namespace
             ttl_override: Override default TTL (seconds)
             tags: Tags for invalidation grouping
+            keep_stale: Also keep a copy for ``cache_stale_ttl_seconds``
+                past expiry, for stale-while-revalidate reads
 
         Returns:
             True if successful
@@ -279,10 +398,19 @@ class RedisCache:
 
         try:
             # Serialize value
-            value_str = json.dumps(value)
+            data = self.codec.encode(value, query_type.value)
 
             # Set with TTL
-            await self.client.setex(full_key, ttl, value_str)
+            await self.client.setex(full_key, ttl, data)
+            if keep_stale:
+                await self.client.setex(
+                    f"{full_key}:stale", ttl + settings.cache_stale_ttl_seconds, data
+                )
+
+            if self.l1 is not None:
+                # Other processes may hold the previous value
+                await self._invalidate_l1(keys=[full_key])
+                self.l1.set(full_key, data, min(strategy.l1_ttl_seconds, ttl))
 
             # Store metadata
             metadata = {
@@ -290,7 +418,7 @@ class RedisCache:
                 'created_at': datetime.now().isoformat(),
                 'expires_at': (datetime.now() + timedelta(seconds=ttl)).isoformat(),
                 'tags': tags or [],
-                'checksum': hashlib.md5(value_str.encode()).hexdigest()
+                'checksum': hashlib.md5(data).hexdigest()
             }
 
             metadata_key = f"{full_key}:meta"
@@ -300,9 +428,17 @@ class RedisCache:
             if tags and strategy.invalidate_on_update:
                 await self._register_invalidation_tags(full_key, tags)
 
-            # Schedule refresh if needed
-            if strategy.refresh_before_expiry:
-                await self._schedule_refresh(full_key, ttl)
+            # Renew popular entries before expiry if the namespace can reload them
+            loader = self._loaders.get(namespace)
+            if strategy.refresh_before_expiry and loader is not None:
+                async def reload():
+                    fresh = await loader(key)
+                    if fresh is not None:
+                        await self.set(
+                            key, fresh, query_type, namespace, ttl_override, tags, keep_stale
+                        )
+
+                self._schedule_refresh(full_key, ttl, reload)
 
             self.stats['sets'] += 1
             logger.debug(f"Cache set: {full_key} (TTL: {ttl}s)")
@@ -335,7 +471,10 @@ class RedisCache:
 
         try:
             # Delete value and metadata
-            result = await self.client.delete(full_key, f"{full_key}:meta")
+            result = await self.client.delete(
+                full_key, f"{full_key}:meta", f"{full_key}:stale"
+            )
+            await self._invalidate_l1(keys=[full_key])
 
             if result > 0:
                 self.stats['deletes'] += 1
@@ -371,10 +510,13 @@ class RedisCache:
                 keys = await self.client.smembers(tag_key)
 
                 if keys:
+                    keys = [self._key_str(key) for key in keys]
+                    await self._invalidate_l1(keys=keys)
+
                     # Delete all matching keys
                     pipeline = self.client.pipeline()
                     for key in keys:
-                        pipeline.delete(key, f"{key}:meta")
+                        pipeline.delete(key, f"{key}:meta", f"{key}:stale")
 
                     results = await pipeline.execute()
                     invalidated += sum(1 for r in results if r > 0)
@@ -406,6 +548,8 @@ class RedisCache:
         try:
             # Find matching keys
             full_pattern = f"{self.key_prefix}{pattern}"
+            await self._invalidate_l1(pattern=full_pattern)
+
             cursor = 0
             keys_to_delete = []
 
@@ -424,8 +568,8 @@ class RedisCache:
             invalidated = 0
             if keys_to_delete:
                 pipeline = self.client.pipeline()
-                for key in keys_to_delete:
-                    pipeline.delete(key, f"{key}:meta")
+                for key in map(self._key_str, keys_to_delete):
+                    pipeline.delete(key, f"{key}:meta", f"{key}:stale")
 
                 results = await pipeline.execute()
                 invalidated = sum(1 for r in results if r > 0)
@@ -499,10 +643,16 @@ class RedisCache:
         params: Optional[dict[str, Any]] = None,
         context: Optional[dict[str, Any]] = None,
         query_type: QueryType = QueryType.SEARCH,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        stale_while_revalidate: bool = False
     ) -> Optional[Any]:
         """Get from cache or fetch if not found.
 
+        Concurrent misses for the same key share one fetch, and with
+        ``single_flight_lock`` so do misses in other processes. With
+        ``stale_while_revalidate`` an expired value is returned while one
+        caller refreshes it in the background.
+
         Args:
             query: Query string
             fetch_func: Async function to fetch data if not cached
@@ -510,6 +660,7 @@ class RedisCache:
             context: Query context (org, user, etc.)
             query_type: Type of query for caching strategy
             force_refresh: Force fetching new data
+            stale_while_revalidate: Serve the previous value while refreshing
 
         Returns:
             Cached or fetched data
@@ -523,49 +674,382 @@ class RedisCache:
             if cached is not None:
                 return cached
 
-        # Fetch data
+            if stale_while_revalidate:
+                stale = await self._get_stale(cache_key)
+                if stale is not None:
+                    self._fetch_once(
+                        cache_key, query, fetch_func, params, context, query_type, True
+                    )
+                    self.single_flight_stats['stale_served'] += 1
+                    return stale
+
+        # Fetch data, joining a fetch already in flight for this key
+        try:
+            return await asyncio.shield(self._fetch_once(
+                cache_key,
+                query,
+                fetch_func,
+                params,
+                context,
+                query_type,
+                stale_while_revalidate
+            ))
+
+        except Exception as e:
+            logger.error(f"Error fetching data for query '{query}': {e}")
+
+            # Try stale cache on error
+            if not force_refresh:
+                stale = await self.get(cache_key)
+                if stale is None:
+                    stale = await self._get_stale(cache_key)
+                if stale is not None:
+                    logger.warning("Returning stale cache due to fetch error")
+                    return stale
+
+            return None
+
+    async def get_or_load(
+        self,
+        key: str,
+        namespace: str,
+        loader: Optional[Callable[[str], Awaitable[Any]]] = None,
+        query_type: QueryType = QueryType.REFERENCE
+    ) -> Optional[Any]:
+        """Get an entry of a namespace, loading it on a miss.
+
+        Entries are loaded with the loader registered for the namespace, so
+        with a query type that has ``refresh_before_expiry`` popular ones are
+        reloaded before they expire. Concurrent misses share one load.
+
+        Args:
+            key: Cache key, passed to the loader
+            namespace: Namespace the loader is registered for
+            loader: Loader to register if the namespace has none
+            query_type: Type of query for caching strategy
+
+        Returns:
+            Cached or loaded value, or None if the loader returned None
+
+        Raises:
+            KeyError: If no loader is registered or given
+        """
+        cached = await self.get(key, namespace)
+        if cached is not None:
+            return cached
+
+        if namespace not in self._loaders and loader is not None:
+            self.register_loader(namespace, loader)
+        load = self._loaders[namespace]
+
+        full_key = self._make_key(key, namespace)
+        task = self._inflight.get(full_key)
+        if task is not None:
+            self.single_flight_stats['coalesced'] += 1
+            return await asyncio.shield(task)
+
+        async def load_and_store():
+            value = await load(key)
+            if value is not None:
+                await self.set(key, value, query_type, namespace)
+            return value
+
+        task = asyncio.create_task(load_and_store())
+        self._inflight[full_key] = task
+
+        def finished(done: asyncio.Task):
+            if self._inflight.get(full_key) is done:
+                del self._inflight[full_key]
+
+        task.add_done_callback(finished)
+        return await asyncio.shield(task)
+
+    def _fetch_once(
+        self,
+        cache_key: str,
+        query: str,
+        fetch_func: Callable,
+        params: Optional[dict[str, Any]],
+        context: Optional[dict[str, Any]],
+        query_type: QueryType,
+        keep_stale: bool
+    ) -> asyncio.Task:
+        """Get the in-flight fetch for a key, starting one if there is none."""
+        task = self._inflight.get(cache_key)
+        if task is not None:
+            self.single_flight_stats['coalesced'] += 1
+            return task
+
+        task = asyncio.create_task(self._fetch_and_store(
+            cache_key, query, fetch_func, params, context, query_type, keep_stale
+        ))
+        self._inflight[cache_key] = task
+
+        def finished(done: asyncio.Task):
+            if self._inflight.get(cache_key) is done:
+                del self._inflight[cache_key]
+            # Background revalidations have no caller to see the error
+            if not done.cancelled() and done.exception():
+                logger.debug(f"Fetch for {cache_key} failed: {done.exception()}")
+
+        task.add_done_callback(finished)
+        return task
+
+    async def _fetch_and_store(
+        self,
+        cache_key: str,
+        query: str,
+        fetch_func: Callable,
+        params: Optional[dict[str, Any]],
+        context: Optional[dict[str, Any]],
+        query_type: QueryType,
+        keep_stale: bool
+    ) -> Optional[Any]:
+        """Fetch data and cache it, coordinating with other processes if enabled."""
+        lock_key = self._make_key(f"lock:{cache_key}")
+        token = None
+
+        if self.single_flight_lock and self.connected:
+            token = uuid.uuid4().hex
+            acquired = await self.client.set(
+                lock_key, token, nx=True, px=int(self.lock_lease_seconds * 1000)
+            )
+            if not acquired:
+                token = None
+                self.single_flight_stats['lock_waits'] += 1
+
+                # Another process is fetching; wait for it to store the value
+                value = await self._wait_for_value(cache_key)
+                if value is not None:
+                    return value
+                logger.debug(f"Lock holder for {cache_key} did not finish, fetching")
+
         try:
             data = await fetch_func(query, params)
 
             if data is not None:
                 # Cache the result
-                await self.set(
+                stored = await self.set(
                     cache_key,
                     data,
                     query_type=query_type,
-                    tags=self._extract_tags(query, params, context)
+                    tags=self._extract_tags(query, params, context),
+                    keep_stale=keep_stale
                 )
 
+                # Refetch popular results before they expire
+                strategy = CacheStrategy.for_query_type(query_type)
+                if stored and strategy.refresh_before_expiry:
+                    self._schedule_refresh(
+                        self._make_key(cache_key),
+                        strategy.ttl_seconds,
+                        lambda: self._fetch_once(
+                            cache_key, query, fetch_func, params, context, query_type, keep_stale
+                        )
+                    )
+
             return data
 
+        finally:
+            if token:
+                await self._release_lock(lock_key, token)
+
+    async def _wait_for_value(self, cache_key: str) -> Optional[Any]:
+        """Poll for a value another process is fetching, up to one lock lease."""
+        full_key = self._make_key(cache_key)
+        deadline = asyncio.get_running_loop().time() + self.lock_lease_seconds
+
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            try:
+                data = await self.client.get(full_key)
+                if data is not None:
+                    return self.codec.decode(data)
+            except Exception as e:
+                logger.debug(f"Error polling {full_key}: {e}")
+                return None
+
+        return None
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        """Release a fetch lock if this process still holds it."""
+        try:
+            await self.client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
         except Exception as e:
-            logger.error(f"Error fetching data for query '{query}': {e}")
+            logger.debug(f"Error releasing {lock_key}: {e}")
 
-            # Try stale cache on error
-            if not force_refresh:
-                stale = await self.get(cache_key)
-                if stale is not None:
-                    logger.warning("Returning stale cache due to fetch error")
-                    return stale
+    async def _get_stale(self, cache_key: str) -> Optional[Any]:
+        """Get the copy of an entry kept past its expiry, if any."""
+        if not self.connected:
+            return None
 
+        try:
+            data = await self.client.get(f"{self._make_key(cache_key)}:stale")
+            return self.codec.decode(data) if data is not None else None
+        except Exception as e:
+            logger.debug(f"Error reading stale copy of {cache_key}: {e}")
             return None
 
+    async def _get_from_redis(self, full_key: str) -> Optional[bytes]:
+        """Read an encoded value from Redis, holding it in L1 when eligible.
+
+        With an L1 tier the value and its metadata are read in one MGET, so
+        the entry can be held for its query type's L1 TTL.
+        """
+        if self.l1 is None:
+            return await self.client.get(full_key)
+
+        generation = self.l1.generation
+        data, meta = await self.client.mget(full_key, f"{full_key}:meta")
+
+        if data is not None and meta is not None:
+            try:
+                metadata = json.loads(meta)
+                strategy = CacheStrategy.for_query_type(QueryType(metadata['query_type']))
+                remaining = (
+                    datetime.fromisoformat(metadata['expires_at']) - datetime.now()
+                ).total_seconds()
+                self.l1.hold(
+                    full_key, data, min(strategy.l1_ttl_seconds, remaining), generation
+                )
+            except (KeyError, ValueError) as e:
+                logger.debug(f"Not holding {full_key} in L1, unreadable metadata: {e}")
+
+        return data
+
+    async def _invalidate_l1(self, **invalidation: Any) -> None:
+        """Drop entries from L1 here and in every other process."""
+        if self.l1 is not None:
+            await self.l1.invalidate(**invalidation)
+
     async def _update_access_metadata(self, key: str) -> None:
         """Update access count and timestamp for a cache entry."""
         try:
-            # Increment access count
-            access_key = f"{key}:access"
-            await self.client.incr(access_key)
-
-            # Update last accessed time
-            await self.client.set(
-                f"{key}:last_accessed",
-                datetime.now().isoformat()
-            )
+            pipeline = self.client.pipeline(transaction=False)
+            self._queue_access_update(pipeline, key, 1, datetime.now().isoformat())
+            await pipeline.execute()
 
         except Exception as e:
             logger.debug(f"Error updating access metadata: {e}")
 
+    def _queue_access_update(
+        self,
+        pipeline,
+        key: str,
+        hits: int,
+        last_accessed: str
+    ) -> None:
+        """Queue the commands that record hits on a cache entry."""
+        stats_key = f"{key}:access_stats"
+        pipeline.hincrby(stats_key, "count", hits)
+        pipeline.hset(stats_key, "last_accessed", last_accessed)
+        pipeline.expire(stats_key, ACCESS_STATS_TTL)
+
+    def _record_access(self, key: str) -> None:
+        """Buffer a cache hit in process for the next flush.
+
+        Only ``access_sample_rate`` of hits are recorded, each counting for
+        the hits it stands in for, so popular keys keep comparable counts.
+        """
+        if self.access_sample_rate < 1.0 and random.random() >= self.access_sample_rate:
+            return
+
+        weight = max(1, round(1 / self.access_sample_rate))
+        self._pending_hits[key] = self._pending_hits.get(key, 0) + weight
+        self._pending_last_access[key] = datetime.now().isoformat()
+
+        if self._access_flush_task is None or self._access_flush_task.done():
+            self._access_flush_task = asyncio.create_task(self._access_flush_loop())
+
+    async def _access_flush_loop(self) -> None:
+        """Flush buffered hits every interval until the buffer stays empty."""
+        while self._pending_hits:
+            await asyncio.sleep(self.access_flush_interval)
+            await self.flush_access_stats()
+
+    async def flush_access_stats(self) -> int:
+        """Write buffered access counters to Redis in one pipeline.
+
+        Returns:
+            Number of cache entries whose counters were written
+        """
+        if not self._pending_hits or not self.connected:
+            return 0
+
+        pending, self._pending_hits = self._pending_hits, {}
+        last_accessed, self._pending_last_access = self._pending_last_access, {}
+
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            for key, hits in pending.items():
+                self._queue_access_update(pipeline, key, hits, last_accessed[key])
+            await pipeline.execute()
+
+            logger.debug(f"Flushed access counters for {len(pending)} cache entries")
+            return len(pending)
+
+        except Exception as e:
+            # Counters are best effort; drop them rather than grow the buffer
+            logger.debug(f"Error flushing access metadata: {e}")
+            return 0
+
+    async def get_access_stats(
+        self,
+        key: str,
+        namespace: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Get how often and how recently a cache entry has been read.
+
+        Includes hits still buffered in this process.
+
+        Args:
+            key: Cache key
+            namespace: Optional namespace
+
+        Returns:
+            Dictionary with access_count and last_accessed (ISO timestamp or None)
+        """
+        return await self._read_access_stats(self._make_key(key, namespace))
+
+    async def _read_access_stats(self, full_key: str) -> dict[str, Any]:
+        """Get access stats of a cache entry by its full key."""
+        count = self._pending_hits.get(full_key, 0)
+        last_accessed = self._pending_last_access.get(full_key)
+
+        if self.connected:
+            try:
+                stored = {
+                    self._key_str(field): self._key_str(value)
+                    for field, value in (
+                        await self.client.hgetall(f"{full_key}:access_stats")
+                    ).items()
+                }
+                count += int(stored.get("count", 0))
+                last_accessed = last_accessed or stored.get("last_accessed")
+            except Exception as e:
+                logger.debug(f"Error reading access metadata for {full_key}: {e}")
+
+        return {'access_count': count, 'last_accessed': last_accessed}
+
+    async def should_refresh(
+        self,
+        key: str,
+        namespace: Optional[str] = None,
+        min_access_count: int = REFRESH_MIN_ACCESS_COUNT
+    ) -> bool:
+        """Whether a cache entry is read often enough to refresh before expiry.
+
+        Args:
+            key: Cache key
+            namespace: Optional namespace
+            min_access_count: Reads needed for the entry to count as popular
+
+        Returns:
+            True if the entry is popular
+        """
+        stats = await self.get_access_stats(key, namespace)
+        return stats['access_count'] >= min_access_count
+
     async def _register_invalidation_tags(
         self,
         key: str,
@@ -584,24 +1068,43 @@ class RedisCache:
         except Exception as e:
             logger.error(f"Error registering invalidation tags: {e}")
 
-    async def _schedule_refresh(self, key: str, ttl: int) -> None:
-        """Schedule cache refresh before expiry."""
-        # Refresh at 80% of TTL
-        refresh_delay = int(ttl * 0.8)
+    def register_loader(
+        self,
+        namespace: str,
+        loader: Callable[[str], Awaitable[Any]]
+    ) -> None:
+        """Register how entries in a namespace are reloaded.
 
-        async def refresh_task():
-            await asyncio.sleep(refresh_delay)
+        Popular entries of query types with ``refresh_before_expiry`` are
+        then renewed shortly before they expire, so readers never miss.
 
-            # Check if key still exists
-            if await self.client.exists(key):
-                logger.debug(f"Triggering refresh for {key}")
-                # Emit refresh event (to be handled by application)
-                # This is a placeholder - actual implementation would
-                # depend on the application's refresh mechanism
+        Args:
+            namespace: Namespace passed to ``set``
+            loader: Async function taking a cache key and returning its
+                fresh value, or None to let the entry expire
+        """
+        self._loaders[namespace] = loader
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        ttl: int,
+        refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Schedule a refresh of an entry shortly before it expires."""
+        written_at = datetime.now().isoformat()
+
+        async def worth_refreshing() -> bool:
+            # Only renew entries still cached and read since they were written
+            if not self.connected or not await self.client.exists(key):
+                return False
+            stats = await self._read_access_stats(key)
+            return (
+                stats['access_count'] >= REFRESH_MIN_ACCESS_COUNT
+                and (stats['last_accessed'] or '') >= written_at
+            )
 
-        task = asyncio.create_task(refresh_task())
-        self.background_tasks.add(task)
-        task.add_done_callback(self.background_tasks.discard)
+        self.refresh_scheduler.schedule(key, ttl, refresh, worth_refreshing)
 
     def _extract_tags(
         self,
@@ -637,6 +1140,12 @@ class RedisCache:
     async def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         stats = self.stats.copy()
+        stats['pending_access_keys'] = len(self._pending_hits)
+        stats['encoding'] = self.codec.get_metrics()
+        if self.l1 is not None:
+            stats['l1'] = self.l1.get_stats()
+        stats['single_flight'] = {**self.single_flight_stats, 'in_flight': len(self._inflight)}
+        stats['refresh'] = self.refresh_scheduler.get_stats()
 
         if self.connected:
             try:
@@ -674,6 +1183,8 @@ class RedisCache:
             return 0
 
         try:
+            await self._invalidate_l1(everything=True)
+
             # Find all our keys
             pattern = f"{self.key_prefix}*"
             cursor = 0
@@ -706,21 +1217,46 @@ class RedisCache:
 class CacheManager:
     """High-level cache manager with multiple cache instances."""
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        loaders: Optional[dict[str, Callable[[str], Awaitable[Any]]]] = None
+    ):
         """Initialize cache manager.
 
         Args:
             redis_url: Redis connection URL
+            loaders: Reloaders by namespace for refreshing popular entries
+                ahead of expiry (see ``RedisCache.register_loader``)
         """
         self.redis_url = redis_url
 
-        # Create specialized cache instances
-        self.query_cache = RedisCache(redis_url, db=0, key_prefix="query:")
-        self.result_cache = RedisCache(redis_url, db=1, key_prefix="result:")
-        self.session_cache = RedisCache(redis_url, db=2, key_prefix="session:")
+        # Create specialized cache instances, each with an in-process L1 tier
+        l1_entries = settings.cache_l1_max_entries
+        self.query_cache = RedisCache(
+            redis_url, db=0, key_prefix="query:", l1_max_entries=l1_entries
+        )
+        self.result_cache = RedisCache(
+            redis_url, db=1, key_prefix="result:", l1_max_entries=l1_entries
+        )
+        self.session_cache = RedisCache(
+            redis_url, db=2, key_prefix="session:", l1_max_entries=l1_entries
+        )
 
         self.caches = [self.query_cache, self.result_cache, self.session_cache]
 
+        for namespace, loader in (loaders or {}).items():
+            self.register_loader(namespace, loader)
+
+    def register_loader(
+        self,
+        namespace: str,
+        loader: Callable[[str], Awaitable[Any]]
+    ) -> None:
+        """Register how entries in a namespace are reloaded, in every cache."""
+        for cache in self.caches:
+            cache.register_loader(namespace, loader)
+
     async def connect(self) -> None:
         """Connect all cache instances."""
         for cache in self.caches:
@@ -352,6 +352,9 @@ class RedisFuzzyCache:
         from src.query.fuzzy_matcher import FuzzyMatcher
         matcher = FuzzyMatcher()
 
+        # Index the organizations once for every term
+        index = matcher.build_index(organizations)
+
         # Generate candidates hash
         org_ids = sorted([org['id'] for org in organizations])
         candidates_hash = hashlib.md5(str(org_ids).encode()).hexdigest()
@@ -364,7 +367,7 @@ class RedisFuzzyCache:
 
             if not await self.redis.exists(key):
                 # Generate and cache results
-                results = matcher.match_organization(term, organizations, 0.7)
+                results = matcher.match_indexed(term, index, 0.7)
 
                 # Convert to cacheable format
                 cache_results = [
@@ -0,0 +1,226 @@
+"""Refresh-ahead scheduling for hot cache entries."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from src.config.settings import settings
+from src.services.itglue.rate_limiter import TokenBucketRateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Fraction of an entry's TTL after which it is refreshed
+REFRESH_AT_TTL_FRACTION = 0.8
+
+# Window the refresh budget is counted over, in seconds
+BUDGET_WINDOW = 60.0
+
+# Share of the IT Glue API burst left to user queries; refreshes only start
+# while the shared rate limiter holds more tokens than this
+RATE_LIMIT_RESERVE = 0.5
+
+
+@dataclass
+class RefreshJob:
+    """A pending refresh of one cache entry."""
+
+    key: str
+    due: float
+    expires_at: float
+    refresh: Callable[[], Awaitable[Any]]
+    worth_refreshing: Optional[Callable[[], Awaitable[bool]]] = None
+    seq: int = field(default=0, compare=False)
+
+
+class RefreshScheduler:
+    """Renews cache entries shortly before they expire.
+
+    One background task works through a heap of jobs ordered by due time,
+    so thousands of hot keys cost one sleeping task rather than one each.
+    Each key has at most one pending job; rescheduling a key replaces it.
+    Refreshes run at most ``max_concurrency`` at a time and at most
+    ``max_per_minute`` per minute. They also draw on the shared IT Glue
+    rate limiter, starting only while it holds tokens beyond the reserve
+    kept for user queries, so renewing entries never eats the API budget
+    that user queries need. A refresh that cannot run before its entry
+    expires is dropped.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_per_minute: Optional[int] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None
+    ):
+        """Initialize refresh scheduler.
+
+        Args:
+            max_concurrency: Refreshes run at the same time
+            max_per_minute: Refreshes started per minute
+            rate_limiter: IT Glue API limiter (defaults to the shared one)
+        """
+        self.max_concurrency = max_concurrency or settings.cache_refresh_concurrency
+        self.max_per_minute = max_per_minute or settings.cache_refresh_per_minute
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+
+        self._heap: list[tuple[float, int, RefreshJob]] = []
+        self._jobs: dict[str, RefreshJob] = {}
+        self._seq = itertools.count()
+        self._started: deque[float] = deque()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._running: set[asyncio.Task] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            'scheduled': 0,
+            'refreshed': 0,
+            'failed': 0,
+            'skipped_unpopular': 0,
+            'skipped_budget': 0
+        }
+
+    def schedule(
+        self,
+        key: str,
+        ttl: float,
+        refresh: Callable[[], Awaitable[Any]],
+        worth_refreshing: Optional[Callable[[], Awaitable[bool]]] = None
+    ) -> None:
+        """Schedule a refresh of an entry before it expires.
+
+        Args:
+            key: Cache key, used to keep one job per entry
+            ttl: Seconds until the entry expires
+            refresh: Coroutine function that reloads and stores the entry
+            worth_refreshing: Optional coroutine function checked when the
+                job is due; the refresh is skipped if it returns False
+        """
+        now = time.monotonic()
+        job = RefreshJob(
+            key=key,
+            due=now + ttl * REFRESH_AT_TTL_FRACTION,
+            expires_at=now + ttl,
+            refresh=refresh,
+            worth_refreshing=worth_refreshing
+        )
+        self._push(job)
+        self.stats['scheduled'] += 1
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        elif self._heap[0][2] is job:
+            # The new job is due before the one the loop is sleeping on
+            self._wakeup.set()
+
+    def cancel(self, key: str) -> bool:
+        """Drop the pending refresh of an entry."""
+        return self._jobs.pop(key, None) is not None
+
+    def _push(self, job: RefreshJob) -> None:
+        job.seq = next(self._seq)
+        self._jobs[job.key] = job
+        heapq.heappush(self._heap, (job.due, job.seq, job))
+
+    async def _run(self) -> None:
+        """Start jobs as they fall due."""
+        while True:
+            # Skip jobs that were cancelled or replaced
+            while self._heap and self._jobs.get(self._heap[0][2].key) is not self._heap[0][2]:
+                heapq.heappop(self._heap)
+
+            if not self._heap:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, job = heapq.heappop(self._heap)
+            now = time.monotonic()
+
+            # Stay within the refresh budget, deferring the job if it can wait
+            while self._started and now - self._started[0] >= BUDGET_WINDOW:
+                self._started.popleft()
+            if len(self._started) >= self.max_per_minute:
+                self._defer(job, self._started[0] + BUDGET_WINDOW)
+                continue
+
+            # Leave the shared API quota's reserve to user queries
+            wait = await self.rate_limiter.time_until_spare(
+                self.rate_limiter.capacity * RATE_LIMIT_RESERVE
+            )
+            if self._jobs.get(job.key) is not job:
+                continue  # Cancelled or replaced while checking
+            if wait > 0:
+                self._defer(job, time.monotonic() + wait)
+                continue
+
+            await self._semaphore.acquire()
+            if self._jobs.get(job.key) is not job:
+                # Cancelled or replaced while waiting for a slot
+                self._semaphore.release()
+                continue
+
+            del self._jobs[job.key]
+            self._started.append(now)
+            task = asyncio.create_task(self._refresh(job))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    def _defer(self, job: RefreshJob, retry_at: float) -> None:
+        """Retry a job once budget frees up, or drop it if its entry expires first."""
+        if retry_at < job.expires_at:
+            job.due = retry_at
+            self._push(job)
+        else:
+            del self._jobs[job.key]
+            self.stats['skipped_budget'] += 1
+            logger.debug(f"Refresh budget exhausted, letting {job.key} expire")
+
+    async def _refresh(self, job: RefreshJob) -> None:
+        """Run one refresh."""
+        try:
+            if job.worth_refreshing and not await job.worth_refreshing():
+                self.stats['skipped_unpopular'] += 1
+                return
+
+            await job.refresh()
+            self.stats['refreshed'] += 1
+            logger.debug(f"Refreshed {job.key} ahead of expiry")
+
+        except Exception as e:
+            self.stats['failed'] += 1
+            logger.warning(f"Failed to refresh {job.key}: {e}")
+
+        finally:
+            self._semaphore.release()
+
+    async def stop(self) -> None:
+        """Stop scheduling and cancel refreshes in progress."""
+        tasks = [t for t in (self._task, *self._running) if t and not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._task = None
+        self._heap.clear()
+        self._jobs.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics."""
+        return {**self.stats, 'pending': len(self._jobs), 'running': len(self._running)}
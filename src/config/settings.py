@@ -30,6 +30,18 @@ class Settings(BaseSettings):
         description="IT Glue API base URL"
     )
     itglue_rate_limit: int = Field(100, description="API rate limit per minute")
+    itglue_rate_limit_burst: int = Field(
+        10,
+        description="Max API requests sent back to back before pacing applies"
+    )
+    itglue_rate_limit_distributed: bool = Field(
+        False,
+        description="Share the API rate limit across processes via Redis"
+    )
+    itglue_page_concurrency: int = Field(
+        4,
+        description="Max pages fetched concurrently when paginating"
+    )
 
     # Database URLs
     database_url: str = Field(..., description="PostgreSQL connection URL")
@@ -38,6 +50,8 @@ class Settings(BaseSettings):
     neo4j_password: str = Field(..., description="Neo4j password")
     qdrant_url: str = Field("http://localhost:6333", description="Qdrant URL")
     qdrant_api_key: Optional[str] = Field(None, description="Qdrant API key")
+    qdrant_prefer_grpc: bool = Field(False, description="Use gRPC transport for Qdrant")
+    qdrant_grpc_port: int = Field(6334, description="Qdrant gRPC port")
     redis_url: str = Field("redis://localhost:6379", description="Redis URL")
 
     # Celery
@@ -55,6 +69,32 @@ class Settings(BaseSettings):
         "http://localhost:11434",
         description="Ollama API URL for embeddings"
     )
+    ollama_embed_batch_size: int = Field(
+        64,
+        description="Texts sent per Ollama batch embed request"
+    )
+    ollama_max_concurrency: int = Field(
+        4,
+        description="Maximum in-flight Ollama embedding requests"
+    )
+
+    # Embedding cache
+    embedding_cache_enabled: bool = Field(
+        True,
+        description="Reuse embeddings of previously embedded text"
+    )
+    embedding_cache_size: int = Field(
+        10000,
+        description="Embeddings kept in process memory"
+    )
+    embedding_cache_backend: str = Field(
+        "memory",
+        description="Second embedding cache tier: memory (none), redis or disk"
+    )
+    embedding_cache_ttl: Optional[int] = Field(
+        604800,
+        description="Expiry in seconds for Redis embedding cache entries"
+    )
 
     # Security
     jwt_secret: str = Field(..., description="JWT secret key")
@@ -87,6 +127,94 @@ class Settings(BaseSettings):
     max_connections: int = Field(100, description="Max database connections")
     batch_size: int = Field(100, description="Batch processing size")
     sync_interval_minutes: int = Field(15, description="Sync interval")
+    sync_max_concurrency: int = Field(
+        8,
+        description="Max organization x entity-type sync jobs run concurrently"
+    )
+    search_result_cap: int = Field(
+        50,
+        description="Search results hydrated and returned per page"
+    )
+    search_candidate_limit: int = Field(
+        200,
+        description="Search candidates fetched before paging"
+    )
+    org_directory_refresh_seconds: int = Field(
+        300,
+        description="Seconds before the shared organization directory is refreshed"
+    )
+    query_log_queue_size: int = Field(
+        10000,
+        description="Query audit records buffered before new ones are dropped"
+    )
+    query_log_batch_size: int = Field(
+        100,
+        description="Query audit records written per transaction"
+    )
+    query_log_flush_interval: float = Field(
+        1.0,
+        description="Max seconds a query audit record waits before being written"
+    )
+    query_log_full_response: bool = Field(
+        True,
+        description="Store full responses in the query log instead of summaries"
+    )
+    cache_access_tracking: str = Field(
+        "buffered",
+        description="Cache hit tracking: buffered (periodic pipelined flush), sync or off"
+    )
+    cache_access_sample_rate: float = Field(
+        1.0,
+        description="Fraction of cache hits recorded by buffered access tracking"
+    )
+    cache_access_flush_interval: float = Field(
+        5.0,
+        description="Seconds between flushes of buffered cache access counters"
+    )
+    cache_serializer: str = Field(
+        "auto",
+        description="Cache value serializer: auto, orjson, msgpack or json"
+    )
+    cache_compression: str = Field(
+        "auto",
+        description="Cache value compression: auto, zstd, lz4, zlib or none"
+    )
+    cache_compression_threshold: int = Field(
+        1024,
+        description="Serialized cache values larger than this many bytes are compressed"
+    )
+    cache_l1_max_entries: int = Field(
+        1000,
+        description="Entries held in each in-process L1 cache in front of Redis (0 disables)"
+    )
+    cache_l1_max_value_bytes: int = Field(
+        65536,
+        description="Largest encoded value held in the in-process L1 cache"
+    )
+    cache_l1_ttl_seconds: int = Field(
+        30,
+        description="Seconds query responses stay in the legacy cache manager's L1 tier"
+    )
+    cache_single_flight_lock: bool = Field(
+        False,
+        description="Coalesce cache misses across processes with a Redis lock"
+    )
+    cache_lock_lease_seconds: float = Field(
+        10.0,
+        description="Lease of the Redis lock held while one process fetches a missed key"
+    )
+    cache_stale_ttl_seconds: int = Field(
+        300,
+        description="Seconds past expiry a value may be served while it is refreshed"
+    )
+    cache_refresh_concurrency: int = Field(
+        4,
+        description="Max popular cache entries refreshed ahead of expiry at once"
+    )
+    cache_refresh_per_minute: int = Field(
+        60,
+        description="Max refresh-ahead reloads started per minute, to spare the API budget"
+    )
 
     # Feature Flags
     enable_cross_company_search: bool = Field(
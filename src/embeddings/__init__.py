@@ -1,10 +1,13 @@
 """Embedding generation and management."""
 
+from .cache import EmbeddingCache, get_embedding_cache
 from .generator import ChunkProcessor, EmbeddingGenerator
 from .manager import EmbeddingManager
 
 __all__ = [
     'EmbeddingGenerator',
     'ChunkProcessor',
-    'EmbeddingManager'
+    'EmbeddingManager',
+    'EmbeddingCache',
+    'get_embedding_cache'
 ]
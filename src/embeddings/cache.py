@@ -0,0 +1,252 @@
+"""Content-addressed cache for embedding vectors."""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import redis.asyncio as redis
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_cache_key(model_name: str, dimension: int, text: str) -> str:
+    """Build the cache key for a text embedded by a given model.
+
+    Args:
+        model_name: Embedding model name
+        dimension: Embedding dimension
+        text: Embedded text
+
+    Returns:
+        Key of the form ``<model>:<dimension>:<sha256 of text>``
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model_name}:{dimension}:{digest}"
+
+
+def encode_vector(vector: Sequence[float]) -> bytes:
+    """Encode a vector as packed little-endian float32 bytes."""
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    """Decode packed little-endian float32 bytes into a vector."""
+    return np.frombuffer(data, dtype="<f4").astype(np.float32)
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache.
+
+    Vectors are kept as float32 arrays in an in-process LRU and, optionally,
+    in Redis or on disk as packed float32 bytes (4 bytes per dimension,
+    about a fifth of a JSON list). Entries are keyed by model, dimension and a hash of the
+    text, so identical text is only ever embedded once per model.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        backend: str = "memory",
+        redis_url: Optional[str] = None,
+        directory: Optional[Path] = None,
+        ttl: Optional[int] = None,
+        key_prefix: str = "embedding"
+    ):
+        """Initialize embedding cache.
+
+        Args:
+            max_entries: Maximum vectors kept in process memory
+            backend: Second tier - "memory" (none), "redis" or "disk"
+            redis_url: Redis connection URL for the redis backend
+            directory: Directory for the disk backend
+            ttl: Expiry in seconds for Redis entries
+            key_prefix: Redis key prefix
+        """
+        if backend not in ("memory", "redis", "disk"):
+            raise ValueError(f"Unknown embedding cache backend: {backend}")
+
+        self.max_entries = max(1, max_entries)
+        self.backend = backend
+        self.redis_url = redis_url or settings.redis_url
+        self.directory = directory or settings.project_root / "data" / "embedding_cache"
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._redis: Optional[redis.Redis] = None
+
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(
+        self,
+        model_name: str,
+        dimension: int,
+        texts: list[str]
+    ) -> list[Optional[np.ndarray]]:
+        """Look up embeddings for texts.
+
+        Args:
+            model_name: Embedding model name
+            dimension: Embedding dimension
+            texts: Texts to look up
+
+        Returns:
+            One vector per text, or None where the text is not cached
+        """
+        keys = [embedding_cache_key(model_name, dimension, text) for text in texts]
+        results: list[Optional[np.ndarray]] = [self._get_memory(key) for key in keys]
+
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if missing and self.backend != "memory":
+            try:
+                found = await self._get_remote([keys[i] for i in missing])
+            except (redis.RedisError, OSError) as e:
+                logger.warning(f"Embedding cache {self.backend} tier unavailable: {e}")
+                found = [None] * len(missing)
+
+            for i, data in zip(missing, found):
+                if data is not None and len(data) == dimension * 4:
+                    results[i] = decode_vector(data)
+                    self._set_memory(keys[i], results[i])
+
+        hits = sum(1 for vector in results if vector is not None)
+        self.hits += hits
+        self.misses += len(results) - hits
+        return results
+
+    async def set_many(
+        self,
+        model_name: str,
+        dimension: int,
+        texts: list[str],
+        vectors: Iterable[Sequence[float]]
+    ):
+        """Store embeddings for texts.
+
+        Args:
+            model_name: Embedding model name
+            dimension: Embedding dimension
+            texts: Embedded texts
+            vectors: Vectors (or rows of a 2-D array) in the same order as texts
+        """
+        # Copy so cached rows do not keep a caller's whole batch array alive
+        items = {
+            embedding_cache_key(model_name, dimension, text): np.array(vector, dtype=np.float32)
+            for text, vector in zip(texts, vectors)
+            if vector is not None and len(vector) == dimension
+        }
+        for key, vector in items.items():
+            self._set_memory(key, vector)
+
+        if items and self.backend != "memory":
+            try:
+                await self._set_remote({key: encode_vector(v) for key, v in items.items()})
+            except (redis.RedisError, OSError) as e:
+                logger.warning(f"Failed to write embedding cache {self.backend} tier: {e}")
+
+    def _get_memory(self, key: str) -> Optional[np.ndarray]:
+        """Get a vector from the LRU tier."""
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._memory.move_to_end(key)
+        return vector
+
+    def _set_memory(self, key: str, vector: np.ndarray):
+        """Put a vector in the LRU tier, evicting the oldest entries."""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def _get_remote(self, keys: list[str]) -> list[Optional[bytes]]:
+        """Get packed vectors from the second tier."""
+        if self.backend == "redis":
+            client = self._get_redis()
+            return await client.mget([f"{self.key_prefix}:{key}" for key in keys])
+        return await asyncio.to_thread(self._read_files, keys)
+
+    async def _set_remote(self, items: dict[str, bytes]):
+        """Store packed vectors in the second tier."""
+        if self.backend == "redis":
+            client = self._get_redis()
+            async with client.pipeline(transaction=False) as pipe:
+                for key, data in items.items():
+                    pipe.set(f"{self.key_prefix}:{key}", data, ex=self.ttl)
+                await pipe.execute()
+            return
+        await asyncio.to_thread(self._write_files, items)
+
+    def _get_redis(self) -> redis.Redis:
+        """Create the Redis client lazily."""
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(self.redis_url)
+        return self._redis
+
+    def _path(self, key: str) -> Path:
+        """File path for a cache key, fanned out by hash prefix."""
+        model_name, dimension, digest = key.rsplit(":", 2)
+        safe_model = model_name.replace("/", "_").replace(":", "_")
+        return self.directory / f"{safe_model}-{dimension}" / digest[:2] / f"{digest}.f32"
+
+    def _read_files(self, keys: list[str]) -> list[Optional[bytes]]:
+        """Read packed vectors from disk."""
+        results: list[Optional[bytes]] = []
+        for key in keys:
+            try:
+                results.append(self._path(key).read_bytes())
+            except FileNotFoundError:
+                results.append(None)
+        return results
+
+    def _write_files(self, items: dict[str, bytes]):
+        """Write packed vectors to disk atomically."""
+        for key, data in items.items():
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+
+    async def close(self):
+        """Close the Redis connection."""
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache hit statistics.
+
+        Returns:
+            Hits, misses and in-memory entry count
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory)
+        }
+
+
+@lru_cache
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Get the process-wide embedding cache.
+
+    Returns:
+        Shared cache, or None when ``embedding_cache_enabled`` is off
+    """
+    if not getattr(settings, 'embedding_cache_enabled', True):
+        return None
+
+    return EmbeddingCache(
+        max_entries=getattr(settings, 'embedding_cache_size', None) or 10000,
+        backend=getattr(settings, 'embedding_cache_backend', None) or "memory",
+        ttl=getattr(settings, 'embedding_cache_ttl', None)
+    )
@@ -10,6 +10,8 @@ from sentence_transformers import SentenceTransformer
 
 from src.config.settings import settings
 
+from .cache import EmbeddingCache, get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +22,10 @@ class EmbeddingGenerator:
         self,
         model_name: str = "nomic-embed-text",
         ollama_url: Optional[str] = None,
-        openai_api_key: Optional[str] = None
+        openai_api_key: Optional[str] = None,
+        ollama_batch_size: Optional[int] = None,
+        ollama_max_concurrency: Optional[int] = None,
+        cache: Optional[EmbeddingCache] = None
     ):
         """Initialize embedding generator.
 
@@ -28,10 +33,28 @@ class EmbeddingGenerator:
             model_name: Model to use for embeddings
             ollama_url: Ollama API URL for local generation
             openai_api_key: OpenAI API key for fallback
+            ollama_batch_size: Texts per Ollama batch embed request
+            ollama_max_concurrency: Maximum in-flight Ollama requests
+            cache: Embedding cache (defaults to the shared cache)
         """
         self.model_name = model_name
         self.ollama_url = ollama_url or settings.ollama_url
         self.openai_api_key = openai_api_key or settings.openai_api_key
+        self.ollama_batch_size = max(
+            1,
+            ollama_batch_size or getattr(settings, 'ollama_embed_batch_size', None) or 64
+        )
+        self.ollama_max_concurrency = max(
+            1,
+            ollama_max_concurrency or getattr(settings, 'ollama_max_concurrency', None) or 4
+        )
+
+        self.cache = cache if cache is not None else get_embedding_cache()
+
+        # Pooled HTTP session reused across calls, created lazily
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Cleared when the Ollama server predates the /api/embed endpoint
+        self._ollama_batch_supported = True
 
         # Set dimension based on model (default to nomic-embed-text)
         if model_name == "nomic-embed-text":
@@ -51,6 +74,28 @@ class EmbeddingGenerator:
             except Exception as e:
                 logger.warning(f"Could not load local model {model_name}: {e}")
 
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.ollama_max_concurrency)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the pooled HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
     async def generate_embeddings(
         self,
         texts: list[str],
@@ -68,6 +113,72 @@ class EmbeddingGenerator:
         if not texts:
             return []
 
+        embeddings = await self.generate_embedding_array(texts, normalize)
+        return embeddings.tolist()
+
+    async def generate_embedding_array(
+        self,
+        texts: list[str],
+        normalize: bool = True
+    ) -> np.ndarray:
+        """Generate embeddings for texts as a single float32 matrix.
+
+        Args:
+            texts: List of texts to embed
+            normalize: Whether to normalize embeddings
+
+        Returns:
+            Array of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        dimension = self.dimension
+        cached: list[Optional[np.ndarray]] = [None] * len(texts)
+        if self.cache:
+            cached = await self.cache.get_many(self.model_name, dimension, texts)
+
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+        if not missing:
+            logger.debug(f"Served {len(texts)} embeddings from cache")
+            embeddings = np.stack(cached)
+        else:
+            generated = await self._generate_uncached([texts[i] for i in missing])
+            if generated.shape[1] != dimension and len(missing) < len(texts):
+                # Backend fell back to a model of another size; cached rows no longer fit
+                missing = list(range(len(texts)))
+                generated = await self._generate_uncached(texts)
+
+            if self.cache:
+                await self.cache.set_many(
+                    self.model_name,
+                    self.dimension,
+                    [texts[i] for i in missing],
+                    generated
+                )
+
+            embeddings = np.empty((len(texts), generated.shape[1]), dtype=np.float32)
+            embeddings[missing] = generated
+            if len(missing) < len(texts):
+                for i, embedding in enumerate(cached):
+                    if embedding is not None:
+                        embeddings[i] = embedding
+
+        # Normalize if requested
+        if normalize:
+            embeddings = self._normalize_embeddings(embeddings)
+
+        return embeddings
+
+    async def _generate_uncached(self, texts: list[str]) -> np.ndarray:
+        """Generate raw embeddings, trying each backend in turn.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Unnormalized float32 array of shape (len(texts), dimension)
+        """
         embeddings = None
 
         # Try local model first
@@ -99,13 +210,9 @@ class EmbeddingGenerator:
         if embeddings is None:
             raise RuntimeError("No embedding generation method available")
 
-        # Normalize if requested
-        if normalize:
-            embeddings = self._normalize_embeddings(embeddings)
-
-        return embeddings
+        return np.asarray(embeddings, dtype=np.float32)
 
-    async def _generate_local(self, texts: list[str]) -> list[list[float]]:
+    async def _generate_local(self, texts: list[str]) -> np.ndarray:
         """Generate embeddings using local model.
 
         Args:
@@ -125,11 +232,16 @@ class EmbeddingGenerator:
             texts
         )
 
-        return embeddings.tolist()
+        return np.asarray(embeddings, dtype=np.float32)
 
-    async def _generate_ollama(self, texts: list[str]) -> list[list[float]]:
+    async def _generate_ollama(self, texts: list[str]) -> np.ndarray:
         """Generate embeddings using Ollama.
 
+        Texts are sent in batches to the /api/embed endpoint over a pooled
+        session, with up to ollama_max_concurrency requests in flight.
+        Servers without /api/embed fall back to one /api/embeddings request
+        per text.
+
         Args:
             texts: Texts to embed
 
@@ -139,30 +251,83 @@ class EmbeddingGenerator:
         if not self.ollama_url:
             raise RuntimeError("Ollama URL not configured")
 
-        embeddings = []
+        session = self._get_session()
+        semaphore = asyncio.Semaphore(self.ollama_max_concurrency)
 
-        async with aiohttp.ClientSession() as session:
-            for text in texts:
-                data = {
-                    "model": "nomic-embed-text",  # Use nomic-embed-text for Ollama
-                    "prompt": text
-                }
+        if self._ollama_batch_supported:
+            batches = [
+                texts[i:i + self.ollama_batch_size]
+                for i in range(0, len(texts), self.ollama_batch_size)
+            ]
 
-                async with session.post(
-                    f"{self.ollama_url}/api/embeddings",
-                    json=data
-                ) as response:
-                    if response.status != 200:
-                        raise RuntimeError(
-                            f"Ollama returned status {response.status}"
-                        )
+            async def embed_batch(batch: list[str]) -> Optional[np.ndarray]:
+                async with semaphore:
+                    return await self._ollama_embed_batch(session, batch)
 
-                    result = await response.json()
-                    embeddings.append(result["embedding"])
+            results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+            if all(result is not None for result in results):
+                return np.concatenate(results)
 
+            logger.info("Ollama batch embed endpoint unavailable, using per-text requests")
+            self._ollama_batch_supported = False
+
+        async def embed_one(text: str) -> list[float]:
+            async with semaphore:
+                return await self._ollama_embed_single(session, text)
+
+        embeddings = await asyncio.gather(*(embed_one(text) for text in texts))
+        return np.asarray(embeddings, dtype=np.float32)
+
+    async def _ollama_embed_batch(
+        self,
+        session: aiohttp.ClientSession,
+        texts: list[str]
+    ) -> Optional[np.ndarray]:
+        """Embed a batch of texts with one /api/embed request.
+
+        Returns:
+            Embedding vectors, or None if the endpoint does not exist
+        """
+        data = {
+            "model": "nomic-embed-text",  # Use nomic-embed-text for Ollama
+            "input": texts
+        }
+
+        async with session.post(f"{self.ollama_url}/api/embed", json=data) as response:
+            # Unknown routes get a plain-text 404; a missing model is a JSON error
+            if response.status == 404 and response.content_type != "application/json":
+                return None
+            if response.status != 200:
+                raise RuntimeError(f"Ollama returned status {response.status}")
+
+            result = await response.json()
+
+        embeddings = np.asarray(result["embeddings"], dtype=np.float32)
+        if len(embeddings) != len(texts):
+            raise RuntimeError(
+                f"Ollama returned {len(embeddings)} embeddings for {len(texts)} texts"
+            )
         return embeddings
 
-    async def _generate_openai(self, texts: list[str]) -> list[list[float]]:
+    async def _ollama_embed_single(
+        self,
+        session: aiohttp.ClientSession,
+        text: str
+    ) -> list[float]:
+        """Embed one text with the legacy /api/embeddings endpoint."""
+        data = {
+            "model": "nomic-embed-text",  # Use nomic-embed-text for Ollama
+            "prompt": text
+        }
+
+        async with session.post(f"{self.ollama_url}/api/embeddings", json=data) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Ollama returned status {response.status}")
+
+            result = await response.json()
+            return result["embedding"]
+
+    async def _generate_openai(self, texts: list[str]) -> np.ndarray:
         """Generate embeddings using OpenAI.
 
         Args:
@@ -202,44 +367,35 @@ class EmbeddingGenerator:
 
                     result = await response.json()
 
-                    for item in result["data"]:
-                        embeddings.append(item["embedding"])
+                    embeddings.append(np.asarray(
+                        [item["embedding"] for item in result["data"]],
+                        dtype=np.float32
+                    ))
 
-        return embeddings
+        return np.concatenate(embeddings)
 
-    def _normalize_embeddings(
-        self,
-        embeddings: list[list[float]]
-    ) -> list[list[float]]:
+    def _normalize_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
         """Normalize embeddings for cosine similarity.
 
+        Rows are divided by their L2 norm in place; all-zero rows are left
+        as they are.
+
         Args:
-            embeddings: Raw embeddings
+            embeddings: Raw float32 embeddings, one row per text
 
         Returns:
             Normalized embeddings
         """
-        normalized = []
-
-        for embedding in embeddings:
-            # Convert to numpy array
-            vec = np.array(embedding)
-
-            # Normalize
-            norm = np.linalg.norm(vec)
-            if norm > 0:
-                vec = vec / norm
-
-            normalized.append(vec.tolist())
-
-        return normalized
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        np.divide(embeddings, norms, out=embeddings, where=norms > 0)
+        return embeddings
 
     async def generate_batch(
         self,
         texts: list[str],
         batch_size: int = 50,
         normalize: bool = True
-    ) -> list[list[float]]:
+    ) -> np.ndarray:
         """Generate embeddings in batches.
 
         Args:
@@ -248,16 +404,15 @@ class EmbeddingGenerator:
             normalize: Whether to normalize
 
         Returns:
-            All embeddings
+            Float32 array with one row per text; rows of failed batches are zero
         """
-        all_embeddings = []
+        parts = []
 
         for i in range(0, len(texts), batch_size):
             batch = texts[i:i + batch_size]
 
             try:
-                embeddings = await self.generate_embeddings(batch, normalize)
-                all_embeddings.extend(embeddings)
+                parts.append(await self.generate_embedding_array(batch, normalize))
 
                 logger.debug(
                     f"Processed batch {i // batch_size + 1}: "
@@ -267,9 +422,11 @@ class EmbeddingGenerator:
             except Exception as e:
                 logger.error(f"Failed to process batch: {e}")
                 # Add empty embeddings for failed batch
-                all_embeddings.extend([[0.0] * self.dimension] * len(batch))
+                parts.append(np.zeros((len(batch), self.dimension), dtype=np.float32))
 
-        return all_embeddings
+        if not parts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+        return np.concatenate(parts)
 
     def get_dimension(self) -> int:
         """Get embedding dimension.
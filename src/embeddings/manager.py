@@ -136,6 +136,7 @@ class EmbeddingManager:
             List of embedding data with IDs
         """
         embeddings_data = []
+        entity_chunks = []
 
         for entity in entities:
             # Prepare text for embedding
@@ -146,24 +147,29 @@ class EmbeddingManager:
 
             if not chunks:
                 logger.warning(f"No text to embed for entity {entity.id}")
+            entity_chunks.append(chunks)
+
+        # Generate embeddings for every chunk of the batch in one call
+        chunk_texts = [chunk["text"] for chunks in entity_chunks for chunk in chunks]
+        embeddings = await self.generator.generate_embedding_array(chunk_texts)
+
+        offset = 0
+        for entity, chunks in zip(entities, entity_chunks):
+            if not chunks:
                 embeddings_data.append({
                     "id": str(uuid.uuid4()),
-                    "embeddings": [],
+                    "embeddings": embeddings[:0],
                     "chunks": []
                 })
                 continue
 
-            # Generate embeddings for chunks
-            chunk_texts = [chunk["text"] for chunk in chunks]
-            embeddings = await self.generator.generate_embeddings(chunk_texts)
-
-            # Combine chunks and embeddings
+            # Combine chunks and embeddings (rows are views, not copies)
             embedding_id = str(uuid.uuid4())
 
             embeddings_data.append({
                 "id": embedding_id,
                 "entity_id": str(entity.id),
-                "embeddings": embeddings,
+                "embeddings": embeddings[offset:offset + len(chunks)],
                 "chunks": chunks,
                 "metadata": {
                     "entity_type": entity.entity_type,
@@ -171,6 +177,7 @@ class EmbeddingManager:
                     "name": entity.name
                 }
             })
+            offset += len(chunks)
 
         return embeddings_data
 
@@ -17,9 +17,9 @@ logger = logging.getLogger(__name__)
 class QueryOrchestrator:
     """Efficiently queries all IT Glue endpoints for an organization."""
 
-    # IT Glue rate limit: 10 requests per second
+    # Maximum resource types queried concurrently; request pacing is
+    # handled by the IT Glue client's shared rate limiter
     RATE_LIMIT = 10
-    RATE_LIMIT_WINDOW = 1.0  # 1 second
 
     # Resource types to query
     RESOURCE_TYPES = [
@@ -43,7 +43,6 @@ class QueryOrchestrator:
         self.itglue_client = itglue_client
         self.cache_manager = cache_manager
         self.semaphore = asyncio.Semaphore(self.RATE_LIMIT)
-        self.request_times: list[float] = []
 
     async def query_all_resources(
         self,
@@ -86,7 +85,7 @@ class QueryOrchestrator:
             )
             tasks.append(task)
 
-        # Execute tasks with rate limiting
+        # Execute tasks in batches of RATE_LIMIT
         total_tasks = len(tasks)
         completed = 0
 
@@ -114,10 +113,6 @@ class QueryOrchestrator:
                         f"Queried {resource_type}"
                     )
 
-            # Rate limit between batches
-            if i + self.RATE_LIMIT < len(tasks):
-                await asyncio.sleep(self.RATE_LIMIT_WINDOW)
-
         # Cache results for 15 minutes
         if self.cache_manager and hasattr(self.cache_manager, 'query_cache'):
             from ..cache.redis_cache import QueryType
@@ -142,41 +137,33 @@ class QueryOrchestrator:
             Resource data with metadata
         """
         async with self.semaphore:
-            await self._enforce_rate_limit()
-
             start_time = datetime.utcnow()
             all_data = []
-            page = 1
-            total_pages = 1
+
+            request = self._resource_request(organization_id, resource_type)
+            if not request:
+                return {
+                    'type': resource_type,
+                    'count': 0,
+                    'data': [],
+                    'query_time': 0.0
+                }
+            endpoint, params = request
 
             try:
-                while page <= total_pages:
-                    # Make API request based on resource type
-                    response = await self._make_api_request(
-                        organization_id=organization_id,
+                # Stream pages as they arrive instead of materialising models
+                async for page_data in self.itglue_client.iter_pages(endpoint, params):
+                    all_data.extend(page_data)
+
+                    # Log API query to database
+                    await self._log_api_query(
+                        snapshot_id=snapshot_id,
+                        endpoint=f"/organizations/{organization_id}/{resource_type}",
                         resource_type=resource_type,
-                        page=page
+                        response_status=200,
+                        duration_ms=(datetime.utcnow() - start_time).total_seconds() * 1000
                     )
 
-                    if response and 'data' in response:
-                        all_data.extend(response['data'])
-
-                        # Get pagination info
-                        meta = response.get('meta', {})
-                        total_pages = meta.get('total-pages', 1)
-                        page += 1
-
-                        # Log API query to database
-                        await self._log_api_query(
-                            snapshot_id=snapshot_id,
-                            endpoint=f"/organizations/{organization_id}/{resource_type}",
-                            resource_type=resource_type,
-                            response_status=200,
-                            duration_ms=(datetime.utcnow() - start_time).total_seconds() * 1000
-                        )
-                    else:
-                        break
-
                 return {
                     'type': resource_type,
                     'count': len(all_data),
@@ -198,69 +185,37 @@ class QueryOrchestrator:
 
                 raise
 
-    async def _make_api_request(
+    def _resource_request(
         self,
         organization_id: str,
-        resource_type: str,
-        page: int = 1
-    ) -> Optional[dict]:
-        """Make API request to IT Glue based on resource type.
+        resource_type: str
+    ) -> Optional[tuple[str, dict[str, Any]]]:
+        """Build the IT Glue endpoint and parameters for a resource type.
 
         Args:
             organization_id: Organization ID
             resource_type: Type of resource
-            page: Page number for pagination
 
         Returns:
-            API response data
+            Tuple of endpoint and query parameters, or None if unmapped
         """
         params = {
-            'filter[organization_id]': organization_id,
-            'page[number]': page,
             'page[size]': 100  # Max page size for IT Glue
         }
 
-        # Map resource types to IT Glue client methods
-        method_map = {
-            'configurations': self.itglue_client.get_configurations,
-            'flexible_assets': self.itglue_client.get_flexible_assets,
-            'contacts': self.itglue_client.get_contacts,
-            'locations': self.itglue_client.get_locations,
-            'documents': self.itglue_client.get_documents,
-            'passwords': self.itglue_client.get_passwords,
-            'domains': self.itglue_client.get_domains,
-            'networks': self.itglue_client.get_networks
-        }
-
-        method = method_map.get(resource_type)
-        if not method:
-            logger.warning(f"No method mapped for resource type: {resource_type}")
+        if resource_type in ('configurations', 'contacts', 'locations', 'documents', 'passwords'):
+            endpoint = f"organizations/{organization_id}/relationships/{resource_type}"
+        elif resource_type == 'flexible_assets':
+            endpoint = 'flexible_assets'
+            params['filter[organization-id]'] = organization_id
+        elif resource_type in ('domains', 'networks'):
+            endpoint = resource_type
+            params['filter[organization_id]'] = organization_id
+        else:
+            logger.warning(f"No endpoint mapped for resource type: {resource_type}")
             return None
 
-        try:
-            return await method(**params)
-        except Exception as e:
-            logger.error(f"API request failed for {resource_type}: {e}")
-            raise
-
-    async def _enforce_rate_limit(self):
-        """Enforce rate limiting to stay within IT Glue API limits."""
-        current_time = asyncio.get_event_loop().time()
-
-        # Remove old request times outside the window
-        self.request_times = [
-            t for t in self.request_times
-            if current_time - t < self.RATE_LIMIT_WINDOW
-        ]
-
-        # If at rate limit, wait
-        if len(self.request_times) >= self.RATE_LIMIT:
-            sleep_time = self.RATE_LIMIT_WINDOW - (current_time - self.request_times[0])
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
-
-        # Record this request
-        self.request_times.append(current_time)
+        return endpoint, params
 
     async def _log_api_query(
         self,
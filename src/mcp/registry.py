@@ -0,0 +1,119 @@
+"""Registry of long-lived components shared by MCP tools."""
+
+import logging
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ComponentSpec:
+    """How to build a component and manage its lifecycle."""
+
+    factory: Callable[[], Any]
+    warm_up: Optional[Callable[[Any], Awaitable[Any]]] = None
+    shutdown: Optional[Callable[[Any], Awaitable[Any]]] = None
+
+
+class ComponentRegistry:
+    """Builds each registered component once and shares it across calls.
+
+    Components are created lazily by ``get`` (or eagerly by ``warm_up``)
+    and live until ``shutdown``, so per-instance caches survive between
+    tool calls. Shutdown hooks run in reverse creation order.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._specs: dict[str, ComponentSpec] = {}
+        self._instances: dict[str, Any] = {}
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        warm_up: Optional[Callable[[Any], Awaitable[Any]]] = None,
+        shutdown: Optional[Callable[[Any], Awaitable[Any]]] = None
+    ):
+        """Register a component.
+
+        Args:
+            name: Component name; registering it again replaces the component
+            factory: Builds the component
+            warm_up: Optional coroutine run on the component by ``warm_up``
+            shutdown: Optional coroutine run on the component by ``shutdown``
+        """
+        self._specs[name] = ComponentSpec(factory, warm_up, shutdown)
+        self._instances.pop(name, None)
+
+    def register_instance(
+        self,
+        name: str,
+        instance: Any,
+        shutdown: Optional[Callable[[Any], Awaitable[Any]]] = None
+    ):
+        """Register an already built component.
+
+        Args:
+            name: Component name
+            instance: Component
+            shutdown: Optional coroutine run on the component by ``shutdown``
+        """
+        self._specs[name] = ComponentSpec(lambda: instance, shutdown=shutdown)
+        self._instances[name] = instance
+
+    def get(self, name: str) -> Any:
+        """Get a component, building it on first use.
+
+        Args:
+            name: Component name
+
+        Returns:
+            The shared component instance
+        """
+        instance = self._instances.get(name)
+        if instance is None:
+            spec = self._specs.get(name)
+            if spec is None:
+                raise KeyError(f"Unknown component: {name}")
+            instance = spec.factory()
+            self._instances[name] = instance
+            logger.debug(f"Built component '{name}'")
+        return instance
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+
+    async def warm_up(self) -> dict[str, bool]:
+        """Build every component and run its warm-up hook.
+
+        Failures are logged rather than raised so one slow or unavailable
+        dependency does not stop the server from starting.
+
+        Returns:
+            Component name to whether its warm-up succeeded
+        """
+        results = {}
+        for name, spec in self._specs.items():
+            try:
+                instance = self.get(name)
+                if spec.warm_up:
+                    await spec.warm_up(instance)
+                results[name] = True
+            except Exception as e:
+                logger.warning(f"Failed to warm up component '{name}': {e}")
+                results[name] = False
+        return results
+
+    async def shutdown(self):
+        """Run shutdown hooks in reverse creation order and drop instances."""
+        for name in reversed(list(self._instances)):
+            spec = self._specs[name]
+            if spec.shutdown:
+                try:
+                    await spec.shutdown(self._instances[name])
+                except Exception as e:
+                    logger.warning(f"Error shutting down component '{name}': {e}")
+        self._instances.clear()
@@ -10,7 +10,9 @@ from mcp.server.stdio import stdio_server
 from src.cache import CacheManager
 from src.config.settings import settings
 from src.data import db_manager
+from src.mcp.registry import ComponentRegistry
 from src.query import QueryEngine
+from src.query.organization_directory import OrganizationDirectory
 from src.search import HybridSearch
 from src.services.itglue import ITGlueClient
 from src.sync import SyncOrchestrator
@@ -30,7 +32,9 @@ class ITGlueMCPServer:
         self.sync_orchestrator: Optional[SyncOrchestrator] = None
         self.cache_manager: Optional[CacheManager] = None
         self.itglue_client: Optional[ITGlueClient] = None
+        self.org_directory: Optional[OrganizationDirectory] = None
         self.health_checker: Optional[HealthChecker] = None
+        self.components = ComponentRegistry()
         self._initialized = False
         self._register_tools()
         logger.info("IT Glue MCP Server initialized")
@@ -39,16 +43,22 @@ class ITGlueMCPServer:
         """Register MCP tools."""
 
         @self.server.tool()
-        async def query(query: str, company: Optional[str] = None) -> dict:
+        async def query(
+            query: str,
+            company: Optional[str] = None,
+            offset: int = 0
+        ) -> dict:
             """
             Natural language query tool for IT Glue documentation.
 
             Args:
                 query: Natural language question
                 company: Company name or ID (optional)
+                offset: next_offset from a previous response, to get the next page
 
             Returns:
-                Query results or error message
+                Query results or error message; has_more and next_offset
+                tell whether another page exists
             """
             try:
                 logger.info(f"Query received: {query} for company: {company}")
@@ -66,7 +76,8 @@ class ITGlueMCPServer:
                 # Process query
                 result = await self.query_engine.process_query(
                     query=query,
-                    company=company
+                    company=company,
+                    offset=max(0, offset)
                 )
 
                 return result
@@ -203,14 +214,7 @@ class ITGlueMCPServer:
                         "error": "IT Glue client not initialized"
                     }
 
-                # Import handler here to avoid circular imports
-                from src.query.organizations_handler import OrganizationsHandler
-
-                # Create handler instance
-                handler = OrganizationsHandler(
-                    itglue_client=self.itglue_client,
-                    cache_manager=self.cache_manager
-                )
+                handler = self.components.get("organizations")
 
                 # Perform action
                 if action == "list":
@@ -339,15 +343,7 @@ class ITGlueMCPServer:
                         "error": "IT Glue client not initialized"
                     }
 
-                # Import handler here to avoid circular imports
-                from src.query.documents_handler import DocumentsHandler
-
-                # Create handler instance with semantic search if available
-                handler = DocumentsHandler(
-                    itglue_client=self.itglue_client,
-                    semantic_search=self.search_engine.semantic_search if self.search_engine else None,
-                    cache_manager=self.cache_manager
-                )
+                handler = self.components.get("documents")
 
                 # Perform action
                 if action == "search":
@@ -443,14 +439,7 @@ class ITGlueMCPServer:
                         "error": "IT Glue client not initialized"
                     }
 
-                # Import handler here to avoid circular imports
-                from src.query.flexible_assets_handler import FlexibleAssetsHandler
-
-                # Create handler instance
-                handler = FlexibleAssetsHandler(
-                    itglue_client=self.itglue_client,
-                    cache_manager=self.cache_manager
-                )
+                handler = self.components.get("flexible_assets")
 
                 # Perform action
                 if action == "list":
@@ -537,14 +526,7 @@ class ITGlueMCPServer:
                         "error": "IT Glue client not initialized"
                     }
 
-                # Import handler here to avoid circular imports
-                from src.query.locations_handler import LocationsHandler
-
-                # Create handler instance
-                handler = LocationsHandler(
-                    itglue_client=self.itglue_client,
-                    cache_manager=self.cache_manager
-                )
+                handler = self.components.get("locations")
 
                 # Perform action
                 if action == "list":
@@ -623,14 +605,7 @@ class ITGlueMCPServer:
                         "error": "IT Glue client not initialized"
                     }
 
-                # Import handler here to avoid circular imports
-                from src.query.asset_type_handler import AssetTypeHandler
-
-                # Create handler instance
-                handler = AssetTypeHandler(
-                    itglue_client=self.itglue_client,
-                    cache_manager=self.cache_manager
-                )
+                handler = self.components.get("asset_types")
 
                 # Perform action
                 if action == "list":
@@ -708,24 +683,9 @@ class ITGlueMCPServer:
                     # Not numeric, try to resolve organization name
                     logger.info(f"Resolving organization name: {organization_id}")
 
-                    # Query organizations to find matching name
-                    from src.query.organizations_handler import OrganizationsHandler
-                    handler = OrganizationsHandler(
-                        itglue_client=self.itglue_client,
-                        cache_manager=self.cache_manager
-                    )
-
-                    # Try to find organization by name
-                    result = await handler.find_organization(organization_id, use_fuzzy=True)
-
-                    if result.get('success') and result.get('data'):
-                        org_data = result['data']
-                        if isinstance(org_data, list) and len(org_data) > 0:
-                            org_id_resolved = str(org_data[0].get('id'))
-                            logger.info(f"Resolved '{organization_id}' to organization ID: {org_id_resolved}")
-                        elif isinstance(org_data, dict):
-                            org_id_resolved = str(org_data.get('id'))
-                            logger.info(f"Resolved '{organization_id}' to organization ID: {org_id_resolved}")
+                    org_id_resolved = await self.org_directory.resolve_id(organization_id)
+                    if org_id_resolved:
+                        logger.info(f"Resolved '{organization_id}' to organization ID: {org_id_resolved}")
 
                     if not org_id_resolved:
                         return {
@@ -750,7 +710,7 @@ class ITGlueMCPServer:
 
                 # Generate documentation with progress tracking
                 result = await handler.generate_infrastructure_documentation(
-                    organization_id=str(org_id_int),
+                    organization_id=organization_id,
                     include_embeddings=include_embeddings,
                     upload_to_itglue=upload_to_itglue
                 )
@@ -783,28 +743,49 @@ class ITGlueMCPServer:
             await db_manager.initialize()
             await db_manager.create_tables()
 
+            # Initialize IT Glue client; cached resources are reloaded through it.
+            # Registered first so it is closed after everything sharing it
+            self.itglue_client = ITGlueClient()
+            self.components.register_instance(
+                "itglue_client",
+                self.itglue_client,
+                shutdown=lambda client: client.disconnect()
+            )
+
             # Initialize cache
-            self.cache_manager = CacheManager()
+            self.cache_manager = CacheManager(loaders=self.itglue_client.cache_loaders())
             await self.cache_manager.connect()
 
             # Initialize search
             self.search_engine = HybridSearch()
             await self.search_engine.semantic_search.initialize_collection()
 
+            # Initialize the organization directory shared by handlers
+            self.components.register(
+                "org_directory",
+                lambda: OrganizationDirectory(self.itglue_client),
+                warm_up=lambda directory: directory.refresh(),
+                shutdown=lambda directory: directory.close()
+            )
+            self.org_directory = self.components.get("org_directory")
+
             # Initialize query engine
             self.query_engine = QueryEngine(
                 search=self.search_engine,
-                cache=self.cache_manager
+                cache=self.cache_manager,
+                itglue_client=self.itglue_client,
+                org_directory=self.org_directory
             )
 
-            # Initialize IT Glue client
-            self.itglue_client = ITGlueClient()
-
             # Initialize sync orchestrator
             self.sync_orchestrator = SyncOrchestrator(
                 itglue_client=self.itglue_client
             )
 
+            # Build tool handlers once and load shared data
+            self._register_components()
+            await self.components.warm_up()
+
             self._initialized = True
             logger.info("All components initialized successfully")
 
@@ -812,6 +793,67 @@ class ITGlueMCPServer:
             logger.error(f"Failed to initialize components: {e}")
             raise
 
+    def _register_components(self):
+        """Register tool handlers and services with the component registry."""
+        # Import handlers here to avoid circular imports
+        from src.query.asset_type_handler import AssetTypeHandler
+        from src.query.documents_handler import DocumentsHandler
+        from src.query.flexible_assets_handler import FlexibleAssetsHandler
+        from src.query.locations_handler import LocationsHandler
+        from src.query.organizations_handler import OrganizationsHandler
+
+        self.components.register_instance(
+            "cache_manager",
+            self.cache_manager,
+            shutdown=lambda cache: cache.disconnect()
+        )
+        self.components.register_instance(
+            "query_engine",
+            self.query_engine,
+            shutdown=lambda engine: engine.close()
+        )
+
+        self.components.register(
+            "organizations",
+            lambda: OrganizationsHandler(
+                itglue_client=self.itglue_client,
+                cache_manager=self.cache_manager,
+                org_directory=self.org_directory
+            )
+        )
+        self.components.register(
+            "documents",
+            lambda: DocumentsHandler(
+                itglue_client=self.itglue_client,
+                semantic_search=self.search_engine.semantic_search if self.search_engine else None,
+                cache_manager=self.cache_manager,
+                org_directory=self.org_directory
+            )
+        )
+        self.components.register(
+            "flexible_assets",
+            lambda: FlexibleAssetsHandler(
+                itglue_client=self.itglue_client,
+                cache_manager=self.cache_manager,
+                org_directory=self.org_directory
+            )
+        )
+        self.components.register(
+            "locations",
+            lambda: LocationsHandler(
+                itglue_client=self.itglue_client,
+                cache_manager=self.cache_manager,
+                org_directory=self.org_directory
+            )
+        )
+        self.components.register(
+            "asset_types",
+            lambda: AssetTypeHandler(
+                itglue_client=self.itglue_client,
+                cache_manager=self.cache_manager
+            )
+        )
+
     async def _initialize_health_checker(self):
         """Initialize comprehensive health checker."""
         try:
@@ -862,14 +904,14 @@ class ITGlueMCPServer:
                 async def check_qdrant():
                     try:
                         client = self.search_engine.semantic_search.client
-                        collections = client.get_collections()
+                        collections = await client.get_collections()
                         collection_name = self.search_engine.semantic_search.collection_name
                         
                         # Check if our collection exists
                         collection_exists = any(c.name == collection_name for c in collections.collections)
                         
                         if collection_exists:
-                            collection_info = client.get_collection(collection_name)
+                            collection_info = await client.get_collection(collection_name)
                             return True, "Qdrant vector database healthy", {
                                 "collection": collection_name,
                                 "points_count": collection_info.points_count,
@@ -966,6 +1008,8 @@ class ITGlueMCPServer:
         except Exception as e:
             logger.error(f"MCP server error: {e}", exc_info=True)
             raise
+        finally:
+            await self.components.shutdown()
 
     async def run_websocket(self, host: str = "0.0.0.0", port: int = 8001):
         """Run the MCP server with WebSocket support."""
@@ -1,5 +1,6 @@
 """Query processing for natural language queries."""
 
+from .audit import QueryAuditLogger
 from .engine import QueryEngine
 from .parser import ParsedQuery, QueryIntent, QueryParser
 from .validator import ValidationResult, ZeroHallucinationValidator
@@ -10,5 +11,6 @@ __all__ = [
     'QueryIntent',
     'ZeroHallucinationValidator',
     'ValidationResult',
-    'QueryEngine'
+    'QueryEngine',
+    'QueryAuditLogger'
 ]
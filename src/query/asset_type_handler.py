@@ -4,9 +4,11 @@ import logging
 from typing import Any, Optional
 
 from src.cache.manager import CacheManager
-from src.services.itglue.client import ITGlueClient
+from src.services.itglue.client import ITGlueClient, find_flexible_asset_type
 from src.services.itglue.models import FlexibleAssetField
 
+from .handler_cache import get_flexible_asset_types
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +45,7 @@ class AssetTypeHandler:
 
         try:
             # Get all asset types
-            asset_types = await self.client.get_flexible_asset_types(include_fields=False)
+            asset_types = await get_flexible_asset_types(self.cache, self.client)
 
             # Format response
             result = {
@@ -98,7 +100,9 @@ class AssetTypeHandler:
 
         try:
             # Get the asset type by name
-            asset_type = await self.client.get_flexible_asset_type_by_name(asset_type_name)
+            asset_type = find_flexible_asset_type(
+                await get_flexible_asset_types(self.cache, self.client), asset_type_name
+            )
 
             if not asset_type:
                 return {
@@ -166,7 +170,7 @@ class AssetTypeHandler:
         """
         try:
             # Get all asset types
-            all_types = await self.client.get_flexible_asset_types(include_fields=False)
+            all_types = await get_flexible_asset_types(self.cache, self.client)
 
             # Filter by query (case-insensitive)
             query_lower = query.lower()
@@ -225,7 +229,7 @@ class AssetTypeHandler:
         ]
 
         try:
-            all_types = await self.client.get_flexible_asset_types(include_fields=False)
+            all_types = await get_flexible_asset_types(self.cache, self.client)
 
             # Find common types
             common_types = []
@@ -264,7 +268,7 @@ class AssetTypeHandler:
             List of suggestions
         """
         try:
-            all_types = await self.client.get_flexible_asset_types(include_fields=False)
+            all_types = await get_flexible_asset_types(self.cache, self.client)
 
             # Simple similarity check
             query_lower = query.lower()
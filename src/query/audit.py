@@ -0,0 +1,218 @@
+"""Background audit logging for processed queries."""
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Float, String, column, insert, table
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.config.settings import settings
+from src.data import UnitOfWork, db_manager
+
+logger = logging.getLogger(__name__)
+
+# asyncpg allows at most 32767 bind parameters per statement, 7 per record here
+MAX_ROWS_PER_STATEMENT = 1000
+
+query_logs = table(
+    "query_logs",
+    column("id", UUID(as_uuid=True)),
+    column("query", String),
+    column("company", String),
+    column("response", JSON),
+    column("confidence_score", Float),
+    column("source_ids", JSON),
+    column("response_time_ms", Float),
+)
+
+# Response keys kept when only a summary of the response is stored
+SUMMARY_KEYS = (
+    "success", "message", "confidence", "total_results", "returned_count",
+    "total_count", "has_more", "response_time_ms", "timestamp"
+)
+
+
+def summarize_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Reduce a query response to the fields needed for auditing.
+
+    Args:
+        response: Full query response
+
+    Returns:
+        Response without its data payload, plus the number of data items
+    """
+    summary = {key: response[key] for key in SUMMARY_KEYS if key in response}
+
+    data = response.get("data")
+    if isinstance(data, (list, dict)):
+        summary["data_items"] = len(data)
+    return summary
+
+
+@dataclass
+class QueryLogRecord:
+    """A query waiting to be written to the audit log."""
+
+    query: str
+    company: Optional[str]
+    response: dict[str, Any]
+    confidence_score: Optional[float]
+    source_ids: Optional[list[str]]
+    response_time_ms: Optional[float]
+
+
+class QueryAuditLogger:
+    """Writes query audit records from a background task.
+
+    Records are queued without waiting and written in batches, each with a
+    single multi-row insert, once ``batch_size`` records are queued or
+    ``flush_interval`` seconds have passed. When the queue is full new
+    records are dropped and counted rather than slowing queries down.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        full_response: Optional[bool] = None
+    ):
+        """Initialize audit logger.
+
+        Args:
+            max_queue_size: Records held before new ones are dropped
+            batch_size: Records written per transaction
+            flush_interval: Seconds a record may wait before being written
+            full_response: Store whole responses instead of summaries
+        """
+        self.max_queue_size = max(1, max_queue_size or settings.query_log_queue_size)
+        self.batch_size = max(1, batch_size or settings.query_log_batch_size)
+        self.flush_interval = flush_interval or settings.query_log_flush_interval
+        self.full_response = (
+            settings.query_log_full_response if full_response is None else full_response
+        )
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def log(
+        self,
+        query: str,
+        company: Optional[str],
+        response: dict[str, Any]
+    ) -> bool:
+        """Queue a query for the audit log.
+
+        Args:
+            query: Query string
+            company: Company filter
+            response: Query response
+
+        Returns:
+            True if queued, False if dropped because the queue is full
+        """
+        self._ensure_writer()
+
+        record = QueryLogRecord(
+            query=query,
+            company=company,
+            response=response if self.full_response else summarize_response(response),
+            confidence_score=response.get("confidence"),
+            source_ids=response.get("source_ids"),
+            response_time_ms=response.get("response_time_ms")
+        )
+
+        try:
+            self._queue.put_nowait(record)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(f"Query audit queue full, {self.dropped} records dropped")
+            return False
+
+    def _ensure_writer(self):
+        """Create the queue and start the writer task on first use."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self):
+        """Collect queued records into batches and write them."""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write_batch(self, batch: list[QueryLogRecord]):
+        """Write records to the query log with one multi-row insert."""
+        rows = [{"id": uuid.uuid4(), **asdict(record)} for record in batch]
+
+        try:
+            async with db_manager.get_session() as session:
+                uow = UnitOfWork(session)
+
+                for start in range(0, len(rows), MAX_ROWS_PER_STATEMENT):
+                    await session.execute(
+                        insert(query_logs).values(rows[start:start + MAX_ROWS_PER_STATEMENT])
+                    )
+
+                await uow.commit()
+            self.written += len(batch)
+
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Failed to log {len(batch)} queries: {e}")
+
+    async def flush(self):
+        """Wait until every queued record has been written."""
+        if self._queue is not None and self._writer_task and not self._writer_task.done():
+            await self._queue.join()
+
+    async def close(self):
+        """Write remaining records and stop the writer task."""
+        await self.flush()
+
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+
+    def get_stats(self) -> dict[str, int]:
+        """Get audit logging statistics.
+
+        Returns:
+            Written, dropped, failed and queued record counts
+        """
+        return {
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "queued": self._queue.qsize() if self._queue else 0
+        }
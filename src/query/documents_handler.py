@@ -11,6 +11,9 @@ from src.search.semantic import SemanticSearch
 from src.services.itglue.client import ITGlueClient
 from src.services.itglue.models import Document
 
+from .handler_cache import get_or_fetch_result
+from .organization_directory import OrganizationDirectory
+
 logger = logging.getLogger(__name__)
 
 # Maximum document content length to prevent MCP payload issues
@@ -25,7 +28,8 @@ class DocumentsHandler:
         self,
         itglue_client: ITGlueClient,
         semantic_search: Optional[SemanticSearch] = None,
-        cache_manager: Optional[CacheManager] = None
+        cache_manager: Optional[CacheManager] = None,
+        org_directory: Optional[OrganizationDirectory] = None
     ):
         """Initialize documents handler.
 
@@ -33,10 +37,12 @@ class DocumentsHandler:
             itglue_client: IT Glue API client
             semantic_search: Optional semantic search engine
             cache_manager: Optional cache manager
+            org_directory: Shared organization directory
         """
         self.client = itglue_client
         self.semantic = semantic_search
         self.cache = cache_manager
+        self.directory = org_directory or OrganizationDirectory(itglue_client)
 
     async def search_documents(
         self,
@@ -56,33 +62,23 @@ class DocumentsHandler:
         Returns:
             Dictionary with matching documents
         """
-        # Check cache first
         cache_key = f"documents:search:{self._hash_query(query)}:{organization or 'all'}"
-        if self.cache and hasattr(self.cache, 'query_cache'):
-            cached = await self.cache.query_cache.get(cache_key)
-            if cached:
-                logger.debug(f"Returning cached search results for '{query}'")
-                return cached
 
-        try:
+        async def fetch() -> dict[str, Any]:
             # Try semantic search first if available
             if use_semantic and self.semantic:
                 result = await self._semantic_search(query, organization, limit)
                 if result["count"] > 0:
-                    # Cache for 10 minutes
-                    if self.cache and hasattr(self.cache, 'query_cache'):
-                        from ..cache.redis_cache import QueryType
-                        await self.cache.query_cache.set(cache_key, result, QueryType.OPERATIONAL)
                     return result
 
             # Fall back to keyword search
-            result = await self._keyword_search(query, organization, limit)
-
-            # Cache for 10 minutes
-            if self.cache and hasattr(self.cache, 'query_cache'):
-                from ..cache.redis_cache import QueryType
-                await self.cache.query_cache.set(cache_key, result, QueryType.OPERATIONAL)
+            return await self._keyword_search(query, organization, limit)
 
+        try:
+            # Concurrent identical searches share one fetch
+            result = await get_or_fetch_result(self.cache, cache_key, fetch)
+            if result is None:
+                raise RuntimeError("document search unavailable")
             return result
 
         except Exception as e:
@@ -229,11 +225,8 @@ class DocumentsHandler:
             # Get organization name if available
             org_name = None
             if document.organization_id:
-                try:
-                    org = await self.client.get_organization(document.organization_id)
-                    org_name = org.name
-                except:
-                    pass
+                org = await self.directory.get(document.organization_id)
+                org_name = org.name if org else None
 
             # Format response
             result = {
@@ -272,13 +265,13 @@ class DocumentsHandler:
         Returns:
             Dictionary with recent documents
         """
-        try:
+        cache_key = f"documents:recent:{organization or 'all'}:{limit}"
+
+        async def fetch() -> dict[str, Any]:
             # Get organization ID if specified
             org_id = None
             if organization:
-                orgs = await self.client.get_organizations(filters={"name": organization})
-                if orgs:
-                    org_id = orgs[0].id
+                org_id = await self.directory.resolve_id(organization, fuzzy=False)
 
             # Get documents
             documents = await self.client.get_documents(org_id=org_id)
@@ -291,7 +284,7 @@ class DocumentsHandler:
             )
 
             # Format response
-            result = {
+            return {
                 "success": True,
                 "organization": organization,
                 "count": min(len(sorted_docs), limit),
@@ -301,6 +294,12 @@ class DocumentsHandler:
                 ]
             }
 
+        try:
+            # Concurrent listings share one fetch of the document list
+            result = await get_or_fetch_result(self.cache, cache_key, fetch)
+            if result is None:
+                raise RuntimeError("document list unavailable")
+
             logger.info(f"Listed {result['count']} recent documents")
             return result
 
@@ -399,9 +398,7 @@ class DocumentsHandler:
             # Get organization ID if specified
             org_id = None
             if organization:
-                orgs = await self.client.get_organizations(filters={"name": organization})
-                if orgs:
-                    org_id = orgs[0].id
+                org_id = await self.directory.resolve_id(organization, fuzzy=False)
 
             # Get all documents
             all_documents = await self.client.get_documents(org_id=org_id)
@@ -475,9 +472,7 @@ class DocumentsHandler:
             # Get organization ID if specified
             org_id = None
             if organization:
-                orgs = await self.client.get_organizations(filters={"name": organization})
-                if orgs:
-                    org_id = orgs[0].id
+                org_id = await self.directory.resolve_id(organization, fuzzy=False)
 
             # Get all documents
             all_documents = await self.client.get_documents(org_id=org_id)
@@ -658,27 +653,16 @@ class DocumentsHandler:
             org_name = organization
             
             if organization:
-                orgs = await self.client.get_organizations(filters={"name": organization})
-                if not orgs:
-                    # Try fuzzy match
-                    all_orgs = await self.client.get_organizations()
-                    org_match = self._find_best_match(
-                        organization,
-                        [(org.id, org.name) for org in all_orgs]
-                    )
-                    
-                    if not org_match:
-                        return {
-                            "success": False,
-                            "error": f"Organization '{organization}' not found",
-                            "documents": []
-                        }
-                    
-                    org_id = org_match[0]
-                    org_name = org_match[1]
-                else:
-                    org_id = orgs[0].id
-                    org_name = orgs[0].name
+                match = await self.directory.resolve(organization)
+                if not match:
+                    return {
+                        "success": False,
+                        "error": f"Organization '{organization}' not found",
+                        "documents": []
+                    }
+
+                org_id = match.organization.id
+                org_name = match.organization.name
 
             # Get documents with folder filtering
             documents = await self.client.get_documents(
@@ -742,30 +726,16 @@ class DocumentsHandler:
 
         try:
             # Find the organization
-            organizations = await self.client.get_organizations(
-                filters={"name": organization}
-            )
-
-            if not organizations:
-                # Try fuzzy match
-                all_orgs = await self.client.get_organizations()
-                org_match = self._find_best_match(
-                    organization,
-                    [(org.id, org.name) for org in all_orgs]
-                )
-
-                if not org_match:
-                    return {
-                        "success": False,
-                        "error": f"Organization '{organization}' not found",
-                        "documents": []
-                    }
+            match = await self.directory.resolve(organization)
+            if not match:
+                return {
+                    "success": False,
+                    "error": f"Organization '{organization}' not found",
+                    "documents": []
+                }
 
-                org_id = org_match[0]
-                org_name = org_match[1]
-            else:
-                org_id = organizations[0].id
-                org_name = organizations[0].name
+            org_id = match.organization.id
+            org_name = match.organization.name
 
             # Get documents for the organization with folder filtering
             documents = await self.client.get_documents(
@@ -850,9 +820,7 @@ class DocumentsHandler:
             # Get organization ID if specified
             org_id = None
             if organization:
-                orgs = await self.client.get_organizations(filters={"name": organization})
-                if orgs:
-                    org_id = orgs[0].id
+                org_id = await self.directory.resolve_id(organization, fuzzy=False)
 
             # Get all documents
             documents = await self.client.get_documents(org_id=org_id)
@@ -900,40 +868,6 @@ class DocumentsHandler:
                 "categories": []
             }
 
-    def _find_best_match(
-        self,
-        query: str,
-        candidates: list[tuple]
-    ) -> Optional[tuple]:
-        """Find best matching candidate using fuzzy matching.
-
-        Args:
-            query: Search query
-            candidates: List of (id, name) tuples
-
-        Returns:
-            Best matching tuple or None
-        """
-        if not candidates:
-            return None
-
-        query_lower = query.lower()
-        best_match = None
-        best_score = 0
-
-        for candidate_id, candidate_name in candidates:
-            score = SequenceMatcher(
-                None,
-                query_lower,
-                candidate_name.lower()
-            ).ratio()
-
-            if score > best_score and score > 0.6:
-                best_score = score
-                best_match = (candidate_id, candidate_name)
-
-        return best_match
-
     def _hash_query(self, query: str) -> str:
         """Create a hash of the query for caching.
 
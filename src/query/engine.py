@@ -6,10 +6,13 @@ from datetime import datetime
 from typing import Any, Optional
 
 from src.cache import CacheManager
+from src.config.settings import settings
 from src.data import UnitOfWork, db_manager
 from src.search import HybridSearch
 from src.services.itglue import ITGlueClient
 
+from .audit import QueryAuditLogger
+from .organization_directory import OrganizationDirectory
 from .parser import ParsedQuery, QueryIntent, QueryParser
 from .validator import ZeroHallucinationValidator
 
@@ -25,7 +28,10 @@ class QueryEngine:
         validator: Optional[ZeroHallucinationValidator] = None,
         search: Optional[HybridSearch] = None,
         cache: Optional[CacheManager] = None,
-        itglue_client: Optional[ITGlueClient] = None
+        itglue_client: Optional[ITGlueClient] = None,
+        result_cap: Optional[int] = None,
+        audit_logger: Optional[QueryAuditLogger] = None,
+        org_directory: Optional[OrganizationDirectory] = None
     ):
         """Initialize query engine.
 
@@ -35,19 +41,25 @@ class QueryEngine:
             search: Search engine
             cache: Cache manager
             itglue_client: IT Glue API client
+            result_cap: Search results returned per page
+            audit_logger: Background writer for the query audit log
+            org_directory: Shared organization directory
         """
         self.parser = parser or QueryParser()
         self.validator = validator or ZeroHallucinationValidator()
         self.search = search or HybridSearch()
         self.cache = cache or CacheManager()
         self.itglue_client = itglue_client or ITGlueClient()
-        self._company_cache = {}  # Cache company name to ID mappings
+        self.org_directory = org_directory or OrganizationDirectory(self.itglue_client)
+        self.result_cap = max(1, result_cap or settings.search_result_cap)
+        self.audit_logger = audit_logger or QueryAuditLogger()
 
     async def process_query(
         self,
         query: str,
         company: Optional[str] = None,
-        context: Optional[dict[str, Any]] = None
+        context: Optional[dict[str, Any]] = None,
+        offset: int = 0
     ) -> dict[str, Any]:
         """Process a natural language query.
 
@@ -55,6 +67,8 @@ class QueryEngine:
             query: Natural language query
             company: Company/organization filter (name or ID)
             context: Additional context
+            offset: Search candidates to skip, taken from a previous
+                response's ``next_offset``
 
         Returns:
             Query response with validation
@@ -63,8 +77,8 @@ class QueryEngine:
 
         logger.info(f"Processing query: {query} for company: {company}")
 
-        # Check cache first
-        cached_response = await self._check_cache(query, company)
+        # Check cache first (only first pages are cached)
+        cached_response = None if offset else await self._check_cache(query, company)
         if cached_response:
             logger.info("Returning cached response")
             return cached_response
@@ -96,23 +110,27 @@ class QueryEngine:
             elif parsed.intent == QueryIntent.LIST_ENTITIES:
                 response = await self._handle_list_entities(parsed)
             elif parsed.intent == QueryIntent.SEARCH:
-                response = await self._handle_search(parsed)
+                response = await self._handle_search(parsed, offset)
             elif parsed.intent == QueryIntent.AGGREGATE:
                 response = await self._handle_aggregate(parsed)
             elif parsed.intent == QueryIntent.HELP:
                 response = await self._handle_help(parsed)
             else:
-                response = await self._handle_search(parsed)
+                response = await self._handle_search(parsed, offset)
 
             # Add timing
             response["response_time_ms"] = (time.time() - start_time) * 1000
 
+            # Only searches are paged; other answers are complete
+            response.setdefault("has_more", False)
+            response.setdefault("next_offset", None)
+
             # Cache successful responses
-            if response.get("success"):
+            if response.get("success") and not offset:
                 await self._cache_response(query, company, response)
 
-            # Log query
-            await self._log_query(
+            # Log query in the background
+            self._log_query(
                 query=query,
                 company=company,
                 response=response
@@ -190,7 +208,8 @@ class QueryEngine:
         validation = await self.validator.validate_response(
             response={"data": response_data},
             source_ids=[str(entity.id)],
-            similarity_scores=[top_result.score]
+            similarity_scores=[top_result.score],
+            source_entities=[entity]
         )
 
         if validation.valid:
@@ -270,11 +289,16 @@ class QueryEngine:
             "timestamp": datetime.utcnow().isoformat()
         }
 
-    async def _handle_search(self, parsed: ParsedQuery) -> dict[str, Any]:
+    async def _handle_search(self, parsed: ParsedQuery, offset: int = 0) -> dict[str, Any]:
         """Handle SEARCH queries.
 
+        Candidates are hydrated a page at a time with one batched lookup per
+        page, stopping once result_cap entities pass the filters. The rest
+        can be fetched by passing ``next_offset`` back as ``offset``.
+
         Args:
             parsed: Parsed query
+            offset: Search candidates to skip
 
         Returns:
             Query response
@@ -291,7 +315,7 @@ class QueryEngine:
             query=parsed.original_query,
             company_id=search_company_id,  # Only pass numeric IDs
             entity_type=parsed.entity_type,
-            limit=200,  # No limit for testing - get ALL results
+            limit=settings.search_candidate_limit,
             min_score=0.0  # Accept ALL results regardless of score
         )
         logger.info(f"Search returned {len(search_results)} results")
@@ -305,8 +329,10 @@ class QueryEngine:
         # Get full entity data for results
         result_data = []
         source_ids = []
+        source_entities = []
         scores = []
         company_name = getattr(parsed, 'company_name', None)
+        position = max(0, offset)
 
         async with db_manager.get_session() as session:
             uow = UnitOfWork(session)
@@ -320,10 +346,22 @@ class QueryEngine:
                 # We have a company name but couldn't resolve it to ID
                 company_name_filter = parsed.company.lower()
             
-            for result in search_results:  # Process all results
-                entity = await uow.itglue.get_by_id(result.entity_id)
+            while position < len(search_results) and len(result_data) < self.result_cap:
+                page = search_results[position:position + self.result_cap]
+                entities = await uow.itglue.get_by_ids(
+                    [str(result.entity_id) for result in page]
+                )
+                entities_by_id = {str(entity.id): entity for entity in entities}
+
+                for result in page:
+                    if len(result_data) >= self.result_cap:
+                        break
+                    position += 1
+
+                    entity = entities_by_id.get(str(result.entity_id))
+                    if not entity:
+                        continue
 
-                if entity:
                     # Filter by organization ID if we have a resolved numeric ID
                     if company_id_resolved and hasattr(entity, 'organization_id'):
                         # Compare numeric IDs
@@ -354,19 +392,18 @@ class QueryEngine:
                         )
                     })
                     source_ids.append(str(entity.id))
+                    source_entities.append(entity)
                     scores.append(result.score)
-                    
-                    # NO LIMIT for testing - show ALL results
-                    # if len(result_data) >= 20:
-                    #     break
 
+        has_more = position < len(search_results)
         logger.info(f"After filtering, returning {len(result_data)} results")
 
-        # Validate response
+        # Validate response against the entities loaded above
         validation = await self.validator.validate_response(
             response={"data": result_data},
             source_ids=source_ids,
-            similarity_scores=scores
+            similarity_scores=scores,
+            source_entities=source_entities
         )
 
         if validation.valid:
@@ -375,6 +412,9 @@ class QueryEngine:
                 "query": parsed.original_query,
                 "data": result_data,
                 "total_results": len(search_results),
+                "offset": offset,
+                "next_offset": position if has_more else None,
+                "has_more": has_more,
                 "confidence": validation.confidence,
                 "source_ids": source_ids,
                 "timestamp": datetime.utcnow().isoformat()
@@ -583,13 +623,13 @@ class QueryEngine:
         except Exception as e:
             logger.warning(f"Failed to cache response: {e}")
 
-    async def _log_query(
+    def _log_query(
         self,
         query: str,
         company: Optional[str],
         response: dict[str, Any]
     ):
-        """Log query for audit.
+        """Queue query for the audit log.
 
         Args:
             query: Query string
@@ -597,22 +637,14 @@ class QueryEngine:
             response: Query response
         """
         try:
-            async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-
-                await uow.query_log.log_query(
-                    query=query,
-                    company=company,
-                    response=response,
-                    confidence_score=response.get("confidence"),
-                    source_ids=response.get("source_ids"),
-                    response_time_ms=response.get("response_time_ms")
-                )
-
-                await uow.commit()
-
+            self.audit_logger.log(query=query, company=company, response=response)
         except Exception as e:
             logger.error(f"Failed to log query: {e}")
+
+    async def close(self):
+        """Write pending audit records and stop background tasks."""
+        await self.audit_logger.close()
+        await self.org_directory.close()
     
     async def _resolve_company_to_id(self, company: str) -> Optional[str]:
         """Resolve company name to IT Glue organization ID.
@@ -623,63 +655,23 @@ class QueryEngine:
         Returns:
             Organization ID or None if not found
         """
-        # Check cache first
-        if company in self._company_cache:
-            return self._company_cache[company]
-        
         # If already looks like an ID (numeric), return as-is
         if company.isdigit():
             return company
-            
+
         try:
-            # First try exact search with API filter
-            orgs = await self.itglue_client.get_organizations(
-                filters={"name": company}
-            )
-            
-            # If no results from filtered search, get all organizations for fuzzy matching
-            if not orgs:
-                logger.debug(f"No exact match for '{company}', trying fuzzy search")
-                orgs = await self.itglue_client.get_organizations()
-            
-            if orgs:
-                # The response is a list of Organization objects
-                # Look for exact match first
-                for org in orgs:
-                    org_name = org.name if hasattr(org, 'name') else org.get('name', '')
-                    org_id = org.id if hasattr(org, 'id') else org.get('id')
-                    
-                    if org_name and org_name.lower() == company.lower():
-                        if org_id:
-                            self._company_cache[company] = str(org_id)
-                            logger.info(f"Resolved company '{company}' to ID: {org_id} (exact match)")
-                            return str(org_id)
-                
-                # If no exact match, try partial match (company name contained in org name)
-                for org in orgs:
-                    org_name = org.name if hasattr(org, 'name') else org.get('name', '')
-                    org_id = org.id if hasattr(org, 'id') else org.get('id')
-                    
-                    if org_name and company.lower() in org_name.lower():
-                        if org_id:
-                            self._company_cache[company] = str(org_id)
-                            logger.info(f"Resolved company '{company}' to ID: {org_id} (partial match: '{org_name}')")
-                            return str(org_id)
-                
-                # Try reverse partial match (org name contained in company name)
-                for org in orgs:
-                    org_name = org.name if hasattr(org, 'name') else org.get('name', '')
-                    org_id = org.id if hasattr(org, 'id') else org.get('id')
-                    
-                    if org_name and org_name.lower() in company.lower():
-                        if org_id:
-                            self._company_cache[company] = str(org_id)
-                            logger.info(f"Resolved company '{company}' to ID: {org_id} (reverse match: '{org_name}')")
-                            return str(org_id)
-            
+            match = await self.org_directory.resolve(company, fuzzy=False)
+            if match:
+                org_id = str(match.organization.id)
+                logger.info(
+                    f"Resolved company '{company}' to ID: {org_id} "
+                    f"({match.match_type} match: '{match.organization.name}')"
+                )
+                return org_id
+
             logger.warning(f"Could not find organization for company: {company}")
             return None
-            
+
         except Exception as e:
             logger.error(f"Error resolving company to ID: {e}")
             return None
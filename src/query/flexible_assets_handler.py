@@ -5,9 +5,12 @@ from difflib import SequenceMatcher
 from typing import Any, Optional
 
 from src.cache.manager import CacheManager
-from src.services.itglue.client import ITGlueClient
+from src.services.itglue.client import ITGlueClient, find_flexible_asset_type
 from src.services.itglue.models import FlexibleAsset, FlexibleAssetType
 
+from .handler_cache import get_flexible_asset_types
+from .organization_directory import OrganizationDirectory
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,16 +20,19 @@ class FlexibleAssetsHandler:
     def __init__(
         self,
         itglue_client: ITGlueClient,
-        cache_manager: Optional[CacheManager] = None
+        cache_manager: Optional[CacheManager] = None,
+        org_directory: Optional[OrganizationDirectory] = None
     ):
         """Initialize flexible assets handler.
 
         Args:
             itglue_client: IT Glue API client
             cache_manager: Optional cache manager
+            org_directory: Shared organization directory
         """
         self.client = itglue_client
         self.cache = cache_manager
+        self.directory = org_directory or OrganizationDirectory(itglue_client)
 
     async def list_all_flexible_assets(
         self,
@@ -56,10 +62,10 @@ class FlexibleAssetsHandler:
             asset_type_name = asset_type
 
             if asset_type:
-                asset_type_obj = await self.client.get_flexible_asset_type_by_name(asset_type)
+                all_types = await get_flexible_asset_types(self.cache, self.client)
+                asset_type_obj = find_flexible_asset_type(all_types, asset_type)
                 if not asset_type_obj:
                     # Try to find similar asset types
-                    all_types = await self.client.get_flexible_asset_types(include_fields=False)
                     suggestions = self._find_similar_types(asset_type, all_types)
 
                     return {
@@ -81,7 +87,7 @@ class FlexibleAssetsHandler:
             else:
                 # Get all assets for all organizations (fallback)
                 assets = []
-                organizations = await self.client.get_organizations()
+                organizations = await self.directory.get_organizations()
                 for org in organizations[:5]:  # Limit to first 5 orgs for performance
                     try:
                         org_assets = await self.client.get_all_flexible_assets_for_org(org.id)
@@ -141,37 +147,25 @@ class FlexibleAssetsHandler:
 
         try:
             # Find the organization
-            organizations = await self.client.get_organizations(
-                filters={"name": organization}
-            )
-
-            if not organizations:
-                # Try fuzzy match
-                all_orgs = await self.client.get_organizations()
-                org_match = self._find_best_match(
-                    organization,
-                    [(org.id, org.name) for org in all_orgs]
-                )
-
-                if not org_match:
-                    return {
-                        "success": False,
-                        "error": f"Organization '{organization}' not found",
-                        "assets": []
-                    }
+            match = await self.directory.resolve(organization)
+            if not match:
+                return {
+                    "success": False,
+                    "error": f"Organization '{organization}' not found",
+                    "assets": []
+                }
 
-                org_id = org_match[0]
-                org_name = org_match[1]
-            else:
-                org_id = organizations[0].id
-                org_name = organizations[0].name
+            org_id = match.organization.id
+            org_name = match.organization.name
 
             # Get asset type ID if specified
             asset_type_id = None
             asset_type_name = asset_type
 
             if asset_type:
-                asset_type_obj = await self.client.get_flexible_asset_type_by_name(asset_type)
+                asset_type_obj = find_flexible_asset_type(
+                    await get_flexible_asset_types(self.cache, self.client), asset_type
+                )
                 if asset_type_obj:
                     asset_type_id = asset_type_obj.id
                     asset_type_name = asset_type_obj.name
@@ -234,7 +228,9 @@ class FlexibleAssetsHandler:
             # Get asset type ID if specified
             asset_type_id = None
             if asset_type:
-                asset_type_obj = await self.client.get_flexible_asset_type_by_name(asset_type)
+                asset_type_obj = find_flexible_asset_type(
+                    await get_flexible_asset_types(self.cache, self.client), asset_type
+                )
                 if asset_type_obj:
                     asset_type_id = asset_type_obj.id
 
@@ -247,7 +243,7 @@ class FlexibleAssetsHandler:
             else:
                 # Get assets from all organizations (performance limited)
                 all_assets = []
-                organizations = await self.client.get_organizations()
+                organizations = await self.directory.get_organizations()
                 for org in organizations[:3]:  # Limit to first 3 orgs for search performance
                     try:
                         org_assets = await self.client.get_all_flexible_assets_for_org(org.id)
@@ -316,7 +312,7 @@ class FlexibleAssetsHandler:
 
         try:
             # Get all asset types
-            asset_types = await self.client.get_flexible_asset_types(include_fields=False)
+            asset_types = await get_flexible_asset_types(self.cache, self.client)
 
             # Common asset type names to look for
             common_names = [
@@ -423,18 +419,16 @@ class FlexibleAssetsHandler:
                 }
 
             # Get asset type details
-            asset_type = await self.client.get_flexible_asset_type_by_name(
-                asset.flexible_asset_type_id
+            asset_types = await get_flexible_asset_types(self.cache, self.client)
+            asset_type = next(
+                (t for t in asset_types if t.id == asset.flexible_asset_type_id), None
             )
 
             # Get organization details if available
             org_name = None
             if asset.organization_id:
-                try:
-                    org = await self.client.get_organization(asset.organization_id)
-                    org_name = org.name
-                except:
-                    pass
+                org = await self.directory.get(asset.organization_id)
+                org_name = org.name if org else None
 
             # Format detailed response
             result = {
@@ -539,37 +533,3 @@ class FlexibleAssetsHandler:
                 suggestions.append(asset_type.name)
 
         return suggestions[:5]  # Return top 5 suggestions
-
-    def _find_best_match(
-        self,
-        query: str,
-        candidates: list[tuple]
-    ) -> Optional[tuple]:
-        """Find best matching candidate using fuzzy matching.
-
-        Args:
-            query: Search query
-            candidates: List of (id, name) tuples
-
-        Returns:
-            Best matching tuple or None
-        """
-        if not candidates:
-            return None
-
-        query_lower = query.lower()
-        best_match = None
-        best_score = 0
-
-        for candidate_id, candidate_name in candidates:
-            score = SequenceMatcher(
-                None,
-                query_lower,
-                candidate_name.lower()
-            ).ratio()
-
-            if score > best_score and score > 0.6:
-                best_score = score
-                best_match = (candidate_id, candidate_name)
-
-        return best_match
@@ -5,6 +5,7 @@ import json
 import logging
 import re
 import time
+from collections import Counter, OrderedDict, defaultdict
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from pathlib import Path
@@ -34,6 +35,205 @@ class EnhancedMatchResult(MatchResult):
     from_cache: bool = False  # Cache hit indicator
 
 
+# Candidates re-ranked with the full strategy set per indexed lookup
+DEFAULT_SHORTLIST_SIZE = 200
+
+# Candidate lists whose indexes are kept for reuse by match_organization
+MAX_CACHED_INDEXES = 4
+
+
+@dataclass
+class IndexedCandidate:
+    """A candidate with its matching features precomputed."""
+    key: int
+    entity_id: Optional[str]
+    name: str
+    normalized: str
+    words: frozenset[str]
+    acronym: Optional[str]
+    metaphone: Optional[str]
+    soundex: Optional[str]
+
+
+def _trigrams(text: str) -> set[str]:
+    """Character trigrams of a string (the string itself if shorter)."""
+    if len(text) < 3:
+        return {text} if text else set()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CandidateIndex:
+    """Precomputed matching features and postings for a set of candidates.
+
+    Each candidate is normalized once and indexed by normalized name,
+    acronym, metaphone, soundex, words and character trigrams. A lookup
+    uses the postings to collect a shortlist of plausible candidates, which
+    ``FuzzyMatcher.match_indexed`` then re-ranks with the full strategy set
+    instead of scoring every candidate.
+    """
+
+    def __init__(
+        self,
+        matcher: "FuzzyMatcher",
+        candidates: Optional[list[dict[str, str]]] = None,
+        shortlist_size: int = DEFAULT_SHORTLIST_SIZE
+    ):
+        """Initialize candidate index.
+
+        Args:
+            matcher: Matcher whose normalization and phonetics are used
+            candidates: Candidates with 'name' and 'id' to index
+            shortlist_size: Candidates re-ranked per lookup
+        """
+        self.matcher = matcher
+        self.shortlist_size = shortlist_size
+
+        self._entries: dict[int, IndexedCandidate] = {}
+        self._keys_by_id: dict[Optional[str], list[int]] = defaultdict(list)
+        self._next_key = 0
+
+        self._normalized: dict[str, set[int]] = defaultdict(set)
+        self._acronyms: dict[str, set[int]] = defaultdict(set)
+        self._metaphones: dict[str, set[int]] = defaultdict(set)
+        self._soundexes: dict[str, set[int]] = defaultdict(set)
+        self._words: dict[str, set[int]] = defaultdict(set)
+        self._grams: dict[str, set[int]] = defaultdict(set)
+
+        for candidate in candidates or ():
+            self.add(candidate)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, candidate: dict[str, str]) -> IndexedCandidate:
+        """Index a candidate.
+
+        Args:
+            candidate: Candidate with 'name' and 'id'
+
+        Returns:
+            The indexed candidate
+        """
+        name = candidate.get('name', '')
+        normalized = self.matcher._normalize_organization(name)
+        words = normalized.split()
+        metaphone, soundex = self.matcher._phonetic_codes(normalized)
+
+        entry = IndexedCandidate(
+            key=self._next_key,
+            entity_id=candidate.get('id'),
+            name=name,
+            normalized=normalized,
+            words=frozenset(words),
+            acronym=''.join(w[0] for w in words) if len(words) > 1 else None,
+            metaphone=metaphone,
+            soundex=soundex
+        )
+        self._next_key += 1
+
+        self._entries[entry.key] = entry
+        self._keys_by_id[entry.entity_id].append(entry.key)
+        for postings, values in self._postings(entry):
+            for value in values:
+                postings[value].add(entry.key)
+        return entry
+
+    def remove(self, entity_id: Optional[str]) -> int:
+        """Remove every candidate with an ID.
+
+        Args:
+            entity_id: Candidate ID
+
+        Returns:
+            Number of candidates removed
+        """
+        keys = self._keys_by_id.pop(entity_id, [])
+        for key in keys:
+            entry = self._entries.pop(key)
+            for postings, values in self._postings(entry):
+                for value in values:
+                    posting = postings.get(value)
+                    if posting is not None:
+                        posting.discard(key)
+                        if not posting:
+                            del postings[value]
+        return len(keys)
+
+    def _postings(self, entry: IndexedCandidate) -> list[tuple[dict[str, set[int]], list[str]]]:
+        """Postings an entry belongs to, paired with its keys in each."""
+        return [
+            (self._normalized, [entry.normalized]),
+            (self._acronyms, [entry.acronym] if entry.acronym else []),
+            (self._metaphones, [entry.metaphone] if entry.metaphone else []),
+            (self._soundexes, [entry.soundex] if entry.soundex else []),
+            (self._words, list(entry.words)),
+            (self._grams, list(_trigrams(entry.normalized))),
+        ]
+
+    def shortlist(
+        self,
+        normalized: str,
+        metaphone: Optional[str] = None,
+        soundex: Optional[str] = None
+    ) -> list[IndexedCandidate]:
+        """Collect the candidates worth scoring for a normalized input.
+
+        Exact, alias and acronym hits rank first, then phonetic and whole-word
+        hits, then candidates sharing the most trigrams. Postings covering
+        a large share of the index say little about a match and are skipped.
+
+        Args:
+            normalized: Normalized input
+            metaphone: Metaphone code of the input
+            soundex: Soundex code of the input
+
+        Returns:
+            Up to shortlist_size candidates in insertion order
+        """
+        if len(self._entries) <= self.shortlist_size:
+            return list(self._entries.values())
+
+        max_posting = max(self.shortlist_size, len(self._entries) // 4)
+        votes: Counter = Counter()
+
+        def vote(keys: Optional[set[int]], weight: int, always: bool = False):
+            if keys and (always or len(keys) <= max_posting):
+                for key in keys:
+                    votes[key] += weight
+
+        vote(self._normalized.get(normalized), 1000, always=True)
+        for alias in self.matcher.company_aliases.get(normalized, ()):
+            vote(self._normalized.get(alias), 1000, always=True)
+        vote(self._acronyms.get(normalized), 500, always=True)
+        for expansion in self.matcher.acronym_map.get(normalized, ()):
+            vote(self._containing(expansion), 500, always=True)
+
+        if metaphone:
+            vote(self._metaphones.get(metaphone), 200)
+        if soundex:
+            vote(self._soundexes.get(soundex), 50)
+        for word in set(normalized.split()):
+            vote(self._words.get(word), 10)
+
+        grams = sorted(
+            (self._grams[gram] for gram in _trigrams(normalized) if gram in self._grams),
+            key=len
+        )
+        selective = [keys for keys in grams if len(keys) <= max_posting] or grams[:1]
+        for keys in selective:
+            vote(keys, 1, always=True)
+
+        keys = sorted(key for key, _ in votes.most_common(self.shortlist_size))
+        return [self._entries[key] for key in keys]
+
+    def _containing(self, text: str) -> set[int]:
+        """Keys of candidates whose normalized name may contain text."""
+        postings = [self._grams.get(gram) for gram in _trigrams(text)]
+        if not postings or not all(postings):
+            return set()
+        return set.intersection(*postings)
+
+
 class FuzzyMatcher:
     """Advanced fuzzy matching for IT Glue entities."""
 
@@ -42,6 +242,8 @@ class FuzzyMatcher:
         self.cache_manager = cache_manager
         self.dict_cache = {}  # In-memory cache for dictionaries
         self.organization_cache = {}
+        # Candidate indexes reused across match_organization calls
+        self._indexes: OrderedDict[tuple, CandidateIndex] = OrderedDict()
 
         # Load dictionaries with JSON fallback
         self.acronym_map = self._build_acronym_map()
@@ -225,6 +427,7 @@ class FuzzyMatcher:
         self.it_terms = self._load_or_build_it_dictionary()
         self.company_aliases = self._load_company_aliases()
         self.dict_cache.clear()  # Clear cache after reload
+        self._indexes.clear()  # Indexes hold names normalized with the old dictionaries
         logger.info("Dictionaries reloaded successfully")
 
     async def match_organization_cached(
@@ -312,30 +515,73 @@ class FuzzyMatcher:
             candidates: List of candidate organizations with 'name' and 'id'
             threshold: Minimum similarity threshold
 
+        Returns:
+            Sorted list of match results
+        """
+        return self.match_indexed(input_name, self._index_for(candidates), threshold)
+
+    def build_index(
+        self,
+        candidates: list[dict[str, str]],
+        shortlist_size: int = DEFAULT_SHORTLIST_SIZE
+    ) -> CandidateIndex:
+        """Build a reusable candidate index.
+
+        Args:
+            candidates: List of candidate organizations with 'name' and 'id'
+            shortlist_size: Candidates re-ranked per lookup
+
+        Returns:
+            Index for use with match_indexed
+        """
+        return CandidateIndex(self, candidates, shortlist_size)
+
+    def match_indexed(
+        self,
+        input_name: str,
+        index: CandidateIndex,
+        threshold: float = 0.7,
+        limit: int = 5
+    ) -> list[MatchResult]:
+        """
+        Match input organization name against an indexed candidate set.
+
+        Args:
+            input_name: User input organization name
+            index: Candidate index
+            threshold: Minimum similarity threshold
+            limit: Maximum number of results
+
         Returns:
             Sorted list of match results
         """
         input_normalized = self._normalize_organization(input_name)
+        input_words = set(input_normalized.split())
+        input_codes = self._phonetic_codes(input_normalized)
         results = []
 
-        for candidate in candidates:
-            candidate_name = candidate.get('name', '')
-            candidate_normalized = self._normalize_organization(candidate_name)
+        for entry in index.shortlist(input_normalized, *input_codes):
+            candidate_normalized = entry.normalized
 
             # Try different matching strategies
-            strategies = [
-                ('exact', self._exact_match),
-                ('fuzzy', self._fuzzy_match),
-                ('phonetic', self._phonetic_match),
-                ('acronym', self._acronym_match),
-                ('partial', self._partial_match)
+            scores = [
+                ('exact', self._exact_match(input_normalized, candidate_normalized)),
+                ('fuzzy', self._fuzzy_match(input_normalized, candidate_normalized)),
+                ('phonetic', self._phonetic_score(
+                    input_codes, (entry.metaphone, entry.soundex)
+                )),
+                ('acronym', self._acronym_score(
+                    input_normalized, candidate_normalized, entry.acronym
+                )),
+                ('partial', self._partial_score(
+                    input_normalized, input_words, candidate_normalized, entry.words
+                ))
             ]
 
             best_score = 0
             best_type = None
 
-            for match_type, match_func in strategies:
-                score = match_func(input_normalized, candidate_normalized)
+            for match_type, score in scores:
                 if score > best_score:
                     best_score = score
                     best_type = match_type
@@ -343,17 +589,34 @@ class FuzzyMatcher:
             if best_score >= threshold:
                 results.append(MatchResult(
                     original=input_name,
-                    matched=candidate_name,
+                    matched=entry.name,
                     score=best_score,
                     match_type=best_type,
                     confidence=self._calculate_confidence(best_score, best_type),
-                    entity_id=candidate.get('id'),
+                    entity_id=entry.entity_id,
                     metadata={'normalized': candidate_normalized}
                 ))
 
         # Sort by score descending
         results.sort(key=lambda x: (x.score, x.confidence), reverse=True)
-        return results[:5]  # Return top 5 matches
+        return results[:limit]
+
+    def _index_for(self, candidates: list[dict[str, str]]) -> CandidateIndex:
+        """Get the index for a candidate list, building it on first use."""
+        # The pairs themselves are the key, so different lists never share an index
+        fingerprint = tuple(
+            (candidate.get('id'), candidate.get('name')) for candidate in candidates
+        )
+
+        index = self._indexes.get(fingerprint)
+        if index is None:
+            index = self.build_index(candidates)
+            self._indexes[fingerprint] = index
+            while len(self._indexes) > MAX_CACHED_INDEXES:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(fingerprint)
+        return index
 
     def _normalize_organization(self, name: str) -> str:
         """Normalize organization name for matching."""
@@ -397,36 +660,65 @@ class FuzzyMatcher:
         if not input_str or not candidate:
             return 0.0
 
-        try:
-            # Use Double Metaphone for better phonetic matching
-            input_metaphone = jellyfish.metaphone(input_str)
-            candidate_metaphone = jellyfish.metaphone(candidate)
+        return self._phonetic_score(
+            self._phonetic_codes(input_str),
+            self._phonetic_codes(candidate)
+        )
 
-            # Handle None returns from jellyfish
-            if input_metaphone is None or candidate_metaphone is None:
-                return 0.0
+    def _phonetic_codes(self, text: str) -> tuple[Optional[str], Optional[str]]:
+        """Get the metaphone and soundex codes of a string."""
+        if not text:
+            return None, None
 
-            if input_metaphone == candidate_metaphone:
-                return 0.9  # High score but not perfect
+        try:
+            metaphone = jellyfish.metaphone(text)
+        except Exception as e:
+            logger.debug(f"Phonetic matching error: {e}")
+            return None, None
 
-            # Try Soundex as fallback
-            try:
-                input_soundex = jellyfish.soundex(input_str)
-                candidate_soundex = jellyfish.soundex(candidate)
+        try:
+            soundex = jellyfish.soundex(text)
+        except Exception:
+            soundex = None
 
-                if input_soundex == candidate_soundex:
-                    return 0.85
-            except:
-                pass
+        return metaphone, soundex
 
-            # Partial phonetic match
-            return SequenceMatcher(None, input_metaphone, candidate_metaphone).ratio() * 0.8
-        except Exception as e:
-            logger.debug(f"Phonetic matching error: {e}")
+    def _phonetic_score(
+        self,
+        input_codes: tuple[Optional[str], Optional[str]],
+        candidate_codes: tuple[Optional[str], Optional[str]]
+    ) -> float:
+        """Score phonetic similarity from precomputed codes."""
+        input_metaphone, input_soundex = input_codes
+        candidate_metaphone, candidate_soundex = candidate_codes
+
+        # Handle None returns from jellyfish
+        if input_metaphone is None or candidate_metaphone is None:
             return 0.0
 
+        if input_metaphone == candidate_metaphone:
+            return 0.9  # High score but not perfect
+
+        # Try Soundex as fallback
+        if input_soundex is not None and input_soundex == candidate_soundex:
+            return 0.85
+
+        # Partial phonetic match
+        return SequenceMatcher(None, input_metaphone, candidate_metaphone).ratio() * 0.8
+
     def _acronym_match(self, input_str: str, candidate: str) -> float:
         """Check if input is an acronym of candidate."""
+        words = candidate.split()
+        acronym = ''.join(w[0] for w in words if w) if len(words) > 1 else None
+        return self._acronym_score(input_str, candidate, acronym)
+
+    def _acronym_score(
+        self,
+        input_str: str,
+        candidate: str,
+        acronym: Optional[str]
+    ) -> float:
+        """Score an acronym match given the candidate's precomputed acronym."""
         input_lower = input_str.lower()
 
         # Check acronym map
@@ -436,16 +728,25 @@ class FuzzyMatcher:
                     return 0.95
 
         # Check if input could be acronym of candidate
-        words = candidate.split()
-        if len(words) > 1:
-            acronym = ''.join(w[0] for w in words if w)
-            if input_lower == acronym.lower():
-                return 0.85
+        if acronym and input_lower == acronym.lower():
+            return 0.85
 
         return 0.0
 
     def _partial_match(self, input_str: str, candidate: str) -> float:
         """Check for partial/substring match."""
+        return self._partial_score(
+            input_str, set(input_str.split()), candidate, set(candidate.split())
+        )
+
+    def _partial_score(
+        self,
+        input_str: str,
+        input_words: set[str],
+        candidate: str,
+        candidate_words: set[str]
+    ) -> float:
+        """Score a partial match given precomputed word sets."""
         if not input_str or not candidate:
             return 0.0
 
@@ -456,9 +757,6 @@ class FuzzyMatcher:
             return len(candidate) / len(input_str) * 0.9
 
         # Check word-level partial match
-        input_words = set(input_str.split())
-        candidate_words = set(candidate.split())
-
         if input_words and candidate_words:
             intersection = input_words & candidate_words
             union = input_words | candidate_words
@@ -523,6 +821,7 @@ class FuzzyMatcher:
             'hit_rate': hit_rate,
             'dict_cache_size': len(self.dict_cache),
             'org_cache_size': len(self.organization_cache),
+            'candidate_indexes': len(self._indexes),
             'common_mistakes_count': len(self.common_mistakes),
             'it_terms_count': len(self.it_terms)
         }
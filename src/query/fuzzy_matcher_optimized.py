@@ -1,17 +1,20 @@
 """Optimized fuzzy matching system with performance enhancements."""
 
 import asyncio
+import heapq
 import json
 import logging
 import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Any, Optional
 
 import jellyfish
+import numpy as np
 
 # Try to import RapidFuzz for better performance
 try:
@@ -23,6 +26,95 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Entries kept by each per-matcher LRU cache
+NORMALIZATION_CACHE_SIZE = 10000
+PHONETIC_CACHE_SIZE = 5000
+
+# Normalized candidate sets kept for reuse across batch matches
+MAX_CACHED_CANDIDATE_SETS = 4
+
+# Most a phonetic match can add to a fuzzy score (0.9 phonetic at 0.3 weight)
+MAX_PHONETIC_BONUS = 0.27
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Bounded least-recently-used cache that tracks its hit rate.
+
+    Safe to share between threads; async matches run in an executor.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize cache.
+
+        Args:
+            max_size: Maximum entries before the least recently used is evicted
+        """
+        self.max_size = max(1, max_size)
+        self._entries: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get a cached value, marking it as recently used."""
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Any, value: Any):
+        """Cache a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get size and hit-rate statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+def _ratio_all(query: str, choices: list[str]) -> list[float]:
+    """Score choices against a query with difflib."""
+    matcher = SequenceMatcher(None, "", query)
+    scores = []
+    for choice in choices:
+        # SequenceMatcher caches details about seq2, so the query goes there
+        matcher.set_seq1(choice)
+        scores.append(matcher.ratio())
+    return scores
+
 
 @dataclass
 class OptimizedMatchResult:
@@ -45,9 +137,9 @@ class OptimizedFuzzyMatcher:
     Performance optimizations:
     - Early termination for exact matches
     - RapidFuzz library for 10x faster fuzzy matching
-    - Parallel processing for large candidate sets
+    - Batch scoring of large candidate sets, normalized once per set
     - Optimized threshold checking order
-    - Caching of normalized strings
+    - Bounded LRU caches of normalized strings and phonetic scores
     - Pre-compiled regex patterns
     """
 
@@ -64,25 +156,25 @@ class OptimizedFuzzyMatcher:
         Args:
             cache_manager: Cache manager for results
             use_parallel: Enable parallel processing for large sets
-            parallel_threshold: Minimum candidates for parallel processing
-            max_workers: Maximum worker threads
+            parallel_threshold: Minimum candidates for batch scoring
+            max_workers: Maximum native threads used by RapidFuzz batch scoring
         """
         self.cache_manager = cache_manager
         self.use_parallel = use_parallel
         self.parallel_threshold = parallel_threshold
         self.max_workers = max_workers
 
-        # Thread pool for parallel processing
-        self.executor = ThreadPoolExecutor(max_workers=max_workers) if use_parallel else None
-
         # Pre-compiled patterns for better performance
         self.normalization_pattern = re.compile(r'[^\w\s&-]')
         self.whitespace_pattern = re.compile(r'\s+')
 
-        # Caches for performance
-        self.normalization_cache = {}
-        self.phonetic_cache = {}
-        self.acronym_cache = {}
+        # Bounded caches for performance
+        self.normalization_cache = LRUCache(NORMALIZATION_CACHE_SIZE)
+        self.phonetic_cache = LRUCache(PHONETIC_CACHE_SIZE)
+
+        # Candidate sets normalized for batch matching, by their names
+        self._candidate_sets: OrderedDict[tuple, tuple[list[str], np.ndarray]] = OrderedDict()
+        self._candidate_sets_lock = threading.Lock()
 
         # Load dictionaries
         self._load_dictionaries()
@@ -148,8 +240,19 @@ class OptimizedFuzzyMatcher:
             return ""
 
         # Check cache first
-        if text in self.normalization_cache:
-            return self.normalization_cache[text]
+        cached = self.normalization_cache.get(text)
+        if cached is not None:
+            return cached
+
+        normalized = self._normalize_uncached(text)
+        self.normalization_cache.put(text, normalized)
+
+        return normalized
+
+    def _normalize_uncached(self, text: str) -> str:
+        """Normalize text without consulting the normalization cache."""
+        if not text:
+            return ""
 
         # Fast normalization
         normalized = text.lower().strip()
@@ -169,13 +272,7 @@ class OptimizedFuzzyMatcher:
         normalized = self.normalization_pattern.sub('', normalized)
 
         # Normalize whitespace (pre-compiled pattern)
-        normalized = self.whitespace_pattern.sub(' ', normalized)
-
-        # Cache result
-        if len(self.normalization_cache) < 10000:  # Limit cache size
-            self.normalization_cache[text] = normalized
-
-        return normalized
+        return self.whitespace_pattern.sub(' ', normalized)
 
     def _exact_match_optimized(self, input_str: str, candidate: str) -> float:
         """
@@ -225,8 +322,9 @@ class OptimizedFuzzyMatcher:
         # Generate cache key
         cache_key = f"{input_str}:{candidate}"
 
-        if cache_key in self.phonetic_cache:
-            return self.phonetic_cache[cache_key]
+        cached = self.phonetic_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         score = 0.0
 
@@ -244,12 +342,84 @@ class OptimizedFuzzyMatcher:
         except:
             pass
 
-        # Cache result
-        if len(self.phonetic_cache) < 5000:
-            self.phonetic_cache[cache_key] = score
+        self.phonetic_cache.put(cache_key, score)
 
         return score
 
+    def _fuzzy_scores_batch(
+        self,
+        input_normalized: str,
+        candidates_normalized: list[str],
+        score_cutoff: float
+    ) -> tuple[np.ndarray, str]:
+        """
+        Fuzzy-score a whole candidate array in one batch.
+
+        With RapidFuzz the array is scored natively by ``process.cdist``
+        across ``max_workers`` threads. Without it, difflib scores each
+        candidate in turn.
+
+        Args:
+            input_normalized: Normalized input string
+            candidates_normalized: Normalized candidate strings
+            score_cutoff: Scores below this may be reported as 0.0
+
+        Returns:
+            Similarity score (0.0 to 1.0) per candidate and the algorithm used
+        """
+        if RAPIDFUZZ_AVAILABLE:
+            workers = self.max_workers if self.use_parallel else 1
+            if workers > 1:
+                self.parallel_executions += 1
+
+            scores = process.cdist(
+                [input_normalized],
+                candidates_normalized,
+                scorer=fuzz.ratio,
+                score_cutoff=score_cutoff * 100,
+                dtype=np.float64,
+                workers=workers
+            )[0]
+            return scores / 100.0, 'rapidfuzz_batch'
+
+        return np.array(_ratio_all(input_normalized, candidates_normalized)), 'difflib_batch'
+
+    def _prepare_candidates(
+        self,
+        candidates: list[dict[str, str]]
+    ) -> tuple[list[str], np.ndarray]:
+        """
+        Get normalized names and their lengths for a candidate set.
+
+        Sets are normalized once and reused while their names are unchanged,
+        so repeated matches against the same directory skip normalization.
+
+        Args:
+            candidates: Candidate dictionaries
+
+        Returns:
+            Normalized names and an array of their lengths
+        """
+        # The names themselves are the key, so different sets never share an entry
+        fingerprint = tuple(c.get('name', '') for c in candidates)
+
+        with self._candidate_sets_lock:
+            prepared = self._candidate_sets.get(fingerprint)
+            if prepared is not None:
+                self._candidate_sets.move_to_end(fingerprint)
+                return prepared
+
+        # Normalize outside the lock; a thread racing on the same set does the same work
+        normalized = [self._normalize_uncached(c.get('name', '')) for c in candidates]
+        lengths = np.fromiter(map(len, normalized), dtype=np.int64, count=len(normalized))
+        prepared = (normalized, lengths)
+
+        with self._candidate_sets_lock:
+            self._candidate_sets[fingerprint] = prepared
+            while len(self._candidate_sets) > MAX_CACHED_CANDIDATE_SETS:
+                self._candidate_sets.popitem(last=False)
+        return prepared
+
     def _match_single_candidate(
         self,
         input_normalized: str,
@@ -267,31 +437,75 @@ class OptimizedFuzzyMatcher:
         Returns:
             Match result or None if below threshold
         """
-        candidate_name = candidate.get('name', '')
-        candidate_normalized = self._normalize_string_fast(candidate_name)
+        candidate_normalized = self._normalize_string_fast(candidate.get('name', ''))
 
         # Early termination - check exact match first (fastest)
         exact_score = self._exact_match_optimized(input_normalized, candidate_normalized)
         if exact_score == 1.0:
             self.early_terminations += 1
-            return OptimizedMatchResult(
-                original=input_normalized,
-                matched=candidate_name,
-                score=1.0,
-                match_type='exact',
-                confidence=1.0,
-                entity_id=candidate.get('id'),
-                algorithm_used='exact'
-            )
+            return self._exact_result(input_normalized, candidate)
 
         # Quick length check - if lengths are too different, skip
-        len_ratio = len(input_normalized) / len(candidate_normalized) if candidate_normalized else 0
-        if len_ratio < 0.5 or len_ratio > 2.0:
+        if not self._lengths_compatible(input_normalized, candidate_normalized):
             return None
 
         # Check fuzzy match (second fastest with RapidFuzz)
         fuzzy_score = self._fuzzy_match_optimized(input_normalized, candidate_normalized)
 
+        return self._score_candidate(
+            input_normalized,
+            candidate,
+            candidate_normalized,
+            fuzzy_score,
+            threshold,
+            'rapidfuzz' if RAPIDFUZZ_AVAILABLE else 'difflib'
+        )
+
+    def _exact_result(
+        self,
+        input_normalized: str,
+        candidate: dict[str, str]
+    ) -> OptimizedMatchResult:
+        """Build the result for an exact normalized match."""
+        return OptimizedMatchResult(
+            original=input_normalized,
+            matched=candidate.get('name', ''),
+            score=1.0,
+            match_type='exact',
+            confidence=1.0,
+            entity_id=candidate.get('id'),
+            algorithm_used='exact'
+        )
+
+    @staticmethod
+    def _lengths_compatible(input_normalized: str, candidate_normalized: str) -> bool:
+        """Whether two strings are close enough in length to be worth scoring."""
+        len_ratio = len(input_normalized) / len(candidate_normalized) if candidate_normalized else 0
+        return 0.5 <= len_ratio <= 2.0
+
+    def _score_candidate(
+        self,
+        input_normalized: str,
+        candidate: dict[str, str],
+        candidate_normalized: str,
+        fuzzy_score: float,
+        threshold: float,
+        algorithm: str
+    ) -> Optional[OptimizedMatchResult]:
+        """
+        Finish scoring a candidate given its fuzzy score.
+
+        Args:
+            input_normalized: Normalized input string
+            candidate: Candidate dictionary
+            candidate_normalized: Normalized candidate name
+            fuzzy_score: Fuzzy similarity of the two normalized strings
+            threshold: Minimum score threshold
+            algorithm: Algorithm that produced the fuzzy score
+
+        Returns:
+            Match result or None if below threshold
+        """
         # Early termination if fuzzy score is too low
         if fuzzy_score < threshold * 0.8:
             return None
@@ -307,16 +521,89 @@ class OptimizedFuzzyMatcher:
         if final_score >= threshold:
             return OptimizedMatchResult(
                 original=input_normalized,
-                matched=candidate_name,
+                matched=candidate.get('name', ''),
                 score=final_score,
                 match_type='fuzzy' if fuzzy_score > phonetic_score else 'phonetic',
                 confidence=final_score * 0.9,
                 entity_id=candidate.get('id'),
-                algorithm_used='rapidfuzz' if RAPIDFUZZ_AVAILABLE else 'difflib'
+                algorithm_used=algorithm
             )
 
         return None
 
+    def _match_batch(
+        self,
+        input_normalized: str,
+        candidates: list[dict[str, str]],
+        threshold: float,
+        top_n: int
+    ) -> list[OptimizedMatchResult]:
+        """
+        Match against a large candidate set with one batch fuzzy-scoring pass.
+
+        Thresholds and length checks are applied to the whole score array.
+        Survivors are visited best bound first and phonetic scoring stops
+        once ``top_n`` results beat every remaining bound.
+
+        Args:
+            input_normalized: Normalized input string
+            candidates: Candidate dictionaries
+            threshold: Minimum score threshold
+            top_n: Number of top matches needed
+
+        Returns:
+            Match results in candidate order
+        """
+        candidates_normalized, lengths = self._prepare_candidates(candidates)
+        scores, algorithm = self._fuzzy_scores_batch(
+            input_normalized, candidates_normalized, threshold * 0.8
+        )
+
+        found: list[tuple[int, OptimizedMatchResult]] = []
+        best: list[float] = []  # Min-heap of the top_n final scores so far
+
+        # Only identical strings score 1.0
+        for idx in np.flatnonzero(scores >= 1.0):
+            if candidates_normalized[idx] == input_normalized:
+                self.exact_match_count += 1
+                found.append((idx, self._exact_result(input_normalized, candidates[idx])))
+                heapq.heappush(best, 1.0)
+
+        len_ratio = len(input_normalized) / np.maximum(lengths, 1)
+        upper_bound = np.maximum(scores * 0.7 + MAX_PHONETIC_BONUS, scores)
+        eligible = (
+            (scores >= threshold * 0.8)
+            & (scores < 1.0)
+            & (upper_bound >= threshold)
+            & (lengths > 0)
+            & (len_ratio >= 0.5)
+            & (len_ratio <= 2.0)
+        )
+        survivors = np.flatnonzero(eligible)
+        survivors = survivors[np.argsort(-upper_bound[survivors], kind='stable')]
+
+        for idx in survivors:
+            if len(best) >= top_n and best[0] > upper_bound[idx]:
+                break
+
+            result = self._score_candidate(
+                input_normalized,
+                candidates[idx],
+                candidates_normalized[idx],
+                float(scores[idx]),
+                threshold,
+                algorithm
+            )
+            if result:
+                found.append((idx, result))
+                if len(best) < top_n:
+                    heapq.heappush(best, result.score)
+                else:
+                    heapq.heappushpop(best, result.score)
+
+        found.sort(key=lambda item: item[0])
+        return [result for _, result in found]
+
     def match_organization_optimized(
         self,
         input_name: str,
@@ -325,7 +612,13 @@ class OptimizedFuzzyMatcher:
         top_n: int = 5
     ) -> list[OptimizedMatchResult]:
         """
-        Optimized organization matching with parallel processing.
+        Optimized organization matching with batch scoring for large sets.
+
+        Every set size is scored alike: ``fuzz.ratio`` (or difflib) on
+        normalized names, plus a phonetic bonus. Sets of more than 20
+        candidates used to be scored with ``fuzz.WRatio`` on raw names when
+        RapidFuzz was installed, so their scores and rankings differ from
+        earlier releases.
 
         Args:
             input_name: Input organization name
@@ -342,59 +635,14 @@ class OptimizedFuzzyMatcher:
         # Normalize input once
         input_normalized = self._normalize_string_fast(input_name)
 
-        # Use RapidFuzz process extraction if available and suitable
-        if RAPIDFUZZ_AVAILABLE and len(candidates) > 20:
-            # Extract candidate names
-            candidate_names = [c.get('name', '') for c in candidates]
-
-            # Use RapidFuzz's optimized extraction
-            rapidfuzz_matches = process.extract(
-                input_normalized,
-                candidate_names,
-                scorer=fuzz.WRatio,
-                limit=top_n * 2,  # Get more to filter by threshold
-                score_cutoff=threshold * 100
-            )
-
-            # Convert to our result format
-            results = []
-            for match_text, score, idx in rapidfuzz_matches:
-                if score / 100.0 >= threshold:
-                    results.append(OptimizedMatchResult(
-                        original=input_name,
-                        matched=candidates[idx]['name'],
-                        score=score / 100.0,
-                        match_type='fuzzy',
-                        confidence=score / 100.0 * 0.9,
-                        entity_id=candidates[idx].get('id'),
-                        match_time_ms=(time.perf_counter() - start_time) * 1000,
-                        algorithm_used='rapidfuzz_batch'
-                    ))
-
-            return results[:top_n]
-
-        # Parallel processing for large candidate sets
-        if self.use_parallel and len(candidates) > self.parallel_threshold:
-            self.parallel_executions += 1
-
-            # Process candidates in parallel
-            futures = []
-            for candidate in candidates:
-                future = self.executor.submit(
-                    self._match_single_candidate,
-                    input_normalized,
-                    candidate,
-                    threshold
-                )
-                futures.append(future)
+        # RapidFuzz scores whole arrays natively, so it pays off on smaller sets
+        use_batch = (
+            (RAPIDFUZZ_AVAILABLE and len(candidates) > 20)
+            or (self.use_parallel and len(candidates) > self.parallel_threshold)
+        )
 
-            # Collect results
-            results = []
-            for future in futures:
-                result = future.result()
-                if result:
-                    result.match_time_ms = (time.perf_counter() - start_time) * 1000
-                    results.append(result)
+        if use_batch:
+            results = self._match_batch(input_normalized, candidates, threshold, top_n)
         else:
             # Sequential processing for small sets
             results = []
@@ -405,18 +653,20 @@ class OptimizedFuzzyMatcher:
                     threshold
                 )
                 if result:
-                    result.match_time_ms = (time.perf_counter() - start_time) * 1000
                     results.append(result)
 
                     # Early termination if we found exact match
                     if result.score == 1.0:
                         break
 
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        for result in results:
+            result.match_time_ms = elapsed_ms
+
         # Sort by score and confidence
         results.sort(key=lambda x: (x.score, x.confidence), reverse=True)
 
         # Log performance if slow
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
         if elapsed_ms > 500:
             logger.warning(
                 f"Slow fuzzy match: {elapsed_ms:.2f}ms for {len(candidates)} candidates"
@@ -468,6 +718,8 @@ class OptimizedFuzzyMatcher:
             'parallel_executions': self.parallel_executions,
             'normalization_cache_size': len(self.normalization_cache),
             'phonetic_cache_size': len(self.phonetic_cache),
+            'normalization_cache': self.normalization_cache.get_stats(),
+            'phonetic_cache': self.phonetic_cache.get_stats(),
             'rapidfuzz_available': RAPIDFUZZ_AVAILABLE,
             'parallel_enabled': self.use_parallel,
             'max_workers': self.max_workers
@@ -477,14 +729,10 @@ class OptimizedFuzzyMatcher:
         """Clear all internal caches."""
         self.normalization_cache.clear()
         self.phonetic_cache.clear()
-        self.acronym_cache.clear()
+        with self._candidate_sets_lock:
+            self._candidate_sets.clear()
         logger.info("Cleared all fuzzy matcher caches")
 
-    def __del__(self):
-        """Cleanup thread pool on deletion."""
-        if self.executor:
-            self.executor.shutdown(wait=False)
-
 
 # Performance benchmark function
 async def benchmark_fuzzy_matcher(
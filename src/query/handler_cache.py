@@ -0,0 +1,80 @@
+"""Shared result caching for query handlers."""
+
+import logging
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional
+
+from src.cache.redis_cache import QueryType
+from src.services.itglue.client import FLEXIBLE_ASSET_TYPES_NAMESPACE, ITGlueClient
+from src.services.itglue.models import FlexibleAssetType
+
+logger = logging.getLogger(__name__)
+
+
+async def get_or_fetch_result(
+    cache_manager: Any,
+    cache_key: str,
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+    query_type: QueryType = QueryType.OPERATIONAL
+) -> Optional[dict[str, Any]]:
+    """Get a handler result from the query cache, fetching it on a miss.
+
+    Concurrent misses for the same key share one fetch, and an expired
+    result is served while one caller refreshes it. Only successful results
+    are cached.
+
+    Args:
+        cache_manager: Cache manager with a ``query_cache``, or None
+        cache_key: Cache key for the result
+        fetch: Async function building the result
+        query_type: Type of query for caching strategy
+
+    Returns:
+        Result, the failed result for the caller that fetched it, or None if
+        the fetch raised or failed for another caller
+    """
+    if not (cache_manager and hasattr(cache_manager, 'query_cache')):
+        return await fetch()
+
+    failed: dict[str, Any] = {}
+
+    async def fetch_successful(query: str, params: Optional[dict[str, Any]]):
+        result = await fetch()
+        if result.get("success", True):
+            return result
+        failed.update(result)
+        return None  # Not cached
+
+    result = await cache_manager.query_cache.get_or_fetch(
+        cache_key,
+        fetch_successful,
+        query_type=query_type,
+        stale_while_revalidate=True
+    )
+    return result if result is not None else (failed or None)
+
+
+async def get_flexible_asset_types(
+    cache_manager: Any,
+    client: ITGlueClient
+) -> list[FlexibleAssetType]:
+    """Get all flexible asset types, with their fields, through the cache.
+
+    The list is cached under the ``flexible_asset_types`` namespace, whose
+    loader renews it before it expires while it is in use.
+
+    Args:
+        cache_manager: Cache manager with a ``query_cache``, or None
+        client: IT Glue API client loading the list on a miss
+
+    Returns:
+        List of asset types
+    """
+    if cache_manager and hasattr(cache_manager, 'query_cache'):
+        data = await cache_manager.query_cache.get_or_load(
+            "all", FLEXIBLE_ASSET_TYPES_NAMESPACE, client.load_flexible_asset_types
+        )
+    else:
+        data = await client.load_flexible_asset_types()
+
+    return [FlexibleAssetType(**asset_type) for asset_type in data or []]
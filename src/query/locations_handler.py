@@ -8,6 +8,9 @@ from src.cache.manager import CacheManager
 from src.services.itglue.client import ITGlueClient
 from src.services.itglue.models import Location
 
+from .handler_cache import get_or_fetch_result
+from .organization_directory import OrganizationDirectory
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,16 +20,19 @@ class LocationsHandler:
     def __init__(
         self,
         itglue_client: ITGlueClient,
-        cache_manager: Optional[CacheManager] = None
+        cache_manager: Optional[CacheManager] = None,
+        org_directory: Optional[OrganizationDirectory] = None
     ):
         """Initialize locations handler.
 
         Args:
             itglue_client: IT Glue API client
             cache_manager: Optional cache manager
+            org_directory: Shared organization directory
         """
         self.client = itglue_client
         self.cache = cache_manager
+        self.directory = org_directory or OrganizationDirectory(itglue_client)
 
     async def list_all_locations(self) -> dict[str, Any]:
         """List all available locations across all organizations.
@@ -34,20 +40,14 @@ class LocationsHandler:
         Returns:
             Dictionary with location information
         """
-        # Check cache first
         cache_key = "locations:all"
-        if self.cache and hasattr(self.cache, 'query_cache'):
-            cached = await self.cache.query_cache.get(cache_key)
-            if cached:
-                logger.debug("Returning cached all locations")
-                return cached
 
-        try:
+        async def fetch() -> dict[str, Any]:
             # Get all locations
             locations = await self.client.get_locations()
 
             # Format response
-            result = {
+            return {
                 "success": True,
                 "count": len(locations),
                 "locations": [
@@ -64,10 +64,11 @@ class LocationsHandler:
                 ]
             }
 
-            # Cache for 30 minutes
-            if self.cache and hasattr(self.cache, 'query_cache'):
-                from ..cache.redis_cache import QueryType
-                await self.cache.query_cache.set(cache_key, result, QueryType.OPERATIONAL)
+        try:
+            # Concurrent listings share one fetch of the location list
+            result = await get_or_fetch_result(self.cache, cache_key, fetch)
+            if result is None:
+                raise RuntimeError("location list unavailable")
 
             logger.info(f"Listed {len(result['locations'])} locations")
             return result
@@ -102,28 +103,15 @@ class LocationsHandler:
 
         try:
             # First, try to find the organization
-            organizations = await self.client.get_organizations(
-                filters={"name": organization}
-            )
-
-            if not organizations:
-                # Try fuzzy match
-                all_orgs = await self.client.get_organizations()
-                org_match = self._find_best_match(
-                    organization,
-                    [(org.id, org.name) for org in all_orgs]
-                )
-
-                if not org_match:
-                    return {
-                        "success": False,
-                        "error": f"Organization '{organization}' not found",
-                        "locations": []
-                    }
+            match = await self.directory.resolve(organization)
+            if not match:
+                return {
+                    "success": False,
+                    "error": f"Organization '{organization}' not found",
+                    "locations": []
+                }
 
-                org_id = org_match[0]
-            else:
-                org_id = organizations[0].id
+            org_id = match.organization.id
 
             # Get locations for the organization
             locations = await self.client.get_locations(org_id=org_id)
@@ -309,11 +297,8 @@ class LocationsHandler:
             # Get organization details if available
             org_name = None
             if location.organization_id:
-                try:
-                    org = await self.client.get_organization(location.organization_id)
-                    org_name = org.name
-                except:
-                    pass
+                org = await self.directory.get(location.organization_id)
+                org_name = org.name if org else None
 
             # Format response
             result = {
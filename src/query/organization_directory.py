@@ -0,0 +1,393 @@
+"""Shared in-process directory of IT Glue organizations."""
+
+import asyncio
+import logging
+import re
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Optional
+
+from src.config.settings import settings
+from src.services.itglue.client import ITGlueClient
+from src.services.itglue.models import Organization
+
+from .phonetic_matcher import PhoneticMatcher
+
+logger = logging.getLogger(__name__)
+
+# Minimum similarity for a fuzzy name match (same as the handlers used)
+FUZZY_THRESHOLD = 0.6
+
+# Candidates scored with SequenceMatcher per fuzzy lookup
+MAX_FUZZY_CANDIDATES = 50
+
+# Trailing words dropped when normalizing names ("Acme, Inc." == "acme")
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "llc", "llp", "ltd", "limited", "corp",
+    "corporation", "co", "company", "plc", "gmbh", "pty", "pc", "lp"
+})
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an organization name for matching.
+
+    Lowercases, spells out "&", strips punctuation and drops trailing legal
+    suffixes such as "Inc" or "LLC".
+
+    Args:
+        name: Organization name
+
+    Returns:
+        Normalized name, e.g. "acme and sons" for "Acme & Sons, Inc."
+    """
+    tokens = _NON_ALNUM.sub(" ", name.lower().replace("&", " and ")).split()
+    while len(tokens) > 1 and tokens[-1] in LEGAL_SUFFIXES:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def trigrams(text: str) -> set[str]:
+    """Get the character trigrams of a normalized name, padded at word edges."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass
+class OrganizationMatch:
+    """An organization matched to a name."""
+
+    organization: Organization
+    score: float
+    match_type: str  # id, exact, normalized, contains, contained, partial or fuzzy
+
+
+class OrganizationIndex:
+    """Immutable lookup indexes over one snapshot of organizations."""
+
+    def __init__(self, organizations: list[Organization], phonetic: PhoneticMatcher):
+        """Build indexes.
+
+        Args:
+            organizations: Organizations to index
+            phonetic: Phonetic encoder for name tokens
+        """
+        self.organizations = sorted(organizations, key=lambda o: o.name)
+        self._phonetic = phonetic
+
+        self.by_id: dict[str, Organization] = {}
+        self.exact: dict[str, Organization] = {}
+        self.normalized: dict[str, Organization] = {}
+        self._names: dict[str, str] = {}
+        self._tokens: dict[str, frozenset[str]] = {}
+        self._token_index: dict[str, set[str]] = defaultdict(set)
+        self._trigram_index: dict[str, set[str]] = defaultdict(set)
+        self._phonetic_index: dict[str, set[str]] = defaultdict(set)
+
+        for org in self.organizations:
+            org_id = str(org.id)
+            normalized = normalize_name(org.name)
+            tokens = frozenset(normalized.split())
+
+            self.by_id[org_id] = org
+            self.exact.setdefault(org.name.lower(), org)
+            self.normalized.setdefault(normalized, org)
+            self._names[org_id] = normalized
+            self._tokens[org_id] = tokens
+
+            for token in tokens:
+                self._token_index[token].add(org_id)
+                self._phonetic_index[self._phonetic.soundex(token)].add(org_id)
+            for gram in trigrams(normalized):
+                self._trigram_index[gram].add(org_id)
+
+    def __len__(self) -> int:
+        return len(self.organizations)
+
+    def resolve(self, name: str, fuzzy: bool = True) -> Optional[OrganizationMatch]:
+        """Resolve a name or ID to the best matching organization.
+
+        Tries, in order: ID, exact name, normalized name, all query words in
+        the name, all name words in the query, the query within a name or a
+        name within the query (e.g. "Acm" for "Acme Corp"), then fuzzy
+        similarity.
+
+        Args:
+            name: Organization name or ID
+            fuzzy: Whether to fall back to fuzzy matching
+
+        Returns:
+            Best match or None
+        """
+        name = name.strip()
+        if not name:
+            return None
+
+        org = self.by_id.get(name)
+        if org:
+            return OrganizationMatch(org, 1.0, "id")
+
+        org = self.exact.get(name.lower())
+        if org:
+            return OrganizationMatch(org, 1.0, "exact")
+
+        normalized = normalize_name(name)
+        org = self.normalized.get(normalized)
+        if org:
+            return OrganizationMatch(org, 1.0, "normalized")
+
+        query_tokens = frozenset(normalized.split())
+        if not query_tokens:
+            return None
+
+        # Every query word appears in the name
+        containing = set.intersection(
+            *(self._token_index.get(token, set()) for token in query_tokens)
+        )
+        if containing:
+            return self._best(normalized, containing, "contains")
+
+        # Every name word appears in the query
+        contained = {
+            org_id
+            for token in query_tokens
+            for org_id in self._token_index.get(token, ())
+            if self._tokens[org_id] <= query_tokens
+        }
+        if contained:
+            return self._best(normalized, contained, "contained")
+
+        partial = self._substring_matches(normalized)
+        if partial:
+            return self._best(normalized, partial, "partial")
+
+        if not fuzzy:
+            return None
+
+        matches = self.fuzzy_matches(name, limit=1)
+        return matches[0] if matches else None
+
+    def fuzzy_matches(
+        self,
+        name: str,
+        limit: int = 5,
+        threshold: float = FUZZY_THRESHOLD
+    ) -> list[OrganizationMatch]:
+        """Find organizations with names similar to a query.
+
+        Candidates sharing trigrams, words or word sounds with the query are
+        scored with SequenceMatcher; the rest of the directory is never
+        scanned.
+
+        Args:
+            name: Name to match
+            limit: Maximum matches
+            threshold: Minimum similarity score
+
+        Returns:
+            Matches, best first
+        """
+        normalized = normalize_name(name)
+        if not normalized:
+            return []
+
+        matches = []
+        for org_id in self._candidates(normalized):
+            score = self._score(normalized, org_id)
+            if score >= threshold:
+                matches.append(OrganizationMatch(self.by_id[org_id], score, "fuzzy"))
+
+        matches.sort(key=lambda m: m.score, reverse=True)
+        return matches[:limit]
+
+    def _candidates(self, normalized: str) -> list[str]:
+        """Get IDs of organizations that could match a normalized name."""
+        overlap: Counter = Counter()
+        for gram in trigrams(normalized):
+            overlap.update(self._trigram_index.get(gram, ()))
+
+        for token in normalized.split():
+            # Whole-word and sound-alike hits rank ahead of trigram overlap alone
+            for org_id in self._token_index.get(token, ()):
+                overlap[org_id] += 10
+            for org_id in self._phonetic_index.get(self._phonetic.soundex(token), ()):
+                overlap[org_id] += 5
+
+        return [org_id for org_id, _ in overlap.most_common(MAX_FUZZY_CANDIDATES)]
+
+    def _substring_matches(self, normalized: str) -> set[str]:
+        """Get IDs of organizations whose name contains, or is contained in, a query."""
+        grams = {normalized[i:i + 3] for i in range(len(normalized) - 2)}
+        if grams:
+            # Either string holds the other's inner trigrams, so any match shares one
+            candidates = set().union(*(self._trigram_index.get(gram, ()) for gram in grams))
+        else:
+            candidates = self._names.keys()  # Too short for trigrams
+
+        return {
+            org_id for org_id in candidates
+            if normalized in self._names[org_id] or self._names[org_id] in normalized
+        }
+
+    def _score(self, normalized: str, org_id: str) -> float:
+        """Similarity of a normalized query to an organization's name."""
+        name = self._names[org_id]
+        score = SequenceMatcher(None, normalized, name).ratio()
+        # Boost partial exact matches
+        if normalized in name:
+            score += 0.2
+        return score
+
+    def _best(self, normalized: str, org_ids: set[str], match_type: str) -> OrganizationMatch:
+        """Pick the closest of several matching organizations."""
+        org_id = max(org_ids, key=lambda i: (self._score(normalized, i), -len(self._names[i])))
+        return OrganizationMatch(
+            self.by_id[org_id], min(1.0, self._score(normalized, org_id)), match_type
+        )
+
+
+class OrganizationDirectory:
+    """Long-lived organization directory shared by query handlers.
+
+    Organizations are fetched from IT Glue once and indexed by ID, name,
+    normalized name, words, trigrams and word sounds. Lookups run against
+    the in-memory index; once it is older than ``refresh_interval`` a
+    refresh is started in the background while lookups keep using the
+    current snapshot.
+    """
+
+    def __init__(
+        self,
+        itglue_client: ITGlueClient,
+        refresh_interval: Optional[float] = None
+    ):
+        """Initialize organization directory.
+
+        Args:
+            itglue_client: IT Glue API client
+            refresh_interval: Seconds before the directory is refreshed
+        """
+        self.client = itglue_client
+        self.refresh_interval = refresh_interval or settings.org_directory_refresh_seconds
+
+        self._phonetic = PhoneticMatcher()
+        self._index: Optional[OrganizationIndex] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether organizations have been loaded."""
+        return self._index is not None
+
+    async def refresh(self) -> int:
+        """Fetch organizations and rebuild the indexes.
+
+        Returns:
+            Number of organizations loaded
+        """
+        async with self._lock:
+            return await self._load()
+
+    async def _load(self) -> int:
+        """Fetch organizations and swap in a new index."""
+        started = time.time()
+        organizations = await self.client.get_organizations()
+        self._index = OrganizationIndex(organizations, self._phonetic)
+        self._loaded_at = time.monotonic()
+
+        logger.info(
+            f"Indexed {len(organizations)} organizations in "
+            f"{(time.time() - started) * 1000:.0f}ms"
+        )
+        return len(organizations)
+
+    async def _get_index(self) -> OrganizationIndex:
+        """Get the current index, loading it on first use."""
+        if self._index is None:
+            async with self._lock:
+                if self._index is None:
+                    await self._load()
+        elif time.monotonic() - self._loaded_at > self.refresh_interval:
+            self._start_refresh()
+        return self._index
+
+    def _start_refresh(self):
+        """Refresh in the background unless a refresh is already running."""
+        if self._refresh_task and not self._refresh_task.done():
+            return
+
+        async def refresh_in_background():
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Organization directory refresh failed: {e}")
+                # Retry after another interval rather than on every lookup
+                self._loaded_at = time.monotonic()
+
+        self._refresh_task = asyncio.create_task(refresh_in_background())
+
+    async def get_organizations(self) -> list[Organization]:
+        """Get all organizations sorted by name."""
+        return (await self._get_index()).organizations
+
+    async def get(self, org_id: str) -> Optional[Organization]:
+        """Get an organization by ID."""
+        return (await self._get_index()).by_id.get(str(org_id))
+
+    async def resolve(self, name: str, fuzzy: bool = True) -> Optional[OrganizationMatch]:
+        """Resolve a name or ID to the best matching organization.
+
+        Args:
+            name: Organization name or ID
+            fuzzy: Whether to fall back to fuzzy matching
+
+        Returns:
+            Best match or None
+        """
+        return (await self._get_index()).resolve(name, fuzzy=fuzzy)
+
+    async def resolve_id(self, name: str, fuzzy: bool = True) -> Optional[str]:
+        """Resolve a name or ID to an organization ID.
+
+        Args:
+            name: Organization name or ID
+            fuzzy: Whether to fall back to fuzzy matching
+
+        Returns:
+            Organization ID or None
+        """
+        match = await self.resolve(name, fuzzy=fuzzy)
+        return str(match.organization.id) if match else None
+
+    async def fuzzy_matches(
+        self,
+        name: str,
+        limit: int = 5,
+        threshold: float = FUZZY_THRESHOLD
+    ) -> list[OrganizationMatch]:
+        """Find organizations with names similar to a query.
+
+        Args:
+            name: Name to match
+            limit: Maximum matches
+            threshold: Minimum similarity score
+
+        Returns:
+            Matches, best first
+        """
+        return (await self._get_index()).fuzzy_matches(name, limit, threshold)
+
+    async def close(self):
+        """Stop any background refresh."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
@@ -10,11 +10,17 @@ from src.cache.manager import CacheManager
 from src.services.itglue.client import ITGlueClient
 from src.services.itglue.models import Organization
 
+from .handler_cache import get_or_fetch_result
+from .organization_directory import OrganizationDirectory
+
 logger = logging.getLogger(__name__)
 
 # Performance requirement: <500ms response time
 MAX_RESPONSE_TIME_MS = 500
 
+# Directory match types reported as exact matches
+EXACT_MATCH_TYPES = ("id", "exact", "normalized")
+
 
 class OrganizationsHandler:
     """Handles queries related to IT Glue organizations with performance optimization."""
@@ -22,19 +28,19 @@ class OrganizationsHandler:
     def __init__(
         self,
         itglue_client: ITGlueClient,
-        cache_manager: Optional[CacheManager] = None
+        cache_manager: Optional[CacheManager] = None,
+        org_directory: Optional[OrganizationDirectory] = None
     ):
         """Initialize organizations handler.
 
         Args:
             itglue_client: IT Glue API client
             cache_manager: Optional cache manager
+            org_directory: Shared organization directory
         """
         self.client = itglue_client
         self.cache = cache_manager
-        self._org_cache = {}  # In-memory cache for performance
-        self._cache_timestamp = 0
-        self._cache_ttl = 300  # 5 minutes
+        self.directory = org_directory or OrganizationDirectory(itglue_client)
 
     async def list_all_organizations(
         self,
@@ -52,17 +58,9 @@ class OrganizationsHandler:
         """
         start_time = time.time()
 
-        # Check cache first
-        cache_key = f"organizations:all:{org_type or 'all'}"
-        if self.cache and hasattr(self.cache, 'query_cache'):
-            cached = await self.cache.query_cache.get(cache_key)
-            if cached:
-                response_time_ms = (time.time() - start_time) * 1000
-                logger.debug(f"Returning cached organizations in {response_time_ms:.2f}ms")
-                cached["response_time_ms"] = response_time_ms
-                return cached
+        cache_key = f"organizations:all:{org_type or 'all'}:{limit}"
 
-        try:
+        async def fetch() -> dict[str, Any]:
             # Get organizations
             organizations = await self._get_organizations_cached()
 
@@ -76,11 +74,10 @@ class OrganizationsHandler:
             else:
                 filtered_orgs = organizations
 
-            # Sort by name
-            filtered_orgs.sort(key=lambda o: o.name)
+            # Directory organizations are already sorted by name
 
             # Format response
-            result = {
+            return {
                 "success": True,
                 "organization_type": org_type,
                 "count": len(filtered_orgs),
@@ -90,19 +87,20 @@ class OrganizationsHandler:
                 ]
             }
 
-            # Calculate response time
+        try:
+            # Concurrent listings share one build of the list
+            result = await get_or_fetch_result(self.cache, cache_key, fetch)
+            if result is None:
+                raise RuntimeError("organization list unavailable")
+
+            # Calculate response time; coalesced callers share the result, so copy it
             response_time_ms = (time.time() - start_time) * 1000
-            result["response_time_ms"] = response_time_ms
+            result = {**result, "response_time_ms": response_time_ms}
 
             # Ensure we meet performance requirement
             if response_time_ms > MAX_RESPONSE_TIME_MS:
                 logger.warning(f"Response time {response_time_ms:.2f}ms exceeds {MAX_RESPONSE_TIME_MS}ms requirement")
 
-            # Cache for 5 minutes
-            if self.cache and hasattr(self.cache, 'query_cache'):
-                from ..cache.redis_cache import QueryType
-                await self.cache.query_cache.set(cache_key, result, QueryType.OPERATIONAL)
-
             logger.info(f"Listed {len(result['organizations'])} organizations in {response_time_ms:.2f}ms")
             return result
 
@@ -143,46 +141,29 @@ class OrganizationsHandler:
                 return cached
 
         try:
-            # Get all organizations
-            organizations = await self._get_organizations_cached()
+            match = await self.directory.resolve(name, fuzzy=use_fuzzy)
+            is_exact = match is not None and match.match_type in EXACT_MATCH_TYPES
+            if match and not use_fuzzy and not is_exact:
+                match = None
 
-            # Try exact match first
-            name_lower = name.lower()
-            exact_match = None
-
-            for org in organizations:
-                if org.name.lower() == name_lower:
-                    exact_match = org
-                    break
-
-            if exact_match:
+            if match:
                 result = {
                     "success": True,
                     "query": name,
-                    "match_type": "exact",
-                    "organization": self._format_organization_detailed(exact_match)
+                    "match_type": "exact" if is_exact else "fuzzy",
+                    "organization": self._format_organization_detailed(match.organization)
                 }
+                if not is_exact:
+                    result["match_score"] = match.score
             elif use_fuzzy:
-                # Try fuzzy matching
-                best_match = self._find_best_match(name, organizations)
-
-                if best_match:
-                    result = {
-                        "success": True,
-                        "query": name,
-                        "match_type": "fuzzy",
-                        "match_score": best_match[1],
-                        "organization": self._format_organization_detailed(best_match[0])
-                    }
-                else:
-                    # Provide suggestions
-                    suggestions = self._get_suggestions(name, organizations)
-                    result = {
-                        "success": False,
-                        "query": name,
-                        "error": f"Organization '{name}' not found",
-                        "suggestions": suggestions
-                    }
+                # Provide suggestions
+                suggestions = await self.directory.fuzzy_matches(name, limit=5, threshold=0.4)
+                result = {
+                    "success": False,
+                    "query": name,
+                    "error": f"Organization '{name}' not found",
+                    "suggestions": [m.organization.name for m in suggestions]
+                }
             else:
                 result = {
                     "success": False,
@@ -390,25 +371,12 @@ class OrganizationsHandler:
             }
 
     async def _get_organizations_cached(self) -> list[Organization]:
-        """Get organizations with in-memory caching for performance.
+        """Get organizations from the shared directory.
 
         Returns:
-            List of organizations
+            List of organizations sorted by name
         """
-        current_time = time.time()
-
-        # Check in-memory cache
-        if self._org_cache and (current_time - self._cache_timestamp) < self._cache_ttl:
-            return self._org_cache
-
-        # Fetch from API
-        organizations = await self.client.get_organizations()
-
-        # Update in-memory cache
-        self._org_cache = organizations
-        self._cache_timestamp = current_time
-
-        return organizations
+        return await self.directory.get_organizations()
 
     def _format_organization(self, org: Organization) -> dict[str, Any]:
         """Format organization for response.
@@ -445,89 +413,6 @@ class OrganizationsHandler:
             "attributes": org.attributes  # Include all attributes
         }
 
-    def _find_best_match(
-        self,
-        query: str,
-        organizations: list[Organization]
-    ) -> Optional[tuple]:
-        """Find best matching organization using fuzzy matching.
-
-        Args:
-            query: Search query
-            organizations: List of organizations
-
-        Returns:
-            Tuple of (organization, score) or None
-        """
-        if not organizations:
-            return None
-
-        query_lower = query.lower()
-        best_match = None
-        best_score = 0
-
-        for org in organizations:
-            # Calculate similarity score
-            score = SequenceMatcher(
-                None,
-                query_lower,
-                org.name.lower()
-            ).ratio()
-
-            # Boost score for partial exact matches
-            if query_lower in org.name.lower():
-                score += 0.2
-
-            if score > best_score and score > 0.6:  # Minimum threshold
-                best_score = score
-                best_match = (org, score)
-
-        return best_match
-
-    def _get_suggestions(
-        self,
-        query: str,
-        organizations: list[Organization],
-        max_suggestions: int = 5
-    ) -> list[str]:
-        """Get organization name suggestions.
-
-        Args:
-            query: Search query
-            organizations: List of organizations
-            max_suggestions: Maximum number of suggestions
-
-        Returns:
-            List of suggested organization names
-        """
-        query_lower = query.lower()
-        suggestions = []
-
-        for org in organizations:
-            name_lower = org.name.lower()
-
-            # Check for partial matches
-            if any(word in name_lower for word in query_lower.split()):
-                suggestions.append(org.name)
-
-            # Check for common variations
-            elif query_lower[0] == name_lower[0]:  # Same first letter
-                similarity = SequenceMatcher(None, query_lower, name_lower).ratio()
-                if similarity > 0.4:
-                    suggestions.append(org.name)
-
-        # Remove duplicates and limit
-        seen = set()
-        unique_suggestions = []
-        for s in suggestions:
-            if s not in seen:
-                seen.add(s)
-                unique_suggestions.append(s)
-                if len(unique_suggestions) >= max_suggestions:
-                    break
-
-        return unique_suggestions
-
     def _hash_query(self, query: str) -> str:
         """Create a hash of the query for caching.
 
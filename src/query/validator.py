@@ -54,7 +54,8 @@ class ZeroHallucinationValidator:
         self,
         response: dict[str, Any],
         source_ids: list[str],
-        similarity_scores: list[float]
+        similarity_scores: list[float],
+        source_entities: Optional[list[Any]] = None
     ) -> ValidationResult:
         """Validate a response against source documents.
 
@@ -62,6 +63,8 @@ class ZeroHallucinationValidator:
             response: Response data to validate
             source_ids: Source document IDs
             similarity_scores: Similarity scores for sources
+            source_entities: Entities already loaded for source_ids; when
+                given, sources are not fetched from the database again
 
         Returns:
             Validation result
@@ -94,7 +97,7 @@ class ZeroHallucinationValidator:
             )
 
         # Verify source documents exist
-        source_documents = await self._verify_sources(source_ids)
+        source_documents = await self._verify_sources(source_ids, source_entities)
 
         if self.require_source and len(source_documents) != len(source_ids):
             missing = len(source_ids) - len(source_documents)
@@ -129,12 +132,14 @@ class ZeroHallucinationValidator:
 
     async def _verify_sources(
         self,
-        source_ids: list[str]
+        source_ids: list[str],
+        entities: Optional[list[Any]] = None
     ) -> list[dict[str, Any]]:
         """Verify source documents exist.
 
         Args:
             source_ids: Source document IDs
+            entities: Entities already loaded by the caller
 
         Returns:
             List of source documents
@@ -142,6 +147,14 @@ class ZeroHallucinationValidator:
         if not source_ids:
             return []
 
+        if entities is not None:
+            wanted = set(source_ids)
+            return [
+                self._entity_to_document(entity)
+                for entity in entities
+                if str(entity.id) in wanted
+            ]
+
         try:
             async with db_manager.get_session() as session:
                 uow = UnitOfWork(session)
@@ -150,23 +163,30 @@ class ZeroHallucinationValidator:
                 entities = await uow.itglue.get_by_ids(source_ids)
 
                 # Convert to documents
-                documents = []
-                for entity in entities:
-                    documents.append({
-                        "id": str(entity.id),
-                        "itglue_id": entity.itglue_id,
-                        "name": entity.name,
-                        "type": entity.entity_type,
-                        "attributes": entity.attributes,
-                        "last_synced": entity.last_synced
-                    })
-
-                return documents
+                return [self._entity_to_document(entity) for entity in entities]
 
         except Exception as e:
             logger.error(f"Failed to verify sources: {e}")
             return []
 
+    def _entity_to_document(self, entity: Any) -> dict[str, Any]:
+        """Convert an entity to a source document.
+
+        Args:
+            entity: IT Glue entity
+
+        Returns:
+            Source document
+        """
+        return {
+            "id": str(entity.id),
+            "itglue_id": entity.itglue_id,
+            "name": entity.name,
+            "type": entity.entity_type,
+            "attributes": entity.attributes,
+            "last_synced": entity.last_synced
+        }
+
     async def _validate_content(
         self,
         response: dict[str, Any],
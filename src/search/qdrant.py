@@ -0,0 +1,122 @@
+"""Shared async Qdrant client and payload filtering helpers."""
+
+import logging
+from typing import Any, Optional
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import FieldCondition, Filter, MatchValue, PayloadSchemaType
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Payload fields searches filter on; each gets a keyword index
+PAYLOAD_INDEX_FIELDS = ("organization_id", "entity_type", "entity_id")
+
+# One client, and so one connection pool, per distinct server
+_clients: dict[tuple[str, Optional[str], bool], AsyncQdrantClient] = {}
+
+
+def get_qdrant_client(
+    url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    prefer_grpc: Optional[bool] = None
+) -> AsyncQdrantClient:
+    """Get the process-wide async Qdrant client for a server.
+
+    Args:
+        url: Qdrant server URL (defaults to settings.qdrant_url)
+        api_key: Qdrant API key (defaults to settings.qdrant_api_key)
+        prefer_grpc: Use the gRPC transport (defaults to settings.qdrant_prefer_grpc)
+
+    Returns:
+        Shared AsyncQdrantClient
+    """
+    url = url or settings.qdrant_url or "http://localhost:6333"
+    api_key = api_key or settings.qdrant_api_key or None
+    if prefer_grpc is None:
+        prefer_grpc = getattr(settings, 'qdrant_prefer_grpc', False)
+
+    key = (url, api_key, prefer_grpc)
+    client = _clients.get(key)
+    if client is None:
+        client = AsyncQdrantClient(
+            url=url,
+            api_key=api_key,
+            prefer_grpc=prefer_grpc,
+            grpc_port=getattr(settings, 'qdrant_grpc_port', 6334),
+            timeout=settings.query_timeout,
+            check_compatibility=False
+        )
+        _clients[key] = client
+        logger.info(
+            f"Qdrant client created for {url} "
+            f"({'gRPC' if prefer_grpc else 'HTTP'} transport)"
+        )
+    return client
+
+
+async def close_qdrant_clients():
+    """Close every shared Qdrant client."""
+    while _clients:
+        _, client = _clients.popitem()
+        try:
+            await client.close()
+        except Exception as e:
+            logger.warning(f"Error closing Qdrant client: {e}")
+
+
+def build_payload_filter(**conditions: Any) -> Optional[Filter]:
+    """Build a Qdrant filter requiring exact payload matches.
+
+    Args:
+        **conditions: Payload field to required value; None and "" are ignored
+
+    Returns:
+        Filter with one ``must`` condition per field, or None if empty
+    """
+    must = [
+        FieldCondition(key=key, match=MatchValue(value=value))
+        for key, value in conditions.items()
+        if value is not None and value != ""
+    ]
+    return Filter(must=must) if must else None
+
+
+async def ensure_payload_indexes(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    fields: tuple[str, ...] = PAYLOAD_INDEX_FIELDS
+) -> list[str]:
+    """Create keyword payload indexes that do not exist yet.
+
+    Indexed fields let Qdrant apply filters during HNSW search instead of
+    scanning payloads, which keeps filtered searches fast on large
+    collections.
+
+    Args:
+        client: Qdrant client
+        collection_name: Collection to index
+        fields: Payload fields to index
+
+    Returns:
+        Fields for which an index was created
+    """
+    info = await client.get_collection(collection_name)
+    existing = set((info.payload_schema or {}).keys())
+
+    created = []
+    for field_name in fields:
+        if field_name in existing:
+            continue
+        await client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=PayloadSchemaType.KEYWORD,
+            wait=True
+        )
+        created.append(field_name)
+
+    if created:
+        logger.info(f"Created payload indexes on {collection_name}: {', '.join(created)}")
+    return created
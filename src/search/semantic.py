@@ -4,21 +4,40 @@ import logging
 import uuid
 from typing import Any, Optional
 
-from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    Batch,
     Distance,
-    FieldCondition,
-    Filter,
-    MatchValue,
-    PointStruct,
+    FilterSelector,
+    HasIdCondition,
     VectorParams,
 )
 
 from src.config.settings import settings
 from src.embeddings import EmbeddingGenerator
 
+from .qdrant import build_payload_filter, ensure_payload_indexes, get_qdrant_client
+
 logger = logging.getLogger(__name__)
 
+# Namespace for deterministic point IDs; changing it orphans existing points
+POINT_ID_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-5e7f-9a1c-2b4d6e8f0a13")
+
+
+def point_id_for(entity_id: str, chunk_index: int = 0) -> str:
+    """Derive the Qdrant point ID for one chunk of an entity.
+
+    The same entity and chunk always map to the same point, so re-indexing
+    overwrites vectors instead of adding duplicates.
+
+    Args:
+        entity_id: Entity ID
+        chunk_index: Position of the chunk within the entity's text
+
+    Returns:
+        UUID string usable as a Qdrant point ID
+    """
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{entity_id}:{chunk_index}"))
+
 
 class SearchResult:
     """Semantic search result."""
@@ -44,7 +63,8 @@ class SemanticSearch:
         qdrant_url: Optional[str] = None,
         qdrant_api_key: Optional[str] = None,
         collection_name: str = "itglue_entities",
-        embedding_generator: Optional[EmbeddingGenerator] = None
+        embedding_generator: Optional[EmbeddingGenerator] = None,
+        prefer_grpc: Optional[bool] = None
     ):
         """Initialize semantic search.
 
@@ -53,15 +73,17 @@ class SemanticSearch:
             qdrant_api_key: Qdrant API key (optional)
             collection_name: Name of the collection
             embedding_generator: Embedding generator
+            prefer_grpc: Use the gRPC transport (defaults to settings)
         """
         self.qdrant_url = qdrant_url or settings.qdrant_url or "http://localhost:6333"
         self.qdrant_api_key = qdrant_api_key or settings.qdrant_api_key
         self.collection_name = collection_name
 
-        # Initialize Qdrant client
-        self.client = QdrantClient(
+        # Shared async Qdrant client, so searches never block the event loop
+        self.client = get_qdrant_client(
             url=self.qdrant_url,
-            api_key=self.qdrant_api_key
+            api_key=self.qdrant_api_key,
+            prefer_grpc=prefer_grpc
         )
 
         self.embedding_generator = embedding_generator or EmbeddingGenerator()
@@ -75,18 +97,18 @@ class SemanticSearch:
         """
         try:
             # Check if collection exists
-            collections = self.client.get_collections().collections
+            collections = (await self.client.get_collections()).collections
             exists = any(c.name == self.collection_name for c in collections)
 
             if exists and recreate:
                 logger.info(f"Deleting existing collection: {self.collection_name}")
-                self.client.delete_collection(self.collection_name)
+                await self.client.delete_collection(self.collection_name)
                 exists = False
 
             if not exists:
                 logger.info(f"Creating collection: {self.collection_name}")
 
-                self.client.create_collection(
+                await self.client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=VectorParams(
                         size=self.dimension,
@@ -99,6 +121,9 @@ class SemanticSearch:
             else:
                 logger.info(f"Collection {self.collection_name} already exists")
 
+            # Index filtered payload fields so filtered search stays fast
+            await ensure_payload_indexes(self.client, self.collection_name)
+
         except Exception as e:
             logger.error(f"Failed to initialize collection: {e}")
             raise
@@ -109,7 +134,7 @@ class SemanticSearch:
         text: str,
         metadata: dict[str, Any]
     ) -> str:
-        """Index a single entity.
+        """Index a single entity, replacing any points it already has.
 
         Args:
             entity_id: Entity ID
@@ -119,36 +144,68 @@ class SemanticSearch:
         Returns:
             Point ID in Qdrant
         """
+        point_ids = await self.replace_entity_chunks(entity_id, [text], metadata)
+        return point_ids[0]
+
+    async def replace_entity_chunks(
+        self,
+        entity_id: str,
+        chunks: list[str],
+        metadata: dict[str, Any]
+    ) -> list[str]:
+        """Replace all indexed chunks of an entity.
+
+        New chunks are upserted under deterministic IDs first, then any other
+        points for the entity (stale trailing chunks or legacy random IDs)
+        are deleted, so the entity is never missing from search.
+
+        Args:
+            entity_id: Entity ID
+            chunks: Chunk texts in order
+            metadata: Entity metadata stored on every chunk
+
+        Returns:
+            Point IDs of the chunks
+        """
+        if not chunks:
+            await self.delete_entity(entity_id)
+            return []
+
         try:
-            # Generate embedding
-            embeddings = await self.embedding_generator.generate_embeddings([text])
+            # Generate embeddings
+            embeddings = await self.embedding_generator.generate_embedding_array(chunks)
 
-            if not embeddings:
-                raise ValueError("Failed to generate embedding")
-
-            # Create point ID
-            point_id = str(uuid.uuid4())
-
-            # Create point
-            point = PointStruct(
-                id=point_id,
-                vector=embeddings[0],
-                payload={
-                    "entity_id": entity_id,
-                    "text": text[:1000],  # Store first 1000 chars
-                    **metadata
-                }
-            )
+            point_ids = [point_id_for(entity_id, i) for i in range(len(chunks))]
 
             # Upsert to Qdrant
-            self.client.upsert(
+            await self.client.upsert(
+                collection_name=self.collection_name,
+                points=Batch(
+                    ids=point_ids,
+                    vectors=embeddings.tolist(),
+                    payloads=[
+                        {
+                            "entity_id": entity_id,
+                            "chunk_index": i,
+                            "text": chunk[:1000],  # Store first 1000 chars
+                            **metadata
+                        }
+                        for i, chunk in enumerate(chunks)
+                    ]
+                )
+            )
+
+            # Drop points left over from a longer or legacy version
+            stale_filter = build_payload_filter(entity_id=entity_id)
+            stale_filter.must_not = [HasIdCondition(has_id=point_ids)]
+            await self.client.delete(
                 collection_name=self.collection_name,
-                points=[point]
+                points_selector=FilterSelector(filter=stale_filter)
             )
 
-            logger.debug(f"Indexed entity {entity_id} with point {point_id}")
+            logger.debug(f"Indexed entity {entity_id} as {len(point_ids)} chunks")
 
-            return point_id
+            return point_ids
 
         except Exception as e:
             logger.error(f"Failed to index entity {entity_id}: {e}")
@@ -160,8 +217,13 @@ class SemanticSearch:
     ) -> list[str]:
         """Index multiple entities.
 
+        Points are upserted under IDs derived from each entity's 'id' and
+        optional 'chunk_index', so indexing the same entity again replaces
+        its vectors.
+
         Args:
             entities: List of entities with 'id', 'text', and 'metadata'
+                (and 'chunk_index' when an entity spans several chunks)
 
         Returns:
             List of point IDs
@@ -179,35 +241,32 @@ class SemanticSearch:
                 batch_size=50
             )
 
-            # Create points
-            points = []
-            point_ids = []
-
-            for entity, embedding in zip(entities, embeddings, strict=False):
-                point_id = str(uuid.uuid4())
-                point_ids.append(point_id)
-
-                points.append(
-                    PointStruct(
-                        id=point_id,
-                        vector=embedding,
-                        payload={
-                            "entity_id": entity["id"],
-                            "text": entity["text"][:1000],
-                            **entity.get("metadata", {})
-                        }
-                    )
-                )
+            point_ids = [
+                point_id_for(entity["id"], entity.get("chunk_index", 0))
+                for entity in entities
+            ]
+            payloads = [
+                {
+                    "entity_id": entity["id"],
+                    "chunk_index": entity.get("chunk_index", 0),
+                    "text": entity["text"][:1000],
+                    **entity.get("metadata", {})
+                }
+                for entity in entities
+            ]
 
-            # Batch upsert to Qdrant
-            for i in range(0, len(points), 100):
-                batch = points[i:i + 100]
-                self.client.upsert(
+            # Batch upsert to Qdrant, converting vectors to lists one batch at a time
+            for i in range(0, len(point_ids), 100):
+                await self.client.upsert(
                     collection_name=self.collection_name,
-                    points=batch
+                    points=Batch(
+                        ids=point_ids[i:i + 100],
+                        vectors=embeddings[i:i + 100].tolist(),
+                        payloads=payloads[i:i + 100]
+                    )
                 )
 
-            logger.info(f"Indexed {len(points)} entities")
+            logger.info(f"Indexed {len(point_ids)} entities")
 
             return point_ids
 
@@ -246,31 +305,13 @@ class SemanticSearch:
             query_vector = embeddings[0]
 
             # Build filter conditions
-            filter_conditions = []
-
-            if company_id:
-                filter_conditions.append(
-                    FieldCondition(
-                        key="organization_id",
-                        match=MatchValue(value=company_id)
-                    )
-                )
-
-            if entity_type:
-                filter_conditions.append(
-                    FieldCondition(
-                        key="entity_type",
-                        match=MatchValue(value=entity_type)
-                    )
-                )
-
-            # Create filter if conditions exist
-            search_filter = None
-            if filter_conditions:
-                search_filter = Filter(must=filter_conditions)
+            search_filter = build_payload_filter(
+                organization_id=company_id,
+                entity_type=entity_type
+            )
 
             # Perform search
-            results = self.client.search(
+            results = await self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_vector,
                 query_filter=search_filter,
@@ -318,16 +359,10 @@ class SemanticSearch:
         """
         try:
             # Build filter
-            search_filter = None
-            if filters:
-                filter_conditions = [
-                    FieldCondition(key=k, match=MatchValue(value=v))
-                    for k, v in filters.items()
-                ]
-                search_filter = Filter(must=filter_conditions)
+            search_filter = build_payload_filter(**(filters or {}))
 
             # Search
-            results = self.client.search(
+            results = await self.client.search(
                 collection_name=self.collection_name,
                 query_vector=vector,
                 query_filter=search_filter,
@@ -351,39 +386,32 @@ class SemanticSearch:
             raise
 
     async def delete_entity(self, entity_id: str) -> bool:
-        """Delete entity from index.
+        """Delete all of an entity's points from the index.
 
         Args:
             entity_id: Entity ID to delete
 
         Returns:
-            Success status
+            True if any points were deleted
         """
         try:
-            # Find points with this entity ID
-            results = self.client.scroll(
+            entity_filter = build_payload_filter(entity_id=entity_id)
+
+            # Count points with this entity ID
+            result = await self.client.count(
                 collection_name=self.collection_name,
-                scroll_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="entity_id",
-                            match=MatchValue(value=entity_id)
-                        )
-                    ]
-                ),
-                limit=100
+                count_filter=entity_filter,
+                exact=True
             )
 
-            point_ids = [point.id for point in results[0]]
-
-            if point_ids:
+            if result.count:
                 # Delete points
-                self.client.delete(
+                await self.client.delete(
                     collection_name=self.collection_name,
-                    points_selector=point_ids
+                    points_selector=FilterSelector(filter=entity_filter)
                 )
 
-                logger.debug(f"Deleted {len(point_ids)} points for entity {entity_id}")
+                logger.debug(f"Deleted {result.count} points for entity {entity_id}")
                 return True
 
             return False
@@ -409,10 +437,7 @@ class SemanticSearch:
             Success status
         """
         try:
-            # Delete old entries
-            await self.delete_entity(entity_id)
-
-            # Index new version
+            # Index new version over the old one
             await self.index_entity(entity_id, text, metadata)
 
             logger.debug(f"Updated entity {entity_id}")
@@ -429,7 +454,7 @@ class SemanticSearch:
             Collection statistics
         """
         try:
-            info = self.client.get_collection(self.collection_name)
+            info = await self.client.get_collection(self.collection_name)
 
             return {
                 "name": info.config.params.vectors.size,
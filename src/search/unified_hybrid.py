@@ -1,18 +1,24 @@
 """Unified hybrid search combining PostgreSQL, Qdrant, and Neo4j."""
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from typing import Any, Optional
 from enum import Enum
 
 from neo4j import AsyncGraphDatabase
-from qdrant_client import QdrantClient
 from qdrant_client.models import PointStruct, Distance, VectorParams
-import aiohttp
+from sqlalchemy import select
 
 from src.data import UnitOfWork, db_manager
+from src.data.models import ITGlueEntity
 from src.config.settings import settings
+from src.embeddings import EmbeddingGenerator
 from src.graph.graph_traversal import GraphTraversal, TraversalType
+from src.search.qdrant import build_payload_filter, get_qdrant_client
 
 logger = logging.getLogger(__name__)
 
@@ -72,14 +78,40 @@ class UnifiedSearchResult:
         }
 
 
+class UnifiedSearchResults(list):
+    """Search results plus whether every source answered in time."""
+    
+    def __init__(self, results=(), timed_out_sources: Optional[list[str]] = None):
+        super().__init__(results)
+        self.timed_out_sources = timed_out_sources or []
+    
+    @property
+    def partial(self) -> bool:
+        """True when at least one source missed its deadline."""
+        return bool(self.timed_out_sources)
+
+
 class UnifiedHybridSearch:
     """Unified search across PostgreSQL, Qdrant, and Neo4j."""
     
+    # Latency budget in seconds for each source in hybrid mode
+    DEFAULT_SOURCE_TIMEOUTS = {
+        "keyword": 1.0,
+        "semantic": 2.0,  # Includes generating the query embedding
+        "graph": 1.5
+    }
+    
+    # Entity records kept for graph hit hydration
+    ENTITY_CACHE_SIZE = 2048
+    ENTITY_CACHE_TTL = 300
+    
     def __init__(
         self,
         keyword_weight: float = 0.3,
         semantic_weight: float = 0.5,
-        graph_weight: float = 0.2
+        graph_weight: float = 0.2,
+        source_timeouts: Optional[dict[str, float]] = None,
+        embedding_generator: Optional[EmbeddingGenerator] = None
     ):
         """Initialize unified hybrid search.
         
@@ -87,13 +119,22 @@ class UnifiedHybridSearch:
             keyword_weight: Weight for PostgreSQL keyword search
             semantic_weight: Weight for Qdrant semantic search  
             graph_weight: Weight for Neo4j graph relationships
+            source_timeouts: Per-source latency budgets in seconds
+            embedding_generator: Generator for query embeddings
         """
+        self.source_timeouts = {**self.DEFAULT_SOURCE_TIMEOUTS, **(source_timeouts or {})}
+        
+        # itglue_id -> (expires_at, entity record)
+        self._entity_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
         # Normalize weights
         total = keyword_weight + semantic_weight + graph_weight
         self.keyword_weight = keyword_weight / total
         self.semantic_weight = semantic_weight / total
         self.graph_weight = graph_weight / total
         
+        self.embedding_generator = embedding_generator or EmbeddingGenerator()
+
         # Initialize clients
         self.qdrant_client = None
         self.neo4j_driver = None
@@ -111,11 +152,7 @@ class UnifiedHybridSearch:
             logger.info("✅ PostgreSQL initialized")
             
             # Initialize Qdrant
-            self.qdrant_client = QdrantClient(
-                url=settings.qdrant_url,
-                api_key=settings.qdrant_api_key if settings.qdrant_api_key else None,
-                check_compatibility=False
-            )
+            self.qdrant_client = get_qdrant_client()
             logger.info("✅ Qdrant client initialized")
             
             # Initialize Neo4j
@@ -160,7 +197,9 @@ class UnifiedHybridSearch:
             min_score: Minimum score threshold
             
         Returns:
-            List of unified search results
+            List of unified search results; in hybrid mode an
+            UnifiedSearchResults whose ``partial`` flag is set when a
+            source missed its deadline
         """
         await self.initialize()
         
@@ -197,20 +236,28 @@ class UnifiedHybridSearch:
         limit: int,
         min_score: float
     ) -> list[UnifiedSearchResult]:
-        """Perform hybrid search combining all three systems."""
-        
-        # Run searches in parallel
-        keyword_results = await self._get_keyword_results(
-            query, organization_id, entity_type, limit * 2
-        )
+        """Perform hybrid search combining all three systems.
         
-        semantic_results = await self._get_semantic_results(
-            query, organization_id, entity_type, limit * 2
-        )
+        The sources run concurrently, each under its own deadline. Sources
+        that miss their deadline contribute nothing and the returned
+        results are marked partial.
+        """
         
-        graph_results = await self._get_graph_results(
-            query, organization_id, limit * 2
-        )
+        # Run searches in parallel
+        source_results, timed_out = await self._run_sources({
+            "keyword": self._get_keyword_results(
+                query, organization_id, entity_type, limit * 2
+            ),
+            "semantic": self._get_semantic_results(
+                query, organization_id, entity_type, limit * 2
+            ),
+            "graph": self._get_graph_results(
+                query, organization_id, limit * 2
+            )
+        })
+        keyword_results = source_results["keyword"]
+        semantic_results = source_results["semantic"]
+        graph_results = source_results["graph"]
         
         # Combine results
         combined = {}
@@ -250,7 +297,11 @@ class UnifiedHybridSearch:
                     payload=data
                 )
         
-        # Add/merge graph results
+        # Add/merge graph results, hydrating graph-only hits in one lookup
+        entity_details = await self._fetch_entities_details([
+            entity_id for entity_id, _, _ in graph_results
+            if entity_id not in combined
+        ])
         for entity_id, score, relationships in graph_results:
             if entity_id in combined:
                 result = combined[entity_id]
@@ -259,8 +310,7 @@ class UnifiedHybridSearch:
                 result.sources.append("graph")
                 result.relationships = relationships
             else:
-                # Fetch entity details for graph-only results
-                entity_data = await self._fetch_entity_details(entity_id)
+                entity_data = entity_details.get(entity_id)
                 if entity_data:
                     combined[entity_id] = UnifiedSearchResult(
                         id=entity_id,
@@ -283,7 +333,35 @@ class UnifiedHybridSearch:
         
         results.sort(key=lambda x: x.total_score, reverse=True)
         
-        return results[:limit]
+        return UnifiedSearchResults(results[:limit], timed_out)
+    
+    async def _run_sources(
+        self,
+        searches: dict[str, Awaitable[list]]
+    ) -> tuple[dict[str, list], list[str]]:
+        """Run source searches concurrently, each under its own deadline.
+        
+        Args:
+            searches: Source name to search coroutine
+            
+        Returns:
+            Results per source (empty for late sources) and the names of
+            sources that timed out
+        """
+        async def run(name: str, search):
+            timeout = self.source_timeouts.get(name)
+            try:
+                return await asyncio.wait_for(search, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"{name.capitalize()} search exceeded {timeout}s budget")
+                return None
+        
+        names = list(searches)
+        outcomes = await asyncio.gather(*(run(name, searches[name]) for name in names))
+        
+        timed_out = [name for name, outcome in zip(names, outcomes) if outcome is None]
+        results = {name: outcome or [] for name, outcome in zip(names, outcomes)}
+        return results, timed_out
     
     async def _get_keyword_results(
         self,
@@ -354,10 +432,14 @@ class UnifiedHybridSearch:
             if not embedding:
                 return []
             
-            # Search in Qdrant
-            results = self.qdrant_client.search(
+            # Search in Qdrant, filtering inside the index so limit holds
+            results = await self.qdrant_client.search(
                 collection_name="itglue_entities",
                 query_vector=embedding,
+                query_filter=build_payload_filter(
+                    organization_id=organization_id,
+                    entity_type=entity_type
+                ),
                 limit=limit,
                 score_threshold=0.3
             )
@@ -366,12 +448,6 @@ class UnifiedHybridSearch:
             for result in results:
                 payload = result.payload or {}
                 
-                # Apply filters if specified
-                if organization_id and payload.get("organization_id") != organization_id:
-                    continue
-                if entity_type and payload.get("entity_type") != entity_type:
-                    continue
-                
                 semantic_results.append((
                     payload.get("entity_id", str(result.id)),
                     result.score,
@@ -483,14 +559,20 @@ class UnifiedHybridSearch:
                     LIMIT $limit
                 """, entity_id=entity_id, limit=limit)
                 
+                affected_records = [record async for record in impact_result]
+                
+                # Fetch additional entity details
+                entity_details = await self._fetch_entities_details(
+                    [affected["entity_id"] for affected in affected_records]
+                )
+                
                 results = []
-                async for affected in impact_result:
+                for affected in affected_records:
                     # Calculate impact score
                     score = min(1.0, (affected["direct_connections"] * 0.7 + 
                                      affected["indirect_connections"] * 0.3) / 5)
                     
-                    # Fetch additional entity details
-                    entity_data = await self._fetch_entity_details(affected["entity_id"])
+                    entity_data = entity_details.get(affected["entity_id"])
                     
                     results.append(UnifiedSearchResult(
                         id=affected["entity_id"],
@@ -540,9 +622,14 @@ class UnifiedHybridSearch:
                     LIMIT $limit
                 """, name=entity_name, limit=limit)
                 
+                records = [record async for record in result]
+                entity_details = await self._fetch_entities_details(
+                    [record["entity_id"] for record in records]
+                )
+                
                 results = []
-                async for record in result:
-                    entity_data = await self._fetch_entity_details(record["entity_id"])
+                for record in records:
+                    entity_data = entity_details.get(record["entity_id"])
                     
                     results.append(UnifiedSearchResult(
                         id=record["entity_id"],
@@ -634,9 +721,13 @@ class UnifiedHybridSearch:
             query, organization_id, limit
         )
         
+        entity_details = await self._fetch_entities_details(
+            [entity_id for entity_id, _, _ in graph_results]
+        )
+        
         results = []
         for entity_id, score, relationships in graph_results:
-            entity_data = await self._fetch_entity_details(entity_id)
+            entity_data = entity_details.get(entity_id)
             if entity_data:
                 results.append(UnifiedSearchResult(
                     id=entity_id,
@@ -654,55 +745,74 @@ class UnifiedHybridSearch:
         return results
     
     async def _generate_embedding(self, text: str) -> Optional[list[float]]:
-        """Generate embedding using Ollama."""
+        """Generate the query embedding, reusing cached vectors."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{settings.ollama_url}/api/embeddings",
-                    json={
-                        "model": "nomic-embed-text",
-                        "prompt": text
-                    },
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data["embedding"]
-                    else:
-                        logger.error(f"Ollama embedding failed: {response.status}")
-                        return None
+            embeddings = await self.embedding_generator.generate_embeddings([text])
+            return embeddings[0]
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             return None
     
     async def _fetch_entity_details(self, entity_id: str) -> Optional[dict]:
         """Fetch entity details from PostgreSQL."""
+        details = await self._fetch_entities_details([entity_id])
+        return details.get(entity_id)
+    
+    async def _fetch_entities_details(self, entity_ids: list[str]) -> dict[str, dict]:
+        """Fetch details for many entities by IT Glue ID.
+        
+        Recently fetched records are served from a small in-process cache;
+        the rest are loaded with a single query.
+        
+        Args:
+            entity_ids: IT Glue IDs of the entities
+            
+        Returns:
+            Entity records keyed by IT Glue ID (missing entities are omitted)
+        """
+        details: dict[str, dict] = {}
+        missing: list[str] = []
+        now = time.monotonic()
+        
+        for entity_id in dict.fromkeys(entity_ids):
+            cached = self._entity_cache.get(entity_id)
+            if cached and cached[0] > now:
+                self._entity_cache.move_to_end(entity_id)
+                details[entity_id] = cached[1]
+            else:
+                missing.append(entity_id)
+        
+        if not missing:
+            return details
+        
         try:
             async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-                
-                # Try to fetch by itglue_id
-                entities = await uow.itglue.search(
-                    query=entity_id,
-                    limit=1
+                rows = await session.execute(
+                    select(ITGlueEntity).where(ITGlueEntity.itglue_id.in_(missing))
                 )
-                
-                if entities:
-                    entity = entities[0]
-                    return {
-                        "entity_id": str(entity.id),
-                        "itglue_id": entity.itglue_id,
-                        "name": entity.name,
-                        "entity_type": entity.entity_type,
-                        "organization_id": entity.organization_id,
-                        "attributes": entity.attributes
-                    }
-                
-                return None
-                
+                entities = rows.scalars().all()
         except Exception as e:
             logger.error(f"Failed to fetch entity details: {e}")
-            return None
+            return details
+        
+        expires_at = now + self.ENTITY_CACHE_TTL
+        for entity in entities:
+            record = {
+                "entity_id": str(entity.id),
+                "itglue_id": entity.itglue_id,
+                "name": entity.name,
+                "entity_type": entity.entity_type,
+                "organization_id": entity.organization_id,
+                "attributes": entity.attributes
+            }
+            details[entity.itglue_id] = record
+            self._entity_cache[entity.itglue_id] = (expires_at, record)
+            self._entity_cache.move_to_end(entity.itglue_id)
+        
+        while len(self._entity_cache) > self.ENTITY_CACHE_SIZE:
+            self._entity_cache.popitem(last=False)
+        
+        return details
     
     async def close(self):
         """Close all database connections."""
@@ -713,6 +823,7 @@ class UnifiedHybridSearch:
             if self.graph_traversal:
                 await self.graph_traversal.disconnect()
             
+            await self.embedding_generator.close()
             await db_manager.close()
             
             self._initialized = False
@@ -726,5 +837,6 @@ class UnifiedHybridSearch:
 __all__ = [
     'UnifiedHybridSearch',
     'UnifiedSearchResult',
+    'UnifiedSearchResults',
     'SearchMode'
 ]
\ No newline at end of file
@@ -1,10 +1,15 @@
 """IT Glue API client module."""
 
-from .client import ITGlueClient
+from .client import ITGlueClient, RateLimitError
 from .models import Configuration, Document, FlexibleAsset, Organization, Password
+from .rate_limiter import RedisTokenBucketRateLimiter, TokenBucketRateLimiter, get_rate_limiter
 
 __all__ = [
     "ITGlueClient",
+    "RateLimitError",
+    "TokenBucketRateLimiter",
+    "RedisTokenBucketRateLimiter",
+    "get_rate_limiter",
     "Organization",
     "Configuration",
     "FlexibleAsset",
@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, Optional, TypeVar
 
 import aiohttp
@@ -16,57 +17,50 @@ from .models import (
     Contact,
     Document,
     FlexibleAsset,
+    FlexibleAssetType,
     ITGlueModel,
     Location,
     Organization,
     Password,
 )
+from .rate_limiter import TokenBucketRateLimiter, get_rate_limiter, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=ITGlueModel)
 
+# Cache namespace holding the flexible asset type list, see cache_loaders
+FLEXIBLE_ASSET_TYPES_NAMESPACE = "flexible_asset_types"
 
-class RateLimiter:
-    """Rate limiter for API requests."""
 
-    def __init__(self, max_requests: int, time_window: int = 60):
-        """Initialize rate limiter.
+class RateLimitError(ClientError):
+    """Raised when the IT Glue API responds with 429 Too Many Requests."""
 
-        Args:
-            max_requests: Maximum requests allowed
-            time_window: Time window in seconds
-        """
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.requests = []
-        self._lock = asyncio.Lock()
-
-    async def acquire(self):
-        """Acquire permission to make a request."""
-        async with self._lock:
-            now = datetime.now()
 
-            # Remove old requests outside the time window
-            cutoff = now - timedelta(seconds=self.time_window)
-            self.requests = [req for req in self.requests if req > cutoff]
+def find_flexible_asset_type(
+    asset_types: list[FlexibleAssetType],
+    name: str
+) -> Optional[FlexibleAssetType]:
+    """Find an asset type by name, exactly first, then by partial match.
 
-            # Check if we can make a request
-            if len(self.requests) >= self.max_requests:
-                # Calculate wait time
-                oldest = self.requests[0]
-                wait_time = (oldest + timedelta(seconds=self.time_window) - now).total_seconds()
+    Args:
+        asset_types: Asset types to search
+        name: Name of the asset type (case-insensitive)
 
-                if wait_time > 0:
-                    logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
-                    await asyncio.sleep(wait_time)
+    Returns:
+        Matching asset type or None if not found
+    """
+    name_lower = name.lower()
+    for asset_type in asset_types:
+        if asset_type.name.lower() == name_lower:
+            return asset_type
 
-                    # Clean up again after waiting
-                    cutoff = datetime.now() - timedelta(seconds=self.time_window)
-                    self.requests = [req for req in self.requests if req > cutoff]
+    # Try partial match if exact match not found
+    for asset_type in asset_types:
+        if name_lower in asset_type.name.lower():
+            return asset_type
 
-            # Record this request
-            self.requests.append(datetime.now())
+    return None
 
 
 class ITGlueClient:
@@ -76,14 +70,18 @@ class ITGlueClient:
         self,
         api_key: Optional[str] = None,
         api_url: Optional[str] = None,
-        rate_limit: Optional[int] = None
+        rate_limit: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None
     ):
         """Initialize IT Glue client.
 
         Args:
             api_key: IT Glue API key
             api_url: IT Glue API URL
-            rate_limit: Maximum requests per minute
+            rate_limit: Maximum requests per minute (gives this client its own bucket)
+            page_concurrency: Maximum pages fetched concurrently by get_all_pages
+            rate_limiter: Rate limiter to use (defaults to the shared process limiter)
         """
         self.api_key = api_key or settings.itglue_api_key
         self.api_url = (api_url or settings.itglue_api_url).rstrip('/')
@@ -91,8 +89,16 @@ class ITGlueClient:
         if not self.api_key:
             raise ValueError("IT Glue API key is required")
 
-        self.rate_limiter = RateLimiter(
-            max_requests=rate_limit or getattr(settings, 'itglue_rate_limit', None) or 100
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        elif rate_limit:
+            self.rate_limiter = TokenBucketRateLimiter(max_requests=rate_limit)
+        else:
+            self.rate_limiter = get_rate_limiter()
+
+        self.page_concurrency = max(
+            1,
+            page_concurrency or getattr(settings, 'itglue_page_concurrency', None) or 1
         )
 
         self.session: Optional[aiohttp.ClientSession] = None
@@ -168,6 +174,12 @@ class ITGlueClient:
                 params=params,
                 json=data
             ) as response:
+                if response.status == 429:
+                    # Pause every caller sharing the limiter, then let backoff retry
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    await self.rate_limiter.penalize(retry_after)
+                    raise RateLimitError(f"API rate limit exceeded: {url}")
+
                 response_data = await response.json()
 
                 if response.status >= 400:
@@ -247,54 +259,156 @@ class ITGlueClient:
         """
         return await self._request("DELETE", endpoint)
 
-    async def get_all_pages(
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        params: dict,
+        page: int
+    ) -> dict[str, Any]:
+        """Fetch a single page of results.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (not modified)
+            page: Page number to fetch
+
+        Returns:
+            Raw page response
+        """
+        page_params = dict(params)
+        page_params["page[number]"] = page
+        return await self.get(endpoint, page_params)
+
+    async def iter_pages(
         self,
         endpoint: str,
         params: Optional[dict] = None,
-        max_pages: Optional[int] = None
-    ) -> list[dict[str, Any]]:
-        """Get all pages of results.
+        max_pages: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Iterate over pages of results as they arrive.
+
+        When the first page reports ``meta.total-pages`` and concurrency is
+        greater than one, up to ``concurrency`` later pages are prefetched in
+        a sliding window and yielded in page order. Otherwise ``links.next``
+        is followed one page at a time. Every request still goes through the
+        rate limiter, and at most ``concurrency`` pages are held in memory.
 
         Args:
             endpoint: API endpoint
             params: Query parameters
             max_pages: Maximum number of pages to fetch
+            concurrency: Maximum pages in flight (defaults to client setting)
 
-        Returns:
-            All results from all pages
+        Yields:
+            The ``data`` list of each page
         """
-        if params is None:
-            params = {}
+        params = dict(params or {})
 
         # Set page size
         if "page[size]" not in params:
             params["page[size]"] = 1000
 
-        all_data = []
-        page = 1
+        if concurrency is None:
+            concurrency = self.page_concurrency
 
-        while True:
-            params["page[number]"] = page
+        response = await self._fetch_page(endpoint, params, 1)
+        yield response.get("data", [])
 
-            response = await self.get(endpoint, params)
+        total_pages = response.get("meta", {}).get("total-pages")
 
-            data = response.get("data", [])
-            all_data.extend(data)
+        if concurrency > 1 and isinstance(total_pages, int) and total_pages > 1:
+            last_page = total_pages
+            if max_pages and last_page > max_pages:
+                logger.warning(f"Reached max pages limit: {max_pages}")
+                last_page = max_pages
+
+            pending: deque[asyncio.Task] = deque()
+            next_page = 2
+
+            try:
+                while next_page <= last_page or pending:
+                    while next_page <= last_page and len(pending) < concurrency:
+                        pending.append(asyncio.create_task(
+                            self._fetch_page(endpoint, params, next_page)
+                        ))
+                        next_page += 1
+
+                    page_response = await pending.popleft()
+                    yield page_response.get("data", [])
+            finally:
+                # Consumer stopped early or a page failed
+                for task in pending:
+                    task.cancel()
 
-            # Check if there are more pages
-            links = response.get("links", {})
-            if not links.get("next"):
-                break
+        else:
+            page = 1
 
-            page += 1
+            while response.get("links", {}).get("next"):
+                page += 1
 
-            if max_pages and page > max_pages:
-                logger.warning(f"Reached max pages limit: {max_pages}")
-                break
+                if max_pages and page > max_pages:
+                    logger.warning(f"Reached max pages limit: {max_pages}")
+                    break
+
+                response = await self._fetch_page(endpoint, params, page)
+                yield response.get("data", [])
+
+    async def get_all_pages(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        max_pages: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> list[dict[str, Any]]:
+        """Get all pages of results.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            max_pages: Maximum number of pages to fetch
+            concurrency: Maximum pages in flight (defaults to client setting)
+
+        Returns:
+            All results from all pages
+        """
+        all_data = []
+
+        async for data in self.iter_pages(endpoint, params, max_pages, concurrency):
+            all_data.extend(data)
 
         logger.info(f"Fetched {len(all_data)} items from {endpoint}")
         return all_data
 
+    async def _iter_models(
+        self,
+        endpoint: str,
+        params: dict,
+        model: type[T]
+    ) -> AsyncIterator[T]:
+        """Iterate over results of a paginated endpoint as models.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            model: Model class to build from each item
+
+        Yields:
+            One model per item
+        """
+        async for data in self.iter_pages(endpoint, params):
+            for item in data:
+                yield model(**item)
+
+    @staticmethod
+    def _filter_params(filters: Optional[dict]) -> dict[str, Any]:
+        """Convert a filter dict into IT Glue ``filter[...]`` parameters."""
+        params = {}
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        return params
+
     # Entity-specific methods
 
     async def get_organizations(
@@ -333,6 +447,14 @@ class ITGlueClient:
             logger.error(f"Failed to get organization {org_id}: {e}")
             return None
 
+    def cache_loaders(self) -> dict[str, Callable[[str], Awaitable[Any]]]:
+        """Get loaders that reload cached IT Glue resources by key.
+
+        Returns:
+            Loader by cache namespace, for ``CacheManager(loaders=...)``
+        """
+        return {FLEXIBLE_ASSET_TYPES_NAMESPACE: self.load_flexible_asset_types}
+
     async def get_configurations(
         self,
         org_id: Optional[str] = None,
@@ -599,6 +721,158 @@ class ITGlueClient:
         data = await self.get_all_pages(endpoint, params)
         return [Location(**item) for item in data]
 
+    # Streaming entity iterators
+
+    def iter_organizations(
+        self,
+        filters: Optional[dict] = None
+    ) -> AsyncIterator[Organization]:
+        """Iterate over organizations page by page.
+
+        Args:
+            filters: Optional filters
+
+        Returns:
+            Async iterator of organizations
+        """
+        return self._iter_models("organizations", self._filter_params(filters), Organization)
+
+    def iter_configurations(
+        self,
+        org_id: Optional[str] = None,
+        filters: Optional[dict] = None
+    ) -> AsyncIterator[Configuration]:
+        """Iterate over configurations page by page.
+
+        Args:
+            org_id: Organization ID (optional)
+            filters: Optional filters
+
+        Returns:
+            Async iterator of configurations
+        """
+        endpoint = f"organizations/{org_id}/relationships/configurations" if org_id else "configurations"
+        return self._iter_models(endpoint, self._filter_params(filters), Configuration)
+
+    async def iter_flexible_assets(
+        self,
+        org_id: Optional[str] = None,
+        asset_type_id: Optional[str] = None,
+        filters: Optional[dict] = None
+    ) -> AsyncIterator[FlexibleAsset]:
+        """Iterate over flexible assets page by page.
+
+        Like get_flexible_assets, yields nothing when no filter is given.
+
+        Args:
+            org_id: Organization ID (optional but recommended)
+            asset_type_id: Asset type ID (optional but recommended)
+            filters: Optional additional filters
+
+        Yields:
+            Flexible assets
+        """
+        params = {}
+        if org_id:
+            params["filter[organization-id]"] = org_id
+        if asset_type_id:
+            params["filter[flexible-asset-type-id]"] = asset_type_id
+        params.update(self._filter_params(filters))
+
+        if not params:
+            logger.warning("No filters provided for flexible assets - nothing to iterate")
+            return
+
+        try:
+            async for asset in self._iter_models("flexible_assets", params, FlexibleAsset):
+                yield asset
+        except Exception as e:
+            if "422" in str(e):
+                logger.warning(f"Flexible assets API returned 422 - likely missing required filters: {params}")
+                return
+            raise
+
+    def iter_passwords(
+        self,
+        org_id: Optional[str] = None,
+        filters: Optional[dict] = None
+    ) -> AsyncIterator[Password]:
+        """Iterate over passwords page by page.
+
+        Args:
+            org_id: Organization ID (optional)
+            filters: Optional filters
+
+        Returns:
+            Async iterator of passwords
+        """
+        endpoint = f"organizations/{org_id}/relationships/passwords" if org_id else "passwords"
+        return self._iter_models(endpoint, self._filter_params(filters), Password)
+
+    async def iter_documents(
+        self,
+        org_id: Optional[str] = None,
+        filters: Optional[dict] = None
+    ) -> AsyncIterator[Document]:
+        """Iterate over API-created documents page by page.
+
+        Without an organization, each organization is walked in turn since
+        the global documents endpoint is not available.
+
+        Args:
+            org_id: Organization ID (optional)
+            filters: Optional filters
+
+        Yields:
+            Documents
+        """
+        if org_id:
+            endpoint = f"organizations/{org_id}/relationships/documents"
+            async for document in self._iter_models(endpoint, self._filter_params(filters), Document):
+                yield document
+            return
+
+        async for org in self.iter_organizations():
+            try:
+                async for document in self.iter_documents(org_id=org.id, filters=filters):
+                    yield document
+            except Exception as e:
+                logger.error(f"Failed to get documents for org {org.id}: {e}")
+
+    def iter_contacts(
+        self,
+        org_id: Optional[str] = None,
+        filters: Optional[dict] = None
+    ) -> AsyncIterator[Contact]:
+        """Iterate over contacts page by page.
+
+        Args:
+            org_id: Organization ID (optional)
+            filters: Optional filters
+
+        Returns:
+            Async iterator of contacts
+        """
+        endpoint = f"organizations/{org_id}/relationships/contacts" if org_id else "contacts"
+        return self._iter_models(endpoint, self._filter_params(filters), Contact)
+
+    def iter_locations(
+        self,
+        org_id: Optional[str] = None,
+        filters: Optional[dict] = None
+    ) -> AsyncIterator[Location]:
+        """Iterate over locations page by page.
+
+        Args:
+            org_id: Organization ID (optional)
+            filters: Optional filters
+
+        Returns:
+            Async iterator of locations
+        """
+        endpoint = f"organizations/{org_id}/relationships/locations" if org_id else "locations"
+        return self._iter_models(endpoint, self._filter_params(filters), Location)
+
     async def get_flexible_asset_types(
         self,
         include_fields: bool = True
@@ -664,19 +938,22 @@ class ITGlueClient:
             FlexibleAssetType object or None if not found
         """
         asset_types = await self.get_flexible_asset_types(include_fields=True)
+        return find_flexible_asset_type(asset_types, name)
 
-        # Case-insensitive search
-        name_lower = name.lower()
-        for asset_type in asset_types:
-            if asset_type.name.lower() == name_lower:
-                return asset_type
+    async def load_flexible_asset_types(self, key: str = "all") -> list[dict[str, Any]]:
+        """Load all flexible asset types with their fields for caching.
 
-        # Try partial match if exact match not found
-        for asset_type in asset_types:
-            if name_lower in asset_type.name.lower():
-                return asset_type
+        Loader for the ``flexible_asset_types`` cache namespace, which holds
+        the whole list under a single key.
 
-        return None
+        Args:
+            key: Cache key of the list (ignored)
+
+        Returns:
+            Asset types as JSON-compatible dictionaries
+        """
+        asset_types = await self.get_flexible_asset_types(include_fields=True)
+        return [asset_type.model_dump(mode="json") for asset_type in asset_types]
 
     async def get_flexible_asset_fields(
         self,
@@ -0,0 +1,318 @@
+"""Token-bucket rate limiting shared by every IT Glue API caller."""
+
+import asyncio
+import logging
+import time
+import weakref
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+import redis.asyncio as redis
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Pause applied after a 429 that carries no usable Retry-After header
+DEFAULT_RETRY_AFTER = 10.0
+
+# Errors that make the shared bucket unusable: Redis failures, sockets that
+# cannot connect, and clients used after their event loop closed
+_REDIS_FAILURES = (redis.RedisError, ConnectionError, OSError, RuntimeError)
+
+# Atomically refill the bucket, reserve one token and return the wait in ms.
+# Uses the Redis server clock so every process shares one time base.
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+
+tokens = math.min(capacity, tokens + (now - ts) * rate) - 1
+
+local wait = 0
+if tokens < 0 then
+    wait = math.ceil(-tokens / rate)
+end
+
+local blocked_until = tonumber(redis.call('GET', KEYS[2]) or '0')
+if blocked_until - now > wait then
+    wait = blocked_until - now
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate) + wait + 1000)
+return wait
+"""
+
+# Return the ms until more than ARGV[3] tokens are free, without reserving any
+_SPARE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local needed = tonumber(ARGV[3]) + 1
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+
+local wait = 0
+if tokens < needed then
+    wait = math.ceil((needed - tokens) / rate)
+end
+
+local blocked_until = tonumber(redis.call('GET', KEYS[2]) or '0')
+if blocked_until - now > wait then
+    wait = blocked_until - now
+end
+return wait
+"""
+
+# Push the shared block deadline forward, never backwards
+_PENALIZE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local delay = tonumber(ARGV[1])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if now + delay > current then
+    redis.call('SET', KEYS[1], now + delay, 'PX', delay)
+end
+return 1
+"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucketRateLimiter:
+    """In-process token-bucket rate limiter.
+
+    Acquiring is O(1): the bucket is refilled from the elapsed time and a
+    token is reserved before sleeping, so concurrent callers queue up
+    fairly without holding a lock across the wait.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        time_window: float = 60,
+        burst: Optional[int] = None
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            max_requests: Maximum requests allowed per time window
+            time_window: Time window in seconds
+            burst: Maximum requests allowed back to back (defaults to max_requests)
+        """
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.rate = max_requests / time_window
+        self.capacity = float(burst or max_requests)
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _reserve(self) -> float:
+        """Reserve one token and return the seconds to wait for it."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate
+        ) - 1
+        self._updated = now
+
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        return max(wait, self._blocked_until - now)
+
+    async def acquire(self):
+        """Acquire permission to make a request."""
+        wait = self._reserve()
+        if wait > 0:
+            logger.debug(f"Rate limit reached, waiting {wait:.2f} seconds")
+            await asyncio.sleep(wait)
+
+    async def time_until_spare(self, reserve: float) -> float:
+        """Get the seconds until a token is free beyond ``reserve``.
+
+        Nothing is reserved, so background work can check whether it would
+        eat into the tokens kept for interactive callers.
+
+        Args:
+            reserve: Tokens to leave for other callers
+
+        Returns:
+            Seconds to wait, 0 if a spare token is free now
+        """
+        now = time.monotonic()
+        tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        wait = (reserve + 1 - tokens) / self.rate if tokens < reserve + 1 else 0.0
+        return max(wait, self._blocked_until - now)
+
+    async def penalize(self, retry_after: Optional[float] = None):
+        """Pause all callers after the API reported throttling.
+
+        Args:
+            retry_after: Seconds to pause (defaults to DEFAULT_RETRY_AFTER)
+        """
+        delay = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self._tokens = min(self._tokens, 0.0)
+        logger.warning(f"IT Glue API throttled, pausing requests for {delay:.1f} seconds")
+
+
+class RedisTokenBucketRateLimiter(TokenBucketRateLimiter):
+    """Token-bucket rate limiter whose bucket lives in Redis.
+
+    Every process using the same key draws from one shared quota, so the
+    MCP server, API and Celery workers can share an API key without
+    tripping throttling. Falls back to the in-process bucket if Redis is
+    unreachable.
+
+    redis.asyncio connections belong to the event loop that opened them,
+    so each running loop gets its own client.
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        time_window: float = 60,
+        burst: Optional[int] = None,
+        redis_url: Optional[str] = None,
+        key: str = "itglue:ratelimit"
+    ):
+        """Initialize distributed rate limiter.
+
+        Args:
+            max_requests: Maximum requests allowed per time window
+            time_window: Time window in seconds
+            burst: Maximum requests allowed back to back
+            redis_url: Redis connection URL
+            key: Redis key prefix for the bucket state
+        """
+        super().__init__(max_requests, time_window, burst)
+        self.redis_url = redis_url or settings.redis_url
+        self.bucket_key = f"{key}:bucket"
+        self.block_key = f"{key}:blocked_until"
+
+        # Event loop -> (client, acquire script, penalize script, spare script)
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _connect(self) -> tuple:
+        """Get the Redis client and scripts for the running event loop."""
+        loop = asyncio.get_running_loop()
+        connection = self._clients.get(loop)
+        if connection is None:
+            client = redis.Redis.from_url(self.redis_url)
+            connection = (
+                client,
+                client.register_script(_ACQUIRE_SCRIPT),
+                client.register_script(_PENALIZE_SCRIPT),
+                client.register_script(_SPARE_SCRIPT)
+            )
+            self._clients[loop] = connection
+        return connection
+
+    async def acquire(self):
+        """Acquire permission to make a request from the shared bucket."""
+        try:
+            _, acquire_script, _, _ = self._connect()
+            wait_ms = await acquire_script(
+                keys=[self.bucket_key, self.block_key],
+                args=[self.rate / 1000, self.capacity]
+            )
+        except _REDIS_FAILURES as e:
+            logger.warning(f"Distributed rate limiter unavailable, using local bucket: {e}")
+            await super().acquire()
+            return
+
+        if wait_ms > 0:
+            logger.debug(f"Rate limit reached, waiting {wait_ms / 1000:.2f} seconds")
+            await asyncio.sleep(wait_ms / 1000)
+
+    async def time_until_spare(self, reserve: float) -> float:
+        """Get the seconds until the shared bucket has a token beyond ``reserve``.
+
+        Args:
+            reserve: Tokens to leave for other callers
+
+        Returns:
+            Seconds to wait, 0 if a spare token is free now
+        """
+        try:
+            _, _, _, spare_script = self._connect()
+            wait_ms = await spare_script(
+                keys=[self.bucket_key, self.block_key],
+                args=[self.rate / 1000, self.capacity, reserve]
+            )
+        except _REDIS_FAILURES as e:
+            logger.debug(f"Distributed rate limiter unavailable, using local bucket: {e}")
+            return await super().time_until_spare(reserve)
+
+        return wait_ms / 1000
+
+    async def penalize(self, retry_after: Optional[float] = None):
+        """Pause callers in every process after the API reported throttling.
+
+        Args:
+            retry_after: Seconds to pause (defaults to DEFAULT_RETRY_AFTER)
+        """
+        await super().penalize(retry_after)
+
+        delay = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+        try:
+            _, _, penalize_script, _ = self._connect()
+            await penalize_script(
+                keys=[self.block_key],
+                args=[max(1, int(delay * 1000))]
+            )
+        except _REDIS_FAILURES as e:
+            logger.warning(f"Failed to share rate limit pause: {e}")
+
+
+@lru_cache
+def get_rate_limiter() -> TokenBucketRateLimiter:
+    """Get the process-wide IT Glue rate limiter.
+
+    Uses a Redis-backed bucket when ``itglue_rate_limit_distributed`` is
+    enabled so all processes sharing the API key share one quota.
+    """
+    max_requests = getattr(settings, 'itglue_rate_limit', None) or 100
+    burst = getattr(settings, 'itglue_rate_limit_burst', None)
+
+    if getattr(settings, 'itglue_rate_limit_distributed', False):
+        return RedisTokenBucketRateLimiter(max_requests, burst=burst)
+    return TokenBucketRateLimiter(max_requests, burst=burst)
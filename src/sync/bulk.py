@@ -0,0 +1,252 @@
+"""Bulk database writes for the sync pipeline.
+
+Each call turns a whole batch into one multi-row statement per chunk
+instead of one round trip per entity.
+"""
+
+import hashlib
+import json
+import logging
+import uuid
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, DateTime, Integer, String, column, func, table
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# asyncpg allows at most 32767 bind parameters per statement
+MAX_ROWS_PER_STATEMENT = 1000
+
+itglue_entities = table(
+    "itglue_entities",
+    column("id", UUID(as_uuid=True)),
+    column("itglue_id", String),
+    column("entity_type", String),
+    column("organization_id", String),
+    column("name", String),
+    column("attributes", JSON),
+    column("relationships", JSON),
+    column("search_text", String),
+    column("updated_at", DateTime),
+    column("last_synced", DateTime),
+    column("content_hash", String),
+)
+
+embedding_queue = table(
+    "embedding_queue",
+    column("id", UUID(as_uuid=True)),
+    column("entity_id", String),
+    column("entity_type", String),
+    column("status", String),
+    column("attempts", Integer),
+)
+
+# Columns refreshed when an entity already exists
+_UPSERT_COLUMNS = (
+    "entity_type",
+    "organization_id",
+    "name",
+    "attributes",
+    "relationships",
+    "search_text",
+    "last_synced",
+    "content_hash",
+)
+
+
+def compute_content_hash(
+    attributes: Optional[dict[str, Any]],
+    relationships: Optional[dict[str, Any]]
+) -> str:
+    """Compute a stable hash of an entity's content.
+
+    Keys are sorted so the hash does not depend on the order the API
+    returned them in.
+
+    Args:
+        attributes: Entity attributes
+        relationships: Entity relationships
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    canonical = json.dumps(
+        {"attributes": attributes or {}, "relationships": relationships or {}},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _chunks(rows: list[dict[str, Any]], size: int) -> Iterable[list[dict[str, Any]]]:
+    """Split rows into statement-sized chunks."""
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+async def bulk_upsert_entities(
+    session: AsyncSession,
+    entities: list[dict[str, Any]],
+    skip_unchanged: bool = True
+) -> dict[str, str]:
+    """Insert or update many IT Glue entities.
+
+    Uses ``INSERT ... ON CONFLICT (itglue_id) DO UPDATE`` with one
+    statement per chunk of MAX_ROWS_PER_STATEMENT rows. When the same
+    itglue_id appears more than once, the last occurrence wins.
+
+    With skip_unchanged, existing rows whose content hash matches are left
+    untouched and are not returned, so callers only re-embed and re-graph
+    entities that actually changed.
+
+    Args:
+        session: Database session (caller commits)
+        entities: Entity dicts with itglue_id, entity_type, organization_id,
+            name, attributes, relationships, search_text and last_synced
+        skip_unchanged: Skip rows whose content hash is unchanged
+
+    Returns:
+        Mapping of itglue_id to internal entity ID for inserted or updated rows
+    """
+    # ON CONFLICT cannot touch the same row twice in one statement
+    rows_by_id: dict[str, dict[str, Any]] = {}
+    now = datetime.utcnow()
+    for entity in entities:
+        itglue_id = str(entity["itglue_id"])
+        attributes = entity.get("attributes") or {}
+        relationships = entity.get("relationships") or {}
+        rows_by_id[itglue_id] = {
+            "id": uuid.uuid4(),
+            "itglue_id": itglue_id,
+            "entity_type": entity["entity_type"],
+            "organization_id": entity.get("organization_id"),
+            "name": entity.get("name") or "",
+            "attributes": attributes,
+            "relationships": relationships,
+            "search_text": entity.get("search_text"),
+            "last_synced": entity.get("last_synced") or now,
+            "content_hash": entity.get("content_hash")
+            or compute_content_hash(attributes, relationships),
+        }
+
+    ids: dict[str, str] = {}
+    for chunk in _chunks(list(rows_by_id.values()), MAX_ROWS_PER_STATEMENT):
+        stmt = insert(itglue_entities).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["itglue_id"],
+            set_={
+                **{name: stmt.excluded[name] for name in _UPSERT_COLUMNS},
+                "updated_at": func.now(),
+            },
+            where=(
+                itglue_entities.c.content_hash.is_distinct_from(stmt.excluded.content_hash)
+                if skip_unchanged else None
+            )
+        ).returning(itglue_entities.c.id, itglue_entities.c.itglue_id)
+
+        result = await session.execute(stmt)
+        for entity_id, itglue_id in result:
+            ids[itglue_id] = str(entity_id)
+
+    logger.debug(
+        f"Bulk upserted {len(ids)} entities, "
+        f"{len(rows_by_id) - len(ids)} unchanged"
+    )
+    return ids
+
+
+async def bulk_add_to_embedding_queue(
+    session: AsyncSession,
+    items: list[tuple[str, str]]
+) -> int:
+    """Queue many entities for embedding generation.
+
+    Args:
+        session: Database session (caller commits)
+        items: (entity_id, entity_type) pairs
+
+    Returns:
+        Number of queue rows inserted
+    """
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "entity_id": str(entity_id),
+            "entity_type": entity_type,
+            "status": "pending",
+            "attempts": 0,
+        }
+        for entity_id, entity_type in dict.fromkeys(items)
+    ]
+
+    for chunk in _chunks(rows, MAX_ROWS_PER_STATEMENT):
+        await session.execute(insert(embedding_queue).values(chunk))
+
+    logger.debug(f"Queued {len(rows)} entities for embedding")
+    return len(rows)
+
+
+async def store_entities(
+    session: AsyncSession,
+    entity_type: str,
+    entity_dicts: list[dict[str, Any]]
+) -> tuple[int, int]:
+    """Upsert a batch of entities and queue the changed ones for embedding.
+
+    The batch is written in bulk under a savepoint. If that fails, it is
+    rolled back and retried one entity at a time, so one bad entity does
+    not drop the batch.
+
+    Args:
+        session: Database session (caller commits)
+        entity_type: Entity type the queue rows are recorded under
+        entity_dicts: Prepared entity rows
+
+    Returns:
+        Number of entities inserted or changed, and number that failed
+    """
+    if not entity_dicts:
+        return 0, 0
+
+    try:
+        async with session.begin_nested():
+            return await _store(session, entity_type, entity_dicts), 0
+    except Exception as e:
+        logger.warning(
+            f"Bulk write of {len(entity_dicts)} {entity_type} failed, "
+            f"retrying one at a time: {e}"
+        )
+
+    changed = failed = 0
+    for entity_dict in entity_dicts:
+        try:
+            async with session.begin_nested():
+                changed += await _store(session, entity_type, [entity_dict])
+        except Exception as e:
+            failed += 1
+            logger.error(f"Failed to store entity {entity_dict['itglue_id']}: {e}")
+
+    return changed, failed
+
+
+async def _store(
+    session: AsyncSession,
+    entity_type: str,
+    entity_dicts: list[dict[str, Any]]
+) -> int:
+    """Upsert entities, skipping unchanged ones, and queue the rest."""
+    entity_ids = await bulk_upsert_entities(session, entity_dicts)
+
+    if entity_ids:
+        await bulk_add_to_embedding_queue(
+            session,
+            [(entity_id, entity_type) for entity_id in entity_ids.values()]
+        )
+
+    return len(entity_ids)
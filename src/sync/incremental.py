@@ -5,9 +5,13 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.data import UnitOfWork, db_manager
 from src.services.itglue.client import ITGlueClient
 
+from .bulk import store_entities
+
 logger = logging.getLogger(__name__)
 
 
@@ -137,6 +141,7 @@ class IncrementalSync:
                 # Process changes
                 changed_count = await self._process_changes(
                     uow,
+                    session,
                     entity_type,
                     changed_entities
                 )
@@ -243,13 +248,18 @@ class IncrementalSync:
     async def _process_changes(
         self,
         uow: UnitOfWork,
+        session: AsyncSession,
         entity_type: str,
         changed_entities: list[dict[str, Any]]
     ) -> int:
         """Process changed entities.
 
+        Each batch is written with one bulk upsert and one bulk queue insert,
+        falling back to one entity at a time if the bulk write fails.
+
         Args:
             uow: Unit of work
+            session: Database session backing the unit of work
             entity_type: Type of entity
             changed_entities: List of changed entities
 
@@ -260,14 +270,12 @@ class IncrementalSync:
 
         for i in range(0, len(changed_entities), self.batch_size):
             batch = changed_entities[i:i + self.batch_size]
+            entity_dicts = []
 
             for entity_data in batch:
                 try:
-                    # Extract searchable text
-                    search_text = self._extract_search_text(entity_data)
-
                     # Prepare entity
-                    entity_dict = {
+                    entity_dicts.append({
                         "itglue_id": entity_data["id"],
                         "entity_type": entity_type.rstrip('s'),
                         "organization_id": entity_data.get("relationships", {}).get(
@@ -276,26 +284,19 @@ class IncrementalSync:
                         "name": entity_data.get("attributes", {}).get("name", ""),
                         "attributes": entity_data.get("attributes", {}),
                         "relationships": entity_data.get("relationships", {}),
-                        "search_text": search_text,
+                        "search_text": self._extract_search_text(entity_data),
                         "last_synced": datetime.utcnow()
-                    }
-
-                    # Upsert entity
-                    entity = await uow.itglue.upsert(**entity_dict)
-
-                    # Add to embedding queue for re-generation
-                    await uow.embedding_queue.add_to_queue(
-                        entity_id=str(entity.id),
-                        entity_type=entity_type
-                    )
-
-                    count += 1
+                    })
 
                 except Exception as e:
                     logger.error(
                         f"Failed to process changed entity {entity_data.get('id')}: {e}"
                     )
 
+            # Upsert entities and queue them for re-generation of embeddings
+            changed, _ = await store_entities(session, entity_type, entity_dicts)
+            count += changed
+
             # Commit batch
             await uow.commit()
 
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 import aiohttp
 from dataclasses import dataclass
@@ -10,7 +10,13 @@ import json
 
 from src.config.settings import settings
 from src.data import db_manager, UnitOfWork
-from src.data.models import ITGlueEntity
+from src.services.itglue.rate_limiter import (
+    TokenBucketRateLimiter,
+    get_rate_limiter,
+    parse_retry_after
+)
+from src.sync.bulk import bulk_upsert_entities
+from src.sync.scheduler import SyncCheckpoint, SyncJob, SyncScheduler
 from sqlalchemy import text
 
 logger = logging.getLogger(__name__)
@@ -18,46 +24,35 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class RateLimiter:
-    """Rate limiter for IT Glue API compliance."""
+    """Rate limiter for IT Glue API compliance.
+
+    Thin wrapper over a token bucket: the per-minute limit sets the refill
+    rate and the 10-second limit sets the burst size. Without explicit
+    limits it draws from the process-wide limiter shared with ITGlueClient.
+    """
     
-    max_requests_per_minute: int = 100  # IT Glue's standard limit
-    max_requests_per_10_seconds: int = 10  # Conservative burst limit
-    request_times: List[datetime] = None
+    max_requests_per_minute: Optional[int] = None
+    max_requests_per_10_seconds: Optional[int] = None
+    bucket: Optional[TokenBucketRateLimiter] = None
     
     def __post_init__(self):
-        self.request_times = []
+        if self.bucket is not None:
+            return
+        if self.max_requests_per_minute or self.max_requests_per_10_seconds:
+            self.bucket = TokenBucketRateLimiter(
+                max_requests=self.max_requests_per_minute or 100,
+                burst=self.max_requests_per_10_seconds or 10
+            )
+        else:
+            self.bucket = get_rate_limiter()
     
     async def wait_if_needed(self):
         """Wait if we're hitting rate limits."""
-        now = datetime.now()
-        
-        # Clean old requests (older than 1 minute)
-        self.request_times = [
-            t for t in self.request_times 
-            if now - t < timedelta(minutes=1)
-        ]
-        
-        # Check 10-second window
-        recent_10s = [
-            t for t in self.request_times 
-            if now - t < timedelta(seconds=10)
-        ]
-        
-        if len(recent_10s) >= self.max_requests_per_10_seconds:
-            wait_time = 10 - (now - recent_10s[0]).total_seconds()
-            if wait_time > 0:
-                logger.info(f"Rate limit: waiting {wait_time:.1f}s (10s window)")
-                await asyncio.sleep(wait_time)
-        
-        # Check 1-minute window
-        if len(self.request_times) >= self.max_requests_per_minute:
-            wait_time = 60 - (now - self.request_times[0]).total_seconds()
-            if wait_time > 0:
-                logger.info(f"Rate limit: waiting {wait_time:.1f}s (60s window)")
-                await asyncio.sleep(wait_time)
-        
-        # Record this request
-        self.request_times.append(now)
+        await self.bucket.acquire()
+    
+    async def penalize(self, retry_after: Optional[float] = None):
+        """Pause requests after the API responded with 429."""
+        await self.bucket.penalize(retry_after)
 
 
 class ITGlueAPIClient:
@@ -66,9 +61,7 @@ class ITGlueAPIClient:
     def __init__(self):
         self.base_url = settings.itglue_api_url
         self.api_key = settings.itglue_api_key
-        self.rate_limiter = RateLimiter(
-            max_requests_per_minute=settings.itglue_rate_limit
-        )
+        self.rate_limiter = RateLimiter()
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
@@ -86,20 +79,35 @@ class ITGlueAPIClient:
         if self.session:
             await self.session.close()
     
-    async def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make a GET request with rate limiting."""
-        await self.rate_limiter.wait_if_needed()
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        max_retries: int = 3
+    ) -> Dict:
+        """Make a GET request with rate limiting.
         
+        A 429 response pauses the shared limiter for the Retry-After
+        period and the request is retried up to max_retries times.
+        """
         url = f"{self.base_url}/{endpoint}"
         
-        try:
-            async with self.session.get(url, params=params) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data
-        except aiohttp.ClientError as e:
-            logger.error(f"API request failed: {e}")
-            raise
+        for attempt in range(max_retries):
+            await self.rate_limiter.wait_if_needed()
+            
+            try:
+                async with self.session.get(url, params=params) as response:
+                    if response.status == 429 and attempt < max_retries - 1:
+                        await self.rate_limiter.penalize(
+                            parse_retry_after(response.headers.get('Retry-After'))
+                        )
+                        continue
+                    response.raise_for_status()
+                    data = await response.json()
+                    return data
+            except aiohttp.ClientError as e:
+                logger.error(f"API request failed: {e}")
+                raise
     
     async def get_paginated(
         self, 
@@ -144,8 +152,19 @@ class ITGlueAPIClient:
 class ITGlueSyncManager:
     """Manages syncing IT Glue data to all databases."""
     
+    # Entity types synced for each organization
+    ENTITY_TYPES = [
+        'configurations',
+        'passwords',
+        'documents',
+        'flexible_assets',
+        'contacts',
+        'locations'
+    ]
+    
     def __init__(self):
         self.api_client = ITGlueAPIClient()
+        self.job_stats: Dict[str, Any] = {}
         self.stats = {
             'organizations': 0,
             'configurations': 0,
@@ -154,11 +173,22 @@ class ITGlueSyncManager:
             'flexible_assets': 0,
             'contacts': 0,
             'locations': 0,
+            'unchanged': 0,
             'errors': 0
         }
     
-    async def sync_all(self, organization_ids: Optional[List[str]] = None):
-        """Sync all IT Glue data with rate limiting."""
+    async def sync_all(
+        self,
+        organization_ids: Optional[List[str]] = None,
+        max_concurrency: Optional[int] = None,
+        run_id: Optional[str] = None
+    ):
+        """Sync all IT Glue data with rate limiting.
+        
+        Organization x entity-type jobs run concurrently under
+        max_concurrency; pass the same run_id again to resume a run that
+        had failed jobs.
+        """
         logger.info("=" * 60)
         logger.info("Starting IT Glue sync with rate limiting")
         logger.info(f"Rate limit: {settings.itglue_rate_limit} requests/minute")
@@ -173,22 +203,18 @@ class ITGlueSyncManager:
                 # Get organization IDs from database
                 organization_ids = await self.get_organization_ids()
             
-            # 2. Sync data for each organization
-            for org_id in organization_ids:
-                logger.info(f"\n📁 Syncing organization {org_id}")
-                
-                # Sync various entity types
-                await self.sync_configurations(org_id)
-                await self.sync_passwords(org_id)
-                await self.sync_documents(org_id)
-                await self.sync_flexible_assets(org_id)
-                await self.sync_contacts(org_id)
-                await self.sync_locations(org_id)
-                
-                # Generate embeddings and update graphs periodically
-                if self.stats['configurations'] % 50 == 0:
-                    await self.generate_embeddings_batch()
-                    await self.update_graph_relationships()
+            # 2. Sync every organization x entity type concurrently
+            scheduler = SyncScheduler(
+                self.run_sync_job,
+                max_concurrency=max_concurrency,
+                progress_callback=self.log_job_progress,
+                checkpoint=SyncCheckpoint(run_id) if run_id else None
+            )
+            self.job_stats = await scheduler.run([
+                SyncJob(org_id, entity_type)
+                for org_id in organization_ids
+                for entity_type in self.ENTITY_TYPES
+            ])
         
         # Final batch processing
         await self.generate_embeddings_batch()
@@ -204,26 +230,12 @@ class ITGlueSyncManager:
         try:
             orgs = await self.api_client.get_paginated('organizations')
             
-            async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-                
-                for org_data in orgs:
-                    entity = ITGlueEntity(
-                        itglue_id=str(org_data['id']),
-                        entity_type='organization',
-                        organization_id=None,  # Organizations don't have parent org
-                        name=org_data['attributes'].get('name'),
-                        attributes=org_data['attributes'],
-                        relationships=org_data.get('relationships', {}),
-                        search_text=self.build_search_text(org_data),
-                        last_synced=datetime.utcnow()
-                    )
-                    
-                    await uow.itglue.create_or_update(entity)
-                    self.stats['organizations'] += 1
-                
-                await uow.commit()
-                logger.info(f"✅ Synced {self.stats['organizations']} organizations")
+            # Organizations don't have parent org
+            self.stats['organizations'] += await self.store_entities([
+                self.build_entity_row(org_data, 'organization', None)
+                for org_data in orgs
+            ])
+            logger.info(f"✅ Synced {self.stats['organizations']} organizations")
                 
         except Exception as e:
             logger.error(f"Failed to sync organizations: {e}")
@@ -239,32 +251,18 @@ class ITGlueSyncManager:
                 params={'filter[organization_id]': org_id}
             )
             
-            async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-                count = 0
-                
-                for config_data in configs:
-                    entity = ITGlueEntity(
-                        itglue_id=str(config_data['id']),
-                        entity_type='configuration',
-                        organization_id=org_id,
-                        name=config_data['attributes'].get('name'),
-                        attributes=config_data['attributes'],
-                        relationships=config_data.get('relationships', {}),
-                        search_text=self.build_search_text(config_data),
-                        last_synced=datetime.utcnow()
-                    )
-                    
-                    await uow.itglue.create_or_update(entity)
-                    count += 1
-                
-                await uow.commit()
-                self.stats['configurations'] += count
-                logger.info(f"    ✅ {count} configurations")
+            count = await self.store_entities([
+                self.build_entity_row(config_data, 'configuration', org_id)
+                for config_data in configs
+            ])
+            self.stats['configurations'] += count
+            logger.info(f"    ✅ {count} configurations")
+            return count
                 
         except Exception as e:
             logger.error(f"Failed to sync configurations: {e}")
             self.stats['errors'] += 1
+            raise
     
     async def sync_passwords(self, org_id: str):
         """Sync passwords for an organization (metadata only)."""
@@ -276,36 +274,26 @@ class ITGlueSyncManager:
                 params={'filter[organization_id]': org_id}
             )
             
-            async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-                count = 0
-                
-                for pwd_data in passwords:
+            count = await self.store_entities([
+                self.build_entity_row(
+                    pwd_data,
+                    'password',
+                    org_id,
                     # Remove actual password from attributes for security
-                    attrs = pwd_data['attributes'].copy()
-                    attrs.pop('password', None)
-                    
-                    entity = ITGlueEntity(
-                        itglue_id=str(pwd_data['id']),
-                        entity_type='password',
-                        organization_id=org_id,
-                        name=pwd_data['attributes'].get('name'),
-                        attributes=attrs,
-                        relationships=pwd_data.get('relationships', {}),
-                        search_text=self.build_search_text(pwd_data),
-                        last_synced=datetime.utcnow()
-                    )
-                    
-                    await uow.itglue.create_or_update(entity)
-                    count += 1
-                
-                await uow.commit()
-                self.stats['passwords'] += count
-                logger.info(f"    ✅ {count} passwords")
+                    attributes={
+                        k: v for k, v in pwd_data['attributes'].items() if k != 'password'
+                    }
+                )
+                for pwd_data in passwords
+            ])
+            self.stats['passwords'] += count
+            logger.info(f"    ✅ {count} passwords")
+            return count
                 
         except Exception as e:
             logger.error(f"Failed to sync passwords: {e}")
             self.stats['errors'] += 1
+            raise
     
     async def sync_documents(self, org_id: str):
         """Sync documents for an organization."""
@@ -317,32 +305,18 @@ class ITGlueSyncManager:
                 params={'filter[organization_id]': org_id}
             )
             
-            async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-                count = 0
-                
-                for doc_data in documents:
-                    entity = ITGlueEntity(
-                        itglue_id=str(doc_data['id']),
-                        entity_type='document',
-                        organization_id=org_id,
-                        name=doc_data['attributes'].get('name'),
-                        attributes=doc_data['attributes'],
-                        relationships=doc_data.get('relationships', {}),
-                        search_text=self.build_search_text(doc_data),
-                        last_synced=datetime.utcnow()
-                    )
-                    
-                    await uow.itglue.create_or_update(entity)
-                    count += 1
-                
-                await uow.commit()
-                self.stats['documents'] += count
-                logger.info(f"    ✅ {count} documents")
+            count = await self.store_entities([
+                self.build_entity_row(doc_data, 'document', org_id)
+                for doc_data in documents
+            ])
+            self.stats['documents'] += count
+            logger.info(f"    ✅ {count} documents")
+            return count
                 
         except Exception as e:
             logger.error(f"Failed to sync documents: {e}")
             self.stats['errors'] += 1
+            raise
     
     async def sync_flexible_assets(self, org_id: str):
         """Sync flexible assets for an organization."""
@@ -354,32 +328,18 @@ class ITGlueSyncManager:
                 params={'filter[organization_id]': org_id}
             )
             
-            async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-                count = 0
-                
-                for asset_data in assets:
-                    entity = ITGlueEntity(
-                        itglue_id=str(asset_data['id']),
-                        entity_type='flexible_asset',
-                        organization_id=org_id,
-                        name=asset_data['attributes'].get('name'),
-                        attributes=asset_data['attributes'],
-                        relationships=asset_data.get('relationships', {}),
-                        search_text=self.build_search_text(asset_data),
-                        last_synced=datetime.utcnow()
-                    )
-                    
-                    await uow.itglue.create_or_update(entity)
-                    count += 1
-                
-                await uow.commit()
-                self.stats['flexible_assets'] += count
-                logger.info(f"    ✅ {count} flexible assets")
+            count = await self.store_entities([
+                self.build_entity_row(asset_data, 'flexible_asset', org_id)
+                for asset_data in assets
+            ])
+            self.stats['flexible_assets'] += count
+            logger.info(f"    ✅ {count} flexible assets")
+            return count
                 
         except Exception as e:
             logger.error(f"Failed to sync flexible assets: {e}")
             self.stats['errors'] += 1
+            raise
     
     async def sync_contacts(self, org_id: str):
         """Sync contacts for an organization."""
@@ -391,34 +351,23 @@ class ITGlueSyncManager:
                 params={'filter[organization_id]': org_id}
             )
             
-            async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-                count = 0
-                
-                for contact_data in contacts:
-                    name = f"{contact_data['attributes'].get('first_name', '')} {contact_data['attributes'].get('last_name', '')}".strip()
-                    
-                    entity = ITGlueEntity(
-                        itglue_id=str(contact_data['id']),
-                        entity_type='contact',
-                        organization_id=org_id,
-                        name=name,
-                        attributes=contact_data['attributes'],
-                        relationships=contact_data.get('relationships', {}),
-                        search_text=self.build_search_text(contact_data),
-                        last_synced=datetime.utcnow()
-                    )
-                    
-                    await uow.itglue.create_or_update(entity)
-                    count += 1
-                
-                await uow.commit()
-                self.stats['contacts'] += count
-                logger.info(f"    ✅ {count} contacts")
+            count = await self.store_entities([
+                self.build_entity_row(
+                    contact_data,
+                    'contact',
+                    org_id,
+                    name=f"{contact_data['attributes'].get('first_name', '')} {contact_data['attributes'].get('last_name', '')}".strip()
+                )
+                for contact_data in contacts
+            ])
+            self.stats['contacts'] += count
+            logger.info(f"    ✅ {count} contacts")
+            return count
                 
         except Exception as e:
             logger.error(f"Failed to sync contacts: {e}")
             self.stats['errors'] += 1
+            raise
     
     async def sync_locations(self, org_id: str):
         """Sync locations for an organization."""
@@ -430,32 +379,67 @@ class ITGlueSyncManager:
                 params={'filter[organization_id]': org_id}
             )
             
-            async with db_manager.get_session() as session:
-                uow = UnitOfWork(session)
-                count = 0
-                
-                for location_data in locations:
-                    entity = ITGlueEntity(
-                        itglue_id=str(location_data['id']),
-                        entity_type='location',
-                        organization_id=org_id,
-                        name=location_data['attributes'].get('name'),
-                        attributes=location_data['attributes'],
-                        relationships=location_data.get('relationships', {}),
-                        search_text=self.build_search_text(location_data),
-                        last_synced=datetime.utcnow()
-                    )
-                    
-                    await uow.itglue.create_or_update(entity)
-                    count += 1
-                
-                await uow.commit()
-                self.stats['locations'] += count
-                logger.info(f"    ✅ {count} locations")
+            count = await self.store_entities([
+                self.build_entity_row(location_data, 'location', org_id)
+                for location_data in locations
+            ])
+            self.stats['locations'] += count
+            logger.info(f"    ✅ {count} locations")
+            return count
                 
         except Exception as e:
             logger.error(f"Failed to sync locations: {e}")
             self.stats['errors'] += 1
+            raise
+    
+    async def run_sync_job(self, job: SyncJob) -> int:
+        """Scheduler runner dispatching a job to its sync method."""
+        sync_method = getattr(self, f"sync_{job.entity_type}")
+        return await sync_method(job.organization_id)
+    
+    def log_job_progress(self, job: SyncJob, finished: int, total: int):
+        """Report per-job progress."""
+        logger.info(
+            f"[{finished}/{total}] {job.entity_type} for org {job.organization_id}: "
+            f"{job.status.value} ({job.synced} synced)"
+        )
+    
+    def build_entity_row(
+        self,
+        data: Dict,
+        entity_type: str,
+        org_id: Optional[str],
+        name: Optional[str] = None,
+        attributes: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Build an itglue_entities row from API data."""
+        return {
+            'itglue_id': str(data['id']),
+            'entity_type': entity_type,
+            'organization_id': org_id,
+            'name': name if name is not None else data['attributes'].get('name'),
+            'attributes': attributes if attributes is not None else data['attributes'],
+            'relationships': data.get('relationships', {}),
+            'search_text': self.build_search_text(data),
+            'last_synced': datetime.utcnow()
+        }
+    
+    async def store_entities(self, rows: List[Dict[str, Any]]) -> int:
+        """Write entity rows with a single bulk upsert and commit.
+        
+        Rows whose content hash is unchanged are not rewritten and are
+        counted in stats['unchanged'].
+        """
+        if not rows:
+            return 0
+        
+        async with db_manager.get_session() as session:
+            uow = UnitOfWork(session)
+            stored = await bulk_upsert_entities(session, rows)
+            await uow.commit()
+        
+        self.stats['unchanged'] += len(rows) - len(stored)
+        return len(rows)
     
     def build_search_text(self, data: Dict) -> str:
         """Build searchable text from entity data."""
@@ -519,7 +503,7 @@ class ITGlueSyncManager:
         print("SYNC SUMMARY")
         print("=" * 60)
         
-        total = sum(v for k, v in self.stats.items() if k != 'errors')
+        total = sum(v for k, v in self.stats.items() if k not in ('errors', 'unchanged'))
         
         print(f"""
 📊 Entities Synced:
@@ -532,8 +516,10 @@ class ITGlueSyncManager:
    Locations:        {self.stats['locations']:,}
    ─────────────────────────
    Total:            {total:,}
+   Unchanged:        {self.stats['unchanged']:,} (skipped)
    
 ❌ Errors:           {self.stats['errors']}
+   Failed jobs:      {self.job_stats.get('failed', 0)} of {self.job_stats.get('total_jobs', 0)}
 
 ✅ Next Steps:
    1. Run embedding generation for new entities
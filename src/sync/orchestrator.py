@@ -1,13 +1,20 @@
 """Sync orchestration for IT Glue data."""
 
 import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Any, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from src.data import UnitOfWork, db_manager
 from src.services.itglue.client import ITGlueClient
+from src.services.itglue.models import ITGlueModel
 
+from .bulk import store_entities
 from .incremental import IncrementalSync
+from .scheduler import JobStatus, SyncCheckpoint, SyncJob, SyncScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -15,21 +22,50 @@ logger = logging.getLogger(__name__)
 class SyncOrchestrator:
     """Orchestrates data synchronization from IT Glue."""
 
+    # Entity types synced beneath each organization
+    ORGANIZATION_ENTITY_TYPES = [
+        "configurations",
+        "flexible_assets",
+        "passwords",
+        "documents",
+        "contacts",
+        "locations"
+    ]
+
     def __init__(
         self,
         itglue_client: Optional[ITGlueClient] = None,
-        batch_size: int = 100
+        batch_size: int = 100,
+        max_concurrency: Optional[int] = None
     ):
         """Initialize sync orchestrator.
 
         Args:
-            itglue_client: IT Glue API client
+            itglue_client: IT Glue API client, left open after syncs so it
+                can be shared (defaults to a client of its own)
             batch_size: Number of entities to process in each batch
+            max_concurrency: Maximum sync jobs running at once
         """
+        self._owns_client = itglue_client is None
         self.client = itglue_client or ITGlueClient()
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
         self.incremental_sync = IncrementalSync(self.client, batch_size)
 
+    @asynccontextmanager
+    async def _connected_client(self) -> AsyncIterator[ITGlueClient]:
+        """Connect the client for a sync.
+
+        Only a client this orchestrator created is closed afterwards; a
+        shared one may still be serving queries and cache refreshes.
+        """
+        if self._owns_client:
+            async with self.client:
+                yield self.client
+        else:
+            await self.client.connect()
+            yield self.client
+
     async def sync_all(self, full_sync: bool = False) -> dict[str, Any]:
         """Sync all entity types from IT Glue.
 
@@ -58,7 +94,7 @@ class SyncOrchestrator:
             "locations"
         ]
 
-        async with self.client:
+        async with self._connected_client():
             for entity_type in entity_types:
                 try:
                     result = await self._sync_entity_type(
@@ -120,21 +156,25 @@ class SyncOrchestrator:
                     if status and status.last_sync_completed:
                         last_sync = status.last_sync_completed
 
-                # Fetch entities from IT Glue
-                entities = await self._fetch_entities(entity_type, last_sync)
-
-                # Process entities in batches
+                # Stream entities from IT Glue and process them in batches
                 synced_count = 0
-                for i in range(0, len(entities), self.batch_size):
-                    batch = entities[i:i + self.batch_size]
-                    await self._process_batch(uow, entity_type, batch)
-                    synced_count += len(batch)
+                changed_count = 0
+                error_count = 0
+                batch_number = 0
+                async for batch in self._iter_entity_batches(
+                    self._iter_entities(entity_type, last_sync)
+                ):
+                    changed, failed = await self._process_batch(session, entity_type, batch)
+                    changed_count += changed
+                    error_count += failed
+                    synced_count += len(batch) - failed
+                    batch_number += 1
 
                     # Commit batch
                     await uow.commit()
 
                     logger.debug(
-                        f"Processed batch {i // self.batch_size + 1} for {entity_type}: "
+                        f"Processed batch {batch_number} for {entity_type}: "
                         f"{len(batch)} entities"
                     )
 
@@ -147,10 +187,15 @@ class SyncOrchestrator:
 
                 await uow.commit()
 
-                logger.info(f"Successfully synced {synced_count} {entity_type}")
+                logger.info(
+                    f"Successfully synced {synced_count} {entity_type} "
+                    f"({changed_count} new or changed, {error_count} failed)"
+                )
 
                 return {
                     "synced": synced_count,
+                    "changed": changed_count,
+                    "errors": error_count,
                     "status": "completed"
                 }
 
@@ -166,64 +211,97 @@ class SyncOrchestrator:
                 logger.error(f"Failed to sync {entity_type}: {e}")
                 raise
 
-    async def _fetch_entities(
+    def _iter_entities(
         self,
         entity_type: str,
-        since: Optional[datetime] = None
-    ) -> list[dict[str, Any]]:
-        """Fetch entities from IT Glue API.
+        since: Optional[datetime] = None,
+        organization_id: Optional[str] = None
+    ) -> AsyncIterator[ITGlueModel]:
+        """Stream entities from IT Glue API.
 
         Args:
             entity_type: Type of entity to fetch
             since: Only fetch entities updated after this timestamp
+            organization_id: Only fetch entities for this organization
 
         Returns:
-            List of entity data from API
+            Async iterator of entity models
         """
         filters = {}
         if since:
             filters["updated_at"] = since.isoformat()
 
         if entity_type == "organizations":
-            entities = await self.client.get_organizations(filters)
+            return self.client.iter_organizations(filters)
         elif entity_type == "configurations":
-            entities = await self.client.get_configurations(filters=filters)
+            return self.client.iter_configurations(org_id=organization_id, filters=filters)
         elif entity_type == "flexible_assets":
-            entities = await self.client.get_flexible_assets(filters=filters)
+            return self.client.iter_flexible_assets(org_id=organization_id, filters=filters)
         elif entity_type == "passwords":
-            entities = await self.client.get_passwords(filters=filters)
+            return self.client.iter_passwords(org_id=organization_id, filters=filters)
         elif entity_type == "documents":
-            entities = await self.client.get_documents(filters=filters)
+            return self.client.iter_documents(org_id=organization_id, filters=filters)
         elif entity_type == "contacts":
-            entities = await self.client.get_contacts(filters=filters)
+            return self.client.iter_contacts(org_id=organization_id, filters=filters)
         elif entity_type == "locations":
-            entities = await self.client.get_locations(filters=filters)
+            return self.client.iter_locations(org_id=organization_id, filters=filters)
         else:
             raise ValueError(f"Unknown entity type: {entity_type}")
 
-        # Convert models to dicts
-        return [entity.dict() for entity in entities]
+    async def _iter_entity_batches(
+        self,
+        entities: AsyncIterator[ITGlueModel]
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Group streamed entities into batches of entity dicts.
+
+        Only one batch is held in memory at a time.
+
+        Args:
+            entities: Async iterator of entity models
+
+        Yields:
+            Batches of at most batch_size entity dicts
+        """
+        batch = []
+        async for entity in entities:
+            batch.append(entity.dict())
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
 
     async def _process_batch(
         self,
-        uow: UnitOfWork,
+        session: AsyncSession,
         entity_type: str,
         batch: list[dict[str, Any]]
-    ):
+    ) -> tuple[int, int]:
         """Process a batch of entities.
 
+        Entities are written with one bulk upsert and queued for embedding
+        with one bulk insert, rather than two round trips per entity.
+        Entities whose content hash is unchanged are neither rewritten nor
+        re-queued. If the bulk write fails, it is rolled back and retried
+        one entity at a time, so one bad entity does not drop the batch.
+
         Args:
-            uow: Unit of work for database operations
+            session: Database session (caller commits)
             entity_type: Type of entities
             batch: Batch of entity data
+
+        Returns:
+            Number of entities inserted or changed, and number that failed
         """
+        entity_dicts = []
+        failed = 0
+        now = datetime.utcnow()
+
         for entity_data in batch:
             try:
-                # Extract searchable text
-                search_text = self._extract_search_text(entity_data)
-
                 # Prepare entity for storage
-                entity_dict = {
+                entity_dicts.append({
                     "itglue_id": entity_data["id"],
                     "entity_type": entity_type.rstrip('s'),  # Remove plural
                     "organization_id": entity_data.get("relationships", {}).get(
@@ -232,24 +310,19 @@ class SyncOrchestrator:
                     "name": entity_data.get("attributes", {}).get("name", ""),
                     "attributes": entity_data.get("attributes", {}),
                     "relationships": entity_data.get("relationships", {}),
-                    "search_text": search_text,
-                    "last_synced": datetime.utcnow()
-                }
-
-                # Upsert entity
-                entity = await uow.itglue.upsert(**entity_dict)
-
-                # Add to embedding queue
-                await uow.embedding_queue.add_to_queue(
-                    entity_id=str(entity.id),
-                    entity_type=entity_type
-                )
+                    "search_text": self._extract_search_text(entity_data),
+                    "last_synced": now
+                })
 
             except Exception as e:
+                failed += 1
                 logger.error(
                     f"Failed to process entity {entity_data.get('id')}: {e}"
                 )
 
+        changed, store_failed = await store_entities(session, entity_type, entity_dicts)
+        return changed, failed + store_failed
+
     def _extract_search_text(self, entity_data: dict[str, Any]) -> str:
         """Extract searchable text from entity data.
 
@@ -306,10 +379,11 @@ class SyncOrchestrator:
             "organization_id": organization_id,
             "started_at": datetime.utcnow(),
             "entities": {},
-            "total_synced": 0
+            "total_synced": 0,
+            "errors": []
         }
 
-        async with self.client:
+        async with self._connected_client():
             # Sync organization details
             org = await self.client.get_organization(organization_id)
 
@@ -335,29 +409,25 @@ class SyncOrchestrator:
 
                     await uow.commit()
 
-            # Sync related entities
-            entity_types = [
-                "configurations",
-                "flexible_assets",
-                "passwords",
-                "documents",
-                "contacts",
-                "locations"
-            ]
-
-            for entity_type in entity_types:
-                try:
-                    count = await self._sync_organization_entities(
-                        organization_id,
-                        entity_type
-                    )
-                    stats["entities"][entity_type] = count
-                    stats["total_synced"] += count
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to sync {entity_type} for org {organization_id}: {e}"
-                    )
+            # Sync related entity types concurrently
+            scheduler = SyncScheduler(
+                self._run_sync_job,
+                max_concurrency=self.max_concurrency
+            )
+            run_stats = await scheduler.run([
+                SyncJob(organization_id, entity_type)
+                for entity_type in self.ORGANIZATION_ENTITY_TYPES
+            ])
+
+        for job in run_stats["jobs"]:
+            if job["status"] == JobStatus.COMPLETED.value:
+                stats["entities"][job["entity_type"]] = job["synced"]
+                stats["total_synced"] += job["synced"]
+            else:
+                stats["errors"].append({
+                    "entity_type": job["entity_type"],
+                    "error": job["error"]
+                })
 
         stats["completed_at"] = datetime.utcnow()
         stats["duration_seconds"] = (
@@ -370,6 +440,73 @@ class SyncOrchestrator:
 
         return stats
 
+    async def sync_organizations(
+        self,
+        organization_ids: Optional[list[str]] = None,
+        run_id: Optional[str] = None,
+        progress_callback: Optional[Callable[[SyncJob, int, int], None]] = None
+    ) -> dict[str, Any]:
+        """Sync many organizations as concurrent organization x entity-type jobs.
+
+        Jobs run under the scheduler's global concurrency cap while the
+        client's shared rate limiter paces the API calls. When run_id is
+        given, completed jobs are checkpointed so re-running with the same
+        run_id after a failure only repeats the jobs that did not finish.
+
+        Args:
+            organization_ids: Organizations to sync (defaults to all, synced first)
+            run_id: Identifier for checkpointing and resuming this run
+            progress_callback: Called as (job, finished_jobs, total_jobs)
+
+        Returns:
+            Scheduler statistics with per-job results
+        """
+        async with self._connected_client():
+            if organization_ids is None:
+                organization_ids = await self._sync_organization_list()
+
+            logger.info(
+                f"Syncing {len(organization_ids)} organizations with up to "
+                f"{self.max_concurrency} concurrent jobs"
+            )
+
+            scheduler = SyncScheduler(
+                self._run_sync_job,
+                max_concurrency=self.max_concurrency,
+                progress_callback=progress_callback,
+                checkpoint=SyncCheckpoint(run_id) if run_id else None
+            )
+            stats = await scheduler.run([
+                SyncJob(organization_id, entity_type)
+                for organization_id in organization_ids
+                for entity_type in self.ORGANIZATION_ENTITY_TYPES
+            ])
+
+        stats["run_id"] = run_id
+        stats["organizations"] = len(organization_ids)
+        return stats
+
+    async def _sync_organization_list(self) -> list[str]:
+        """Store all organizations and return their IDs."""
+        organization_ids = []
+
+        async with db_manager.get_session() as session:
+            uow = UnitOfWork(session)
+
+            async for batch in self._iter_entity_batches(self.client.iter_organizations()):
+                await self._process_batch(session, "organizations", batch)
+                await uow.commit()
+                organization_ids.extend(str(entity["id"]) for entity in batch)
+
+        return organization_ids
+
+    async def _run_sync_job(self, job: SyncJob) -> int:
+        """Scheduler runner for a single organization x entity-type job."""
+        return await self._sync_organization_entities(
+            job.organization_id,
+            job.entity_type
+        )
+
     async def _sync_organization_entities(
         self,
         organization_id: str,
@@ -384,32 +521,20 @@ class SyncOrchestrator:
         Returns:
             Number of entities synced
         """
-        # Fetch entities for organization
-        if entity_type == "configurations":
-            entities = await self.client.get_configurations(org_id=organization_id)
-        elif entity_type == "flexible_assets":
-            entities = await self.client.get_flexible_assets(org_id=organization_id)
-        elif entity_type == "passwords":
-            entities = await self.client.get_passwords(org_id=organization_id)
-        elif entity_type == "documents":
-            entities = await self.client.get_documents(org_id=organization_id)
-        elif entity_type == "contacts":
-            entities = await self.client.get_contacts(org_id=organization_id)
-        elif entity_type == "locations":
-            entities = await self.client.get_locations(org_id=organization_id)
-        else:
+        if entity_type not in self.ORGANIZATION_ENTITY_TYPES:
             raise ValueError(f"Unknown entity type: {entity_type}")
 
-        # Convert to dicts
-        entity_dicts = [entity.dict() for entity in entities]
+        synced_count = 0
 
-        # Process in batches
+        # Stream entities for organization and process in batches
         async with db_manager.get_session() as session:
             uow = UnitOfWork(session)
 
-            for i in range(0, len(entity_dicts), self.batch_size):
-                batch = entity_dicts[i:i + self.batch_size]
-                await self._process_batch(uow, entity_type, batch)
+            async for batch in self._iter_entity_batches(
+                self._iter_entities(entity_type, organization_id=organization_id)
+            ):
+                _, failed = await self._process_batch(session, entity_type, batch)
                 await uow.commit()
+                synced_count += len(batch) - failed
 
-        return len(entity_dicts)
+        return synced_count
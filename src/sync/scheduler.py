@@ -0,0 +1,229 @@
+"""Concurrent scheduling of organization x entity-type sync jobs."""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(Enum):
+    """Sync job status enumeration."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+
+@dataclass
+class SyncJob:
+    """One unit of sync work: a single entity type for a single organization."""
+
+    organization_id: str
+    entity_type: str
+    status: JobStatus = JobStatus.PENDING
+    synced: int = 0
+    attempts: int = 0
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used for checkpointing."""
+        return f"{self.organization_id}:{self.entity_type}"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert job to a serialisable dictionary."""
+        return {
+            "organization_id": self.organization_id,
+            "entity_type": self.entity_type,
+            "status": self.status.value,
+            "synced": self.synced,
+            "attempts": self.attempts,
+            "error": self.error,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None
+        }
+
+
+class SyncCheckpoint:
+    """File-backed record of completed jobs so a failed run can be resumed."""
+
+    def __init__(self, run_id: str, directory: Optional[Path] = None):
+        """Initialize checkpoint.
+
+        Args:
+            run_id: Identifier shared by the original run and its resumes
+            directory: Where checkpoint files are kept
+        """
+        self.run_id = run_id
+        self.directory = directory or settings.project_root / "data" / "sync_checkpoints"
+        self.path = self.directory / f"{run_id}.json"
+        self.completed: set[str] = set()
+
+    def load(self) -> set[str]:
+        """Load completed job keys from disk."""
+        try:
+            self.completed = set(json.loads(self.path.read_text()).get("completed", []))
+        except FileNotFoundError:
+            self.completed = set()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable sync checkpoint {self.path}: {e}")
+            self.completed = set()
+        return self.completed
+
+    def mark_completed(self, key: str):
+        """Record a completed job and persist the checkpoint."""
+        self.completed.add(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({
+                "run_id": self.run_id,
+                "updated_at": datetime.utcnow().isoformat(),
+                "completed": sorted(self.completed)
+            }))
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write sync checkpoint {self.path}: {e}")
+
+    def clear(self):
+        """Remove the checkpoint once a run finished without failures."""
+        self.completed = set()
+        self.path.unlink(missing_ok=True)
+
+
+class SyncScheduler:
+    """Runs sync jobs concurrently under a global concurrency cap.
+
+    API pacing is left to the IT Glue client's shared rate limiter, so the
+    cap only bounds how many jobs hold connections and memory at once.
+    """
+
+    def __init__(
+        self,
+        runner: Callable[[SyncJob], Awaitable[int]],
+        max_concurrency: Optional[int] = None,
+        max_attempts: int = 2,
+        retry_delay: float = 5.0,
+        progress_callback: Optional[Callable[[SyncJob, int, int], None]] = None,
+        checkpoint: Optional[SyncCheckpoint] = None
+    ):
+        """Initialize scheduler.
+
+        Args:
+            runner: Coroutine function executing one job, returning entities synced
+            max_concurrency: Maximum jobs running at once
+            max_attempts: Attempts per job before it is marked failed
+            retry_delay: Seconds to wait before retrying a failed job
+            progress_callback: Called as (job, finished_jobs, total_jobs) after each job
+            checkpoint: Checkpoint used to skip jobs completed by an earlier run
+        """
+        self.runner = runner
+        self.max_concurrency = max(
+            1,
+            max_concurrency or getattr(settings, 'sync_max_concurrency', None) or 8
+        )
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.progress_callback = progress_callback
+        self.checkpoint = checkpoint
+
+    async def run(self, jobs: list[SyncJob]) -> dict[str, Any]:
+        """Run all jobs and collect per-job results.
+
+        Args:
+            jobs: Jobs to run
+
+        Returns:
+            Run statistics including every job's final state
+        """
+        started_at = datetime.utcnow()
+        completed_keys = self.checkpoint.load() if self.checkpoint else set()
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        total = len(jobs)
+        finished = 0
+
+        async def run_job(job: SyncJob):
+            nonlocal finished
+
+            if job.key in completed_keys:
+                job.status = JobStatus.SKIPPED
+            else:
+                async with semaphore:
+                    await self._run_with_retries(job)
+
+            finished += 1
+            if self.progress_callback:
+                try:
+                    self.progress_callback(job, finished, total)
+                except Exception as e:
+                    logger.warning(f"Sync progress callback failed: {e}")
+
+        await asyncio.gather(*(run_job(job) for job in jobs))
+
+        failed = [job for job in jobs if job.status == JobStatus.FAILED]
+        if self.checkpoint and not failed:
+            self.checkpoint.clear()
+
+        completed_at = datetime.utcnow()
+        stats = {
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "duration_seconds": (completed_at - started_at).total_seconds(),
+            "total_jobs": total,
+            "completed": sum(1 for job in jobs if job.status == JobStatus.COMPLETED),
+            "skipped": sum(1 for job in jobs if job.status == JobStatus.SKIPPED),
+            "failed": len(failed),
+            "total_synced": sum(job.synced for job in jobs),
+            "jobs": [job.to_dict() for job in jobs]
+        }
+
+        logger.info(
+            f"Sync scheduler finished {total} jobs: {stats['completed']} completed, "
+            f"{stats['skipped']} skipped, {stats['failed']} failed"
+        )
+
+        return stats
+
+    async def _run_with_retries(self, job: SyncJob):
+        """Run a single job, retrying transient failures."""
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+
+        while True:
+            job.attempts += 1
+            try:
+                job.synced = await self.runner(job)
+                job.status = JobStatus.COMPLETED
+                job.error = None
+                break
+
+            except Exception as e:
+                job.error = str(e)
+                if job.attempts >= self.max_attempts:
+                    job.status = JobStatus.FAILED
+                    logger.error(f"Sync job {job.key} failed after {job.attempts} attempts: {e}")
+                    break
+
+                logger.warning(
+                    f"Sync job {job.key} failed (attempt {job.attempts}/{self.max_attempts}), "
+                    f"retrying in {self.retry_delay}s: {e}"
+                )
+                await asyncio.sleep(self.retry_delay)
+
+        job.completed_at = datetime.utcnow()
+
+        if job.status == JobStatus.COMPLETED and self.checkpoint:
+            self.checkpoint.mark_completed(job.key)
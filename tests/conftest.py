@@ -10,6 +10,7 @@ sys.path.insert(0, str(project_root))
 
 # Common test fixtures
 import pytest
+import pytest_asyncio
 from unittest.mock import Mock, AsyncMock
 
 
@@ -62,4 +63,83 @@ def sample_configurations():
             "configuration_type": "Database",
             "organization_id": "1"
         }
-    ]
\ No newline at end of file
+    ]
+
+
+@pytest.fixture
+def dict_cache():
+    """Factory for caches whose Redis client is backed by an in-memory dict.
+
+    The dict is exposed as ``cache.store``; keyword arguments are passed to
+    RedisCache.
+    """
+    from src.cache.redis_cache import RedisCache
+
+    def make(**kwargs):
+        store = {}
+        cache = RedisCache(**{'access_tracking': "off", **kwargs})
+        cache.client = AsyncMock()
+        cache.client.setex.side_effect = lambda key, ttl, value: store.__setitem__(key, value)
+        cache.client.get.side_effect = lambda key: store.get(key)
+        cache.client.mget.side_effect = lambda *keys: [store.get(key) for key in keys]
+        cache.client.exists.side_effect = lambda key: int(key in store)
+        cache.client.info.return_value = {}
+        cache.connected = True
+        cache.store = store
+        return cache
+    return make
+
+
+class OllamaStandIn:
+    """In-process stand-in for the Ollama embeddings API.
+
+    Embeddings are derived from text length so results can be checked
+    against their inputs. Requests are recorded per endpoint.
+    """
+
+    def __init__(self, dimension: int = 768, batch_supported: bool = True):
+        self.dimension = dimension
+        self.batch_supported = batch_supported
+        self.requests = []
+        self.url = None
+
+    def embed(self, text: str) -> list:
+        return [float(len(text))] + [0.0] * (self.dimension - 1)
+
+    def app(self):
+        from aiohttp import web
+
+        async def embed(request):
+            if not self.batch_supported:
+                return web.Response(status=404, text="404 page not found")
+            body = await request.json()
+            self.requests.append(("/api/embed", body))
+            return web.json_response({
+                "model": body["model"],
+                "embeddings": [self.embed(text) for text in body["input"]]
+            })
+
+        async def embeddings(request):
+            body = await request.json()
+            self.requests.append(("/api/embeddings", body))
+            return web.json_response({"embedding": self.embed(body["prompt"])})
+
+        app = web.Application()
+        app.router.add_post("/api/embed", embed)
+        app.router.add_post("/api/embeddings", embeddings)
+        return app
+
+
+@pytest_asyncio.fixture
+async def ollama_server():
+    """Run an Ollama stand-in on a local port for the duration of a test."""
+    from aiohttp.test_utils import TestServer
+
+    stand_in = OllamaStandIn()
+    server = TestServer(stand_in.app())
+    await server.start_server()
+    stand_in.url = str(server.make_url("")).rstrip("/")
+    try:
+        yield stand_in
+    finally:
+        await server.close()
@@ -66,6 +66,14 @@ def mock_itglue_client():
         'data': [],
         'meta': {'total-pages': 1}
     })
+
+    async def iter_pages(endpoint, params=None, **kwargs):
+        if endpoint.endswith('/configurations'):
+            yield client.get_configurations.return_value['data']
+        else:
+            yield []
+
+    client.iter_pages = MagicMock(side_effect=iter_pages)
     return client
 
 
@@ -130,10 +138,12 @@ async def test_query_orchestrator_rate_limiting(mock_itglue_client, mock_cache_m
     assert 'resources' in result
     assert result['organization_id'] == '12345'
     
-    # Verify API methods were called
-    assert mock_client.get_configurations.called
-    assert mock_client.get_flexible_assets.called
-    assert mock_client.get_contacts.called
+    # Verify every resource endpoint was paginated
+    endpoints = [call.args[0] for call in mock_client.iter_pages.call_args_list]
+    assert 'organizations/12345/relationships/configurations' in endpoints
+    assert 'flexible_assets' in endpoints
+    assert 'organizations/12345/relationships/contacts' in endpoints
+    assert result['resources']['configurations']['count'] == 1
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,81 @@
+"""Unit tests for cache value codecs."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.cache import codec as codec_module
+from src.cache.codec import MAGIC, ValueCodec
+
+LARGE_VALUE = {
+    'documents': [
+        {'id': str(i), 'name': f'Runbook {i}', 'content': 'Restart the primary router. ' * 20}
+        for i in range(50)
+    ]
+}
+
+
+@pytest.mark.parametrize('serializer', ['json', 'orjson', 'msgpack'])
+@pytest.mark.parametrize('compression', ['none', 'zlib', 'zstd', 'lz4'])
+def test_round_trip(serializer, compression):
+    codec = ValueCodec(serializer, compression, compression_threshold=256)
+
+    for value in (LARGE_VALUE, {'count': 1, 'ok': True, 'items': [1, 2.5, None, 'x']}, 'plain'):
+        data = codec.encode(value)
+        assert data.startswith(MAGIC)
+        assert codec.decode(data) == value
+
+
+def test_large_values_are_compressed_and_measured():
+    codec = ValueCodec('json', 'zlib', compression_threshold=1024)
+
+    large = codec.encode(LARGE_VALUE, 'documentation')
+    small = codec.encode({'id': '1'}, 'documentation')
+
+    assert len(large) < len(json.dumps(LARGE_VALUE)) / 5
+    assert small[3:4] == b'n'
+
+    metrics = codec.get_metrics()['documentation']
+    assert metrics['entries'] == 2
+    assert metrics['compressed'] == 1
+    assert metrics['stored_bytes'] == len(large) + len(small)
+    assert metrics['compression_ratio'] > 5
+    assert metrics['avg_encode_ms'] >= 0
+
+
+def test_headerless_json_and_other_codecs_decode():
+    reader = ValueCodec('json', 'none')
+
+    # Entries written before the codec existed
+    assert reader.decode(json.dumps({'legacy': True})) == {'legacy': True}
+    assert reader.decode(b'[1, 2]') == [1, 2]
+
+    # Entries written by a process with different settings
+    writer = ValueCodec('orjson', 'zlib', compression_threshold=0)
+    assert reader.decode(writer.encode(LARGE_VALUE)) == LARGE_VALUE
+
+    with pytest.raises(ValueError):
+        reader.decode(MAGIC + b'?n{}')
+
+
+def test_non_json_values_are_stored_as_strings():
+    codec = ValueCodec('json', 'none')
+    created = datetime(2024, 1, 1, 12, 0)
+
+    assert codec.decode(codec.encode({'created': created})) == {'created': str(created)}
+
+
+def test_missing_optional_codecs_fall_back(monkeypatch):
+    monkeypatch.setattr(codec_module, 'ORJSON_AVAILABLE', False)
+    monkeypatch.setattr(codec_module, 'ZSTD_AVAILABLE', False)
+    monkeypatch.setattr(codec_module, 'LZ4_AVAILABLE', False)
+
+    codec = ValueCodec('auto', 'auto')
+    assert (codec.serializer, codec.compression) == ('json', 'zlib')
+
+    codec = ValueCodec('orjson', 'zstd')
+    assert (codec.serializer, codec.compression) == ('json', 'zlib')
+
+    with pytest.raises(ValueError):
+        ValueCodec('pickle', 'none')
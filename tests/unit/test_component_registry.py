@@ -0,0 +1,53 @@
+"""Unit tests for the MCP component registry."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.mcp.registry import ComponentRegistry
+
+
+def test_components_are_built_once():
+    registry = ComponentRegistry()
+    factory = Mock(side_effect=lambda: object())
+    registry.register("handler", factory)
+
+    first = registry.get("handler")
+
+    assert registry.get("handler") is first
+    assert factory.call_count == 1
+    assert "handler" in registry
+    with pytest.raises(KeyError):
+        registry.get("missing")
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_hooks_and_survives_failures():
+    registry = ComponentRegistry()
+    warmed = AsyncMock()
+    registry.register("ok", Mock, warm_up=warmed)
+    registry.register("broken", Mock, warm_up=AsyncMock(side_effect=RuntimeError("down")))
+
+    results = await registry.warm_up()
+
+    assert results == {"ok": True, "broken": False}
+    warmed.assert_awaited_once_with(registry.get("ok"))
+
+
+@pytest.mark.asyncio
+async def test_shutdown_runs_in_reverse_creation_order():
+    registry = ComponentRegistry()
+    closed = []
+
+    async def close(component):
+        closed.append(component)
+
+    registry.register_instance("client", "client", shutdown=close)
+    registry.register("handler", lambda: "handler", shutdown=close)
+    registry.register("unused", lambda: "unused", shutdown=close)
+    registry.get("handler")
+
+    await registry.shutdown()
+
+    assert closed == ["handler", "client"]
+    assert registry.get("handler") == "handler"
@@ -0,0 +1,76 @@
+"""Unit tests for the embedding cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.embeddings.cache import (
+    EmbeddingCache,
+    decode_vector,
+    embedding_cache_key,
+    encode_vector,
+)
+
+
+def test_key_depends_on_model_dimension_and_text():
+    key = embedding_cache_key("nomic-embed-text", 768, "server")
+
+    assert key.startswith("nomic-embed-text:768:")
+    assert key != embedding_cache_key("nomic-embed-text", 384, "server")
+    assert key != embedding_cache_key("all-MiniLM-L6-v2", 768, "server")
+    assert key != embedding_cache_key("nomic-embed-text", 768, "servers")
+
+
+def test_vectors_are_packed_as_float32():
+    data = encode_vector([0.5, -1.25, 3.0])
+
+    assert len(data) == 12
+    assert decode_vector(data).tolist() == [0.5, -1.25, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used():
+    cache = EmbeddingCache(max_entries=2)
+    await cache.set_many("m", 1, ["a", "b"], [[1.0], [2.0]])
+    await cache.get_many("m", 1, ["a"])
+    await cache.set_many("m", 1, ["c"], [[3.0]])
+
+    a, b, c = await cache.get_many("m", 1, ["a", "b", "c"])
+    assert (a.tolist(), b, c.tolist()) == ([1.0], None, [3.0])
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_instance(tmp_path):
+    await EmbeddingCache(backend="disk", directory=tmp_path).set_many(
+        "nomic-embed-text", 2, ["hello"], [[0.25, 0.75]]
+    )
+
+    cache = EmbeddingCache(backend="disk", directory=tmp_path)
+    hello, other = await cache.get_many("nomic-embed-text", 2, ["hello", "other"])
+    assert hello.tolist() == [0.25, 0.75]
+    assert other is None
+    assert cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_stores_packed_bytes():
+    cache = EmbeddingCache(backend="redis", ttl=60)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=None)
+    client = MagicMock()
+    client.pipeline.return_value = pipe
+    client.mget = AsyncMock(return_value=[encode_vector([1.0, 2.0]), None])
+    cache._redis = client
+
+    await cache.set_many("m", 2, ["a"], [[1.0, 2.0]])
+    key, data = pipe.set.call_args.args
+    assert key == f"embedding:{embedding_cache_key('m', 2, 'a')}"
+    assert data == encode_vector([1.0, 2.0])
+    assert pipe.set.call_args.kwargs == {"ex": 60}
+
+    cache._memory.clear()
+    a, b = await cache.get_many("m", 2, ["a", "b"])
+    assert a.tolist() == [1.0, 2.0]
+    assert b is None
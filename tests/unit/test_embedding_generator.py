@@ -0,0 +1,96 @@
+"""Unit tests for Ollama embedding generation."""
+
+import numpy as np
+import pytest
+
+from src.embeddings.cache import EmbeddingCache
+from src.embeddings.generator import EmbeddingGenerator
+
+
+def make_generator(url: str, **kwargs) -> EmbeddingGenerator:
+    return EmbeddingGenerator(
+        ollama_url=url, openai_api_key=None, cache=EmbeddingCache(), **kwargs
+    )
+
+
+class TestOllamaEmbeddings:
+    """Test suite for batched Ollama embedding requests."""
+
+    @pytest.mark.asyncio
+    async def test_texts_are_sent_in_batches(self, ollama_server):
+        texts = [f"chunk {i}" * (i + 1) for i in range(50)]
+
+        async with make_generator(ollama_server.url, ollama_batch_size=16) as generator:
+            embeddings = await generator.generate_embeddings(texts, normalize=False)
+
+        assert [e[0] for e in embeddings] == [float(len(t)) for t in texts]
+        assert [path for path, _ in ollama_server.requests] == ["/api/embed"] * 4
+        assert sorted(len(body["input"]) for _, body in ollama_server.requests) == [2, 16, 16, 16]
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused_across_calls(self, ollama_server):
+        async with make_generator(ollama_server.url) as generator:
+            await generator.generate_embeddings(["a"])
+            session = generator._session
+            await generator.generate_embeddings(["b"])
+
+            assert generator._session is session
+
+        assert generator._session is None
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_text_endpoint(self, ollama_server):
+        ollama_server.batch_supported = False
+        texts = ["a", "bb", "ccc"]
+
+        async with make_generator(ollama_server.url) as generator:
+            embeddings = await generator.generate_embeddings(texts, normalize=False)
+            await generator.generate_embeddings(["dddd"], normalize=False)
+
+        assert [e[0] for e in embeddings] == [1.0, 2.0, 3.0]
+        assert [path for path, _ in ollama_server.requests] == ["/api/embeddings"] * 4
+        assert generator._ollama_batch_supported is False
+
+    @pytest.mark.asyncio
+    async def test_cached_texts_skip_ollama(self, ollama_server):
+        async with make_generator(ollama_server.url) as generator:
+            first = await generator.generate_embeddings(["a", "bb"])
+            second = await generator.generate_embeddings(["bb", "a", "ccc"])
+
+        assert second[0] == pytest.approx(first[1])
+        assert second[1] == pytest.approx(first[0])
+        assert [body["input"] for _, body in ollama_server.requests] == [["a", "bb"], ["ccc"]]
+
+
+class TestEmbeddingArrays:
+    """Test suite for float32 embedding arrays."""
+
+    def test_normalize_is_vectorized_and_keeps_zero_rows(self):
+        generator = EmbeddingGenerator(ollama_url="http://unused", cache=EmbeddingCache())
+        embeddings = np.array([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+
+        normalized = generator._normalize_embeddings(embeddings)
+
+        assert normalized.dtype == np.float32
+        assert np.allclose(normalized, [[0.6, 0.8], [0.0, 0.0]])
+
+    @pytest.mark.asyncio
+    async def test_generate_embedding_array_returns_float32_matrix(self, ollama_server):
+        async with make_generator(ollama_server.url) as generator:
+            await generator.generate_embedding_array(["cached"])
+            embeddings = await generator.generate_embedding_array(["a", "cached", "ccc"])
+
+        assert embeddings.dtype == np.float32
+        assert embeddings.shape == (3, 768)
+        assert np.allclose(np.linalg.norm(embeddings, axis=1), 1.0)
+
+    @pytest.mark.asyncio
+    async def test_generate_batch_zero_fills_failed_batches(self):
+        generator = EmbeddingGenerator(openai_api_key=None, cache=EmbeddingCache())
+        generator.ollama_url = None
+
+        embeddings = await generator.generate_batch(["a", "b", "c"], batch_size=2)
+
+        assert embeddings.shape == (3, generator.dimension)
+        assert not embeddings.any()
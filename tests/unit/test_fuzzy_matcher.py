@@ -209,4 +209,61 @@ class TestQueryFuzzyEnhancer:
         
         for query, expected_intent in patterns:
             enhanced = enhancer.enhance_query(query, known_entities)
-            assert enhanced['intent'] == expected_intent
\ No newline at end of file
+            assert enhanced['intent'] == expected_intent
+
+class TestCandidateIndex:
+    """Test indexed candidate matching."""
+
+    @pytest.fixture
+    def fuzzy_matcher(self):
+        """Create fuzzy matcher instance."""
+        return FuzzyMatcher()
+
+    @pytest.fixture
+    def large_organizations(self):
+        """Organizations far outnumbering the shortlist."""
+        return [
+            {'name': f'Company {i % 100} {suffix}', 'id': f'org-{i}-{suffix}'}
+            for i in range(400)
+            for suffix in ['Inc', 'Group']
+        ] + [{'name': 'Microsoft Corporation', 'id': 'org-ms'}]
+
+    def test_shortlist_matches_full_scan(self, fuzzy_matcher, large_organizations):
+        """Test shortlisted matching finds the same best scores as scoring everything."""
+        full = fuzzy_matcher.build_index(large_organizations, shortlist_size=len(large_organizations))
+        indexed = fuzzy_matcher.build_index(large_organizations, shortlist_size=50)
+
+        for query in ['Microsft', 'MS', 'Company 42 Group', 'Compny 7']:
+            expected = fuzzy_matcher.match_indexed(query, full)
+            results = fuzzy_matcher.match_indexed(query, indexed)
+
+            assert [r.score for r in results] == [r.score for r in expected], query
+
+    def test_incremental_add_and_remove(self, fuzzy_matcher):
+        """Test candidates can be added to and removed from an index."""
+        index = fuzzy_matcher.build_index([{'name': 'Amazon Web Services', 'id': 'org-002'}])
+        index.add({'name': 'Microsoft Corporation', 'id': 'org-001'})
+
+        assert fuzzy_matcher.match_indexed('Microsoft', index)[0].entity_id == 'org-001'
+
+        assert index.remove('org-001') == 1
+        assert len(index) == 1
+        assert fuzzy_matcher.match_indexed('Microsoft', index) == []
+
+    def test_index_reused_for_same_candidates(self, fuzzy_matcher, large_organizations):
+        """Test match_organization indexes an unchanged candidate list once."""
+        fuzzy_matcher.match_organization('Company 5', large_organizations)
+        index = next(iter(fuzzy_matcher._indexes.values()))
+
+        fuzzy_matcher.match_organization('Company 6', list(large_organizations))
+
+        assert list(fuzzy_matcher._indexes.values()) == [index]
+
+    def test_index_not_shared_between_candidate_lists(self, fuzzy_matcher):
+        """Test a different candidate list never reuses another list's index."""
+        first = [{'name': 'Microsoft Corporation', 'id': 'org-001'}]
+        renamed = [{'name': 'Contoso Limited', 'id': 'org-001'}]
+
+        assert fuzzy_matcher.match_organization('Microsoft', first)[0].entity_id == 'org-001'
+        assert fuzzy_matcher.match_organization('Microsoft', renamed) == []
+        assert len(fuzzy_matcher._indexes) == 2
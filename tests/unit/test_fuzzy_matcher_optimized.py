@@ -0,0 +1,150 @@
+"""Unit tests for the optimized fuzzy matcher."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.query import fuzzy_matcher_optimized
+from src.query.fuzzy_matcher_optimized import (
+    MAX_CACHED_CANDIDATE_SETS,
+    LRUCache,
+    OptimizedFuzzyMatcher
+)
+
+
+class TestLRUCache:
+    """Test the bounded LRU cache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted and counted."""
+        cache = LRUCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+
+        cache.put('c', 3)
+
+        assert 'b' not in cache
+        assert cache.get('b') is None
+        assert len(cache) == 2
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 1, 1)
+        assert stats['hit_rate'] == 0.5
+
+    def test_shared_between_threads(self):
+        """Test concurrent gets and evicting puts keep the cache consistent."""
+        class YieldingKey(int):
+            """Key that lets other threads run whenever the cache hashes it."""
+
+            def __hash__(self):
+                time.sleep(0)
+                return int.__hash__(self)
+
+        cache = LRUCache(max_size=5)
+
+        def churn(worker):
+            for i in range(2000):
+                key = YieldingKey((worker + i) % 8)
+                if cache.get(key) is None:
+                    cache.put(key, i)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(8)))  # Re-raises any worker's error
+
+        stats = cache.get_stats()
+        assert len(cache) == 5
+        assert stats['hits'] + stats['misses'] == 8 * 2000
+
+
+class TestBatchMatching:
+    """Test batch matching of large candidate sets."""
+
+    @pytest.fixture
+    def matcher(self):
+        """Create matcher that batches sets over 50 candidates."""
+        return OptimizedFuzzyMatcher(parallel_threshold=50, max_workers=2)
+
+    @pytest.fixture
+    def candidates(self):
+        """Filler organizations with two real ones mixed in."""
+        candidates = [{'name': f'Filler Company {i:04d}', 'id': f'org-{i}'} for i in range(200)]
+        candidates[100] = {'name': 'Microsoft Corporation', 'id': 'org-ms'}
+        candidates[66] = {'name': 'Northwind Traders', 'id': 'org-nw'}
+        return candidates
+
+    def test_candidate_set_normalized_once(self, matcher, candidates):
+        """Test a candidate set is normalized once and reused across matches."""
+        matcher.match_organization_optimized('Microsoft Corp', candidates)
+        matcher.match_organization_optimized('Northwind Trader', list(candidates))
+
+        # Candidate names bypass the per-string cache, only the queries go there
+        stats = matcher.get_performance_stats()
+        assert stats['normalization_cache']['misses'] == 2
+        assert stats['normalization_cache']['evictions'] == 0
+        assert len(matcher._candidate_sets) == 1
+
+        for i in range(MAX_CACHED_CANDIDATE_SETS + 1):
+            matcher.match_organization_optimized('Microsoft Corp', candidates[i:])
+        assert len(matcher._candidate_sets) == MAX_CACHED_CANDIDATE_SETS
+
+    @pytest.mark.parametrize('rapidfuzz_available', [True, False])
+    def test_batch_matches_agree_with_sequential(self, candidates, rapidfuzz_available):
+        """Test batch results equal scoring every candidate one by one."""
+        batch = OptimizedFuzzyMatcher(parallel_threshold=50, max_workers=2)
+        sequential = OptimizedFuzzyMatcher(use_parallel=False, parallel_threshold=1000)
+
+        with patch.object(fuzzy_matcher_optimized, 'RAPIDFUZZ_AVAILABLE', rapidfuzz_available):
+            for query in ['Microsoft Corp', 'Northwind Trader', 'microsoft corporation',
+                          'Filler Company 0042']:
+                expected = [
+                    r for r in (sequential._match_single_candidate(
+                        sequential._normalize_string_fast(query), c, 0.7
+                    ) for c in candidates) if r
+                ]
+                expected.sort(key=lambda r: (r.score, r.confidence), reverse=True)
+
+                results = batch.match_organization_optimized(query, candidates)
+
+                assert [(r.entity_id, round(r.score, 6)) for r in results] == \
+                    [(r.entity_id, round(r.score, 6)) for r in expected[:5]]
+
+        assert results[0].entity_id == 'org-42'
+        expected_parallel = 4 if rapidfuzz_available else 0
+        assert batch.get_performance_stats()['parallel_executions'] == expected_parallel
+
+    def test_phonetic_scoring_stops_at_top_n(self, matcher, candidates):
+        """Test only candidates that could reach the top N are fully scored."""
+        with patch.object(matcher, '_score_candidate', wraps=matcher._score_candidate) as score:
+            results = matcher.match_organization_optimized('Filler Company 0042', candidates, top_n=3)
+
+        assert [r.entity_id for r in results][:1] == ['org-42']
+        assert len(results) == 3
+        # Nearly all 200 fillers clear the threshold; only those tied with
+        # the best (one digit off) are scored
+        assert score.call_count < 50
+
+    def test_exact_match_in_batch(self, matcher, candidates):
+        """Test an exact normalized match ranks first."""
+        results = matcher.match_organization_optimized('Microsoft Corporation', candidates)
+
+        assert results[0].entity_id == 'org-ms'
+        assert results[0].match_type == 'exact'
+        assert results[0].score == 1.0
+
+    def test_large_sets_scored_like_small_ones(self, candidates):
+        """Test sets over 20 candidates get the small-set scores, not WRatio's."""
+        pytest.importorskip('rapidfuzz')
+        matcher = OptimizedFuzzyMatcher(use_parallel=False)
+        few = candidates[95:105]
+
+        for query in ['Microsoft', 'Microsoft Corp']:
+            large = matcher.match_organization_optimized(query, candidates)
+            small = matcher.match_organization_optimized(query, few)
+
+            assert [(r.entity_id, r.score) for r in large if r.entity_id == 'org-ms'] == \
+                [(r.entity_id, r.score) for r in small if r.entity_id == 'org-ms'], query
+
+        # WRatio on raw names scored this partial match 0.80; normalized ratio gives 0.60
+        assert matcher.match_organization_optimized('Microsoft', candidates) == []
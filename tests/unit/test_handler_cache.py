@@ -0,0 +1,141 @@
+"""Unit tests for cached handler results."""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.query.asset_type_handler import AssetTypeHandler
+from src.query.documents_handler import DocumentsHandler
+from src.services.itglue.client import ITGlueClient
+from src.services.itglue.rate_limiter import TokenBucketRateLimiter
+
+
+@pytest.fixture
+def cache_manager(dict_cache):
+    """Cache manager whose query cache is backed by an in-memory dict.
+
+    Entry popularity is settable through ``query_cache.access``.
+    """
+    access = {}
+    cache = dict_cache(single_flight_lock=False)
+    cache.client.hgetall.side_effect = lambda key: access.get(key.removesuffix(":access_stats"), {})
+    cache.client.pipeline = Mock(return_value=MagicMock(execute=AsyncMock(return_value=[])))
+    cache.refresh_scheduler.rate_limiter = TokenBucketRateLimiter(max_requests=600, burst=100)
+    cache.access = access
+    return SimpleNamespace(query_cache=cache)
+
+
+@pytest.fixture
+def client():
+    """IT Glue client whose document list takes a moment to arrive."""
+    async def get_documents(org_id=None):
+        await asyncio.sleep(0.01)
+        return []
+
+    client = Mock()
+    client.get_documents = AsyncMock(side_effect=get_documents)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_document_listings_share_one_fetch(client, cache_manager):
+    handler = DocumentsHandler(client, cache_manager=cache_manager, org_directory=Mock())
+
+    results = await asyncio.gather(*(handler.list_recent_documents() for _ in range(5)))
+
+    assert all(result["success"] for result in results)
+    client.get_documents.assert_awaited_once()
+    assert cache_manager.query_cache.single_flight_stats['coalesced'] == 4
+
+    await handler.list_recent_documents()
+    client.get_documents.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_search_is_returned_but_not_cached(client, cache_manager):
+    handler = DocumentsHandler(client, cache_manager=cache_manager, org_directory=Mock())
+    client.get_documents.side_effect = ConnectionError("API unavailable")
+
+    result = await handler.search_documents("backup runbook", use_semantic=False)
+
+    assert result["success"] is False
+    assert result["error"] == "API unavailable"
+
+    client.get_documents.side_effect = None
+    client.get_documents.return_value = []
+    result = await handler.search_documents("backup runbook", use_semantic=False)
+
+    assert result["success"] is True
+    assert client.get_documents.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fetches_directly_without_cache(client):
+    handler = DocumentsHandler(client, org_directory=Mock())
+
+    await handler.list_recent_documents()
+    await handler.list_recent_documents()
+
+    assert client.get_documents.await_count == 2
+
+
+def asset_types_response(*names):
+    """IT Glue response listing flexible asset types with the given names."""
+    return {
+        "data": [
+            {"id": str(i), "type": "flexible-asset-types", "attributes": {"name": name}}
+            for i, name in enumerate(names, 1)
+        ]
+    }
+
+
+@pytest.fixture
+def itglue_client():
+    """IT Glue client whose API returns one asset type, then two."""
+    client = ITGlueClient(api_key="test-key")
+    client.get = AsyncMock(side_effect=[
+        asset_types_response("SSL Certificate"),
+        asset_types_response("SSL Certificate", "SSL Wildcard Certificate")
+    ])
+    return client
+
+
+@pytest.mark.asyncio
+async def test_popular_asset_types_reloaded_before_expiry(itglue_client, cache_manager):
+    cache = cache_manager.query_cache
+    for namespace, loader in itglue_client.cache_loaders().items():
+        cache.register_loader(namespace, loader)
+    handler = AssetTypeHandler(itglue_client, cache_manager=cache_manager)
+
+    with patch('src.cache.refresh.REFRESH_AT_TTL_FRACTION', 0.00001):
+        results = await asyncio.gather(*(handler.search_asset_types("ssl") for _ in range(5)))
+        assert [result["count"] for result in results] == [1] * 5
+        itglue_client.get.assert_awaited_once()
+
+        cache.access["itglue:flexible_asset_types:all"] = {
+            b'count': b'5', b'last_accessed': datetime.now().isoformat().encode()
+        }
+        await asyncio.sleep(0.1)
+
+    # Renewed through the client's loader, so readers never wait on the API
+    assert itglue_client.get.await_count == 2
+    result = await handler.search_asset_types("ssl")
+    assert [t["name"] for t in result["asset_types"]] == ["SSL Certificate", "SSL Wildcard Certificate"]
+    assert itglue_client.get.await_count == 2
+    assert (await cache.get_stats())['refresh']['refreshed'] == 1
+
+    await cache.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_asset_types_loaded_directly_without_cache(itglue_client):
+    handler = AssetTypeHandler(itglue_client)
+
+    await handler.search_asset_types("wildcard")
+    result = await handler.search_asset_types("wildcard")
+
+    assert result["count"] == 1
+    assert itglue_client.get.await_count == 2
@@ -0,0 +1,121 @@
+"""Unit tests for IT Glue API client pagination."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.services.itglue.client import ITGlueClient
+
+
+def make_page(page: int, total_pages: int, per_page: int = 2) -> dict:
+    """Build a JSON:API style page response."""
+    start = (page - 1) * per_page
+    return {
+        "data": [{"id": str(start + i), "type": "configurations"} for i in range(per_page)],
+        "meta": {"current-page": page, "total-pages": total_pages},
+        "links": {"next": f"page={page + 1}"} if page < total_pages else {}
+    }
+
+
+@pytest.fixture
+def client():
+    """Create client with a mocked GET."""
+    return ITGlueClient(api_key="test-key", api_url="https://api.example.com")
+
+
+@pytest.mark.asyncio
+async def test_get_all_pages_sequential(client):
+    """Sequential mode follows links.next one page at a time."""
+    client.get = AsyncMock(side_effect=lambda endpoint, params: make_page(params["page[number]"], 3))
+
+    data = await client.get_all_pages("configurations", concurrency=1)
+
+    assert [item["id"] for item in data] == ["0", "1", "2", "3", "4", "5"]
+    assert client.get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_all_pages_concurrent_preserves_order(client):
+    """Concurrent mode fetches remaining pages in parallel but keeps page order."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_get(endpoint, params):
+        nonlocal in_flight, peak
+        page = params["page[number]"]
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later pages finish first to prove ordering does not depend on timing
+        await asyncio.sleep(0.01 * (10 - page))
+        in_flight -= 1
+        return make_page(page, 6)
+
+    client.get = AsyncMock(side_effect=fake_get)
+
+    data = await client.get_all_pages("configurations", concurrency=3)
+
+    assert [item["id"] for item in data] == [str(i) for i in range(12)]
+    assert client.get.call_count == 6
+    assert peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_get_all_pages_concurrent_respects_max_pages(client):
+    """max_pages caps the concurrent fan-out."""
+    client.get = AsyncMock(side_effect=lambda endpoint, params: make_page(params["page[number]"], 10))
+
+    data = await client.get_all_pages("configurations", max_pages=4, concurrency=4)
+
+    assert len(data) == 8
+    assert client.get.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_get_all_pages_without_meta_falls_back_to_links(client):
+    """Responses without meta.total-pages use links.next."""
+    def fake_get(endpoint, params):
+        page = make_page(params["page[number]"], 2)
+        page.pop("meta")
+        return page
+
+    client.get = AsyncMock(side_effect=fake_get)
+
+    data = await client.get_all_pages("configurations", concurrency=4)
+
+    assert len(data) == 4
+    assert client.get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_yields_each_page(client):
+    """iter_pages yields page data lists in order without accumulating."""
+    client.get = AsyncMock(side_effect=lambda endpoint, params: make_page(params["page[number]"], 4))
+
+    pages = [page async for page in client.iter_pages("configurations", concurrency=2)]
+
+    assert len(pages) == 4
+    assert [item["id"] for item in pages[3]] == ["6", "7"]
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_cancels_prefetch_on_early_exit(client):
+    """Breaking out of iter_pages stops prefetching further pages."""
+    client.get = AsyncMock(side_effect=lambda endpoint, params: make_page(params["page[number]"], 50))
+
+    async for _ in client.iter_pages("configurations", concurrency=3):
+        break
+
+    await asyncio.sleep(0)
+    assert client.get.call_count < 50
+
+
+@pytest.mark.asyncio
+async def test_iter_configurations_yields_models(client):
+    """Entity iterators yield models built from each item."""
+    client.get = AsyncMock(side_effect=lambda endpoint, params: make_page(params["page[number]"], 2))
+
+    configs = [config async for config in client.iter_configurations(org_id="42")]
+
+    assert [config.id for config in configs] == ["0", "1", "2", "3"]
+    assert client.get.call_args_list[0].args[0] == "organizations/42/relationships/configurations"
@@ -0,0 +1,169 @@
+"""Unit tests for the in-process L1 cache tier."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.cache.local import CoherentLocalCache, InvalidationChannel, LocalCache
+from src.cache.manager import CacheManager
+
+
+class FakePubSub:
+    """Pub/sub that delivers queued messages, then fails or idles."""
+
+    def __init__(self, messages, fail=False):
+        self.messages = messages
+        self.fail = fail
+        self.subscribed = []
+
+    async def subscribe(self, channel):
+        self.subscribed.append(channel)
+
+    async def listen(self):
+        yield {'type': 'subscribe', 'data': 1}
+        for message in self.messages:
+            yield {'type': 'message', 'data': json.dumps(message).encode()}
+        if self.fail:
+            raise ConnectionError("connection reset")
+        await asyncio.Event().wait()
+
+    async def aclose(self):
+        pass
+
+
+@pytest.fixture
+def client():
+    """Redis client mock with an idle pub/sub."""
+    client = Mock()
+    client.publish = AsyncMock()
+    client.pubsub.return_value = FakePubSub([])
+    return client
+
+
+class TestLocalCache:
+    """Test the bounded local cache."""
+
+    def test_entries_expire_and_stay_bounded(self):
+        """Test entries expire, oversized values are refused and LRU is evicted."""
+        cache = LocalCache(max_entries=2, max_value_bytes=10)
+
+        with patch('src.cache.local.time.monotonic', return_value=100.0):
+            assert cache.set('a', b'1', ttl=5)
+            assert cache.set('b', b'2', ttl=60)
+            assert not cache.set('big', b'x' * 11, ttl=60)
+            assert not cache.set('never', b'3', ttl=0)
+            cache.get('a')
+            cache.set('c', b'4', ttl=60)
+
+        assert cache.get('b') is None  # least recently used
+        with patch('src.cache.local.time.monotonic', return_value=106.0):
+            assert cache.get('a') is None  # expired
+            assert cache.get('c') == b'4'
+
+        assert cache.evict(lambda key, value: value == b'4') == 1
+        assert len(cache) == 0
+        assert cache.get_stats()['evictions'] == 1
+
+
+class TestInvalidationChannel:
+    """Test the cross-process invalidation channel."""
+
+    @pytest.mark.asyncio
+    async def test_applies_messages_from_other_processes(self, client):
+        """Test messages from other processes are handled and our own skipped."""
+        handled = []
+        channel = InvalidationChannel('query:invalidations:0', handled.append)
+        client.pubsub.return_value = FakePubSub([
+            {'keys': ['query:a'], 'origin': 'other'},
+            {'keys': ['query:b'], 'origin': channel.origin},
+        ])
+
+        await channel.start(client)
+        await channel.publish(pattern='query:org:*')
+        await asyncio.sleep(0)
+
+        assert handled == [{'keys': ['query:a'], 'origin': 'other'}]
+        published = json.loads(client.publish.await_args.args[1])
+        assert published == {'pattern': 'query:org:*', 'origin': channel.origin}
+        assert client.publish.await_args.args[0] == 'query:invalidations:0'
+
+        await channel.stop()
+
+    @pytest.mark.asyncio
+    async def test_lost_subscription_clears_and_resubscribes(self, client):
+        """Test a dropped subscription clears everything before resubscribing."""
+        handled = []
+        channel = InvalidationChannel('query:invalidations:0', handled.append)
+        client.pubsub.side_effect = [FakePubSub([], fail=True), FakePubSub([])]
+
+        with patch('src.cache.local.RESUBSCRIBE_DELAY', 0):
+            await channel.start(client)
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        assert handled == [{'all': True}]
+        assert client.pubsub.call_count == 2
+
+        await channel.stop()
+
+
+class TestCoherentLocalCache:
+    """Test the local cache kept coherent over pub/sub."""
+
+    @pytest.mark.asyncio
+    async def test_invalidations_applied_and_published(self, client):
+        """Test keys, patterns and everything are dropped here and published."""
+        cache = CoherentLocalCache('query:invalidations:0', max_entries=10)
+        await cache.start(client)
+        for key in ('query:a', 'query:org:1', 'query:org:2', 'query:b'):
+            cache.set(key, b'1', ttl=60)
+
+        await cache.invalidate(keys=['query:a'])
+        await cache.invalidate(pattern='query:org:*')
+        await cache.invalidate(keys=[])
+
+        assert list(cache._entries) == ['query:b']
+        messages = [json.loads(call.args[1]) for call in client.publish.await_args_list]
+        assert [m.get('keys') or m.get('pattern') for m in messages] == [
+            ['query:a'], 'query:org:*'
+        ]
+
+        await cache.invalidate(everything=True)
+        assert len(cache) == 0
+        await cache.stop()
+
+    def test_read_overtaken_by_invalidation_is_not_held(self):
+        """Test a value is only held if no invalidation arrived during its read."""
+        cache = CoherentLocalCache('query:invalidations:0', max_entries=10)
+
+        generation = cache.generation
+        cache.apply_invalidation({'keys': ['query:a'], 'origin': 'other'})
+
+        assert not cache.hold('query:a', b'stale', 60, generation)
+        assert cache.hold('query:a', b'fresh', 60, cache.generation)
+
+    @pytest.mark.asyncio
+    async def test_legacy_cache_manager_shares_invalidation(self, client):
+        """Test the query-result CacheManager invalidates through the same tier."""
+        with patch('src.cache.manager.settings') as settings:
+            settings.cache_l1_max_entries = 10
+            settings.cache_l1_max_value_bytes = None
+            settings.cache_l1_ttl_seconds = 30
+            manager = CacheManager(redis_url="redis://localhost")
+        manager.redis = AsyncMock()
+        manager.redis.delete.return_value = 1
+        await manager.l1.start(client)
+
+        await manager.set("list servers", {'response': 'ok'}, company="Acme")
+        key = manager._generate_cache_key("list servers", "Acme")
+        assert key in manager.l1._entries
+
+        assert await manager.invalidate("list servers", "Acme") == 1
+
+        assert key not in manager.l1._entries
+        message = json.loads(client.publish.await_args.args[1])
+        assert message['keys'] == [key]
+        assert client.publish.await_args.args[0] == "cache:invalidations"
+        await manager.l1.stop()
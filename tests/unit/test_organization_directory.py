@@ -0,0 +1,84 @@
+"""Unit tests for the shared organization directory."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.query.organization_directory import OrganizationDirectory, normalize_name
+from src.services.itglue.models import Organization
+
+
+def make_org(org_id: str, name: str) -> Organization:
+    return Organization(id=org_id, type="organizations", attributes={"name": name})
+
+
+@pytest.fixture
+def mock_client():
+    client = Mock()
+    client.get_organizations = AsyncMock(return_value=[
+        make_org("1", "Faucets Limited"),
+        make_org("2", "Acme & Sons, Inc."),
+        make_org("3", "Northwind Traders"),
+        make_org("4", "Contoso Pharmaceuticals"),
+    ])
+    return client
+
+
+@pytest.fixture
+def directory(mock_client):
+    return OrganizationDirectory(mock_client, refresh_interval=300)
+
+
+def test_normalize_name():
+    assert normalize_name("Acme & Sons, Inc.") == "acme and sons"
+    assert normalize_name("Faucets Limited") == "faucets"
+    assert normalize_name("Company") == "company"
+
+
+@pytest.mark.asyncio
+async def test_resolution_strategies(directory):
+    cases = {
+        "3": ("3", "id"),
+        "northwind traders": ("3", "exact"),
+        "ACME and Sons": ("2", "normalized"),
+        "Faucets": ("1", "normalized"),
+        "Contoso": ("4", "contains"),
+        "Northwind Traders Europe": ("3", "contained"),
+        "Acm": ("2", "partial"),
+        "FaucetsCo": ("1", "partial"),
+        "Contosso Pharmaceutical": ("4", "fuzzy"),
+    }
+    for name, (org_id, match_type) in cases.items():
+        match = await directory.resolve(name)
+        assert (str(match.organization.id), match.match_type) == (org_id, match_type), name
+
+    assert await directory.resolve("Contosso Pharmaceutical", fuzzy=False) is None
+    # Substring matches do not need fuzzy matching, as QueryEngine resolves without it
+    assert (await directory.resolve("Northw", fuzzy=False)).organization.id == "3"
+    assert await directory.resolve("Globex") is None
+
+
+@pytest.mark.asyncio
+async def test_organizations_are_fetched_once(directory, mock_client):
+    await asyncio.gather(*(directory.resolve_id("Faucets") for _ in range(5)))
+    await directory.get("2")
+    await directory.get_organizations()
+
+    assert mock_client.get_organizations.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_directory_refreshes_in_background(directory, mock_client):
+    assert await directory.resolve_id("Faucets") == "1"
+
+    mock_client.get_organizations.return_value = [make_org("9", "Faucets Limited")]
+    directory._loaded_at -= directory.refresh_interval + 1
+
+    # The stale snapshot answers while the refresh runs
+    assert await directory.resolve_id("Faucets") == "1"
+    await directory._refresh_task
+    assert await directory.resolve_id("Faucets") == "9"
+    assert mock_client.get_organizations.await_count == 2
+
+    await directory.close()
@@ -0,0 +1,60 @@
+"""Unit tests for the shared async Qdrant client."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import PayloadSchemaType
+
+from src.search.qdrant import (
+    build_payload_filter,
+    close_qdrant_clients,
+    ensure_payload_indexes,
+    get_qdrant_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_per_server():
+    try:
+        client = get_qdrant_client("http://qdrant-a:6333")
+
+        assert isinstance(client, AsyncQdrantClient)
+        assert get_qdrant_client("http://qdrant-a:6333") is client
+        assert get_qdrant_client("http://qdrant-b:6333") is not client
+    finally:
+        await close_qdrant_clients()
+
+
+@pytest.mark.asyncio
+async def test_grpc_transport_is_separate_client():
+    try:
+        http_client = get_qdrant_client("http://qdrant-a:6333", prefer_grpc=False)
+        grpc_client = get_qdrant_client("http://qdrant-a:6333", prefer_grpc=True)
+
+        assert grpc_client is not http_client
+        assert grpc_client._client._prefer_grpc is True
+    finally:
+        await close_qdrant_clients()
+
+
+def test_build_payload_filter_skips_unset_values():
+    search_filter = build_payload_filter(organization_id="42", entity_type=None, entity_id="")
+
+    assert [(c.key, c.match.value) for c in search_filter.must] == [("organization_id", "42")]
+    assert build_payload_filter(organization_id=None) is None
+
+
+@pytest.mark.asyncio
+async def test_ensure_payload_indexes_creates_missing_only():
+    client = AsyncMock()
+    client.get_collection.return_value = SimpleNamespace(
+        payload_schema={"organization_id": object()}
+    )
+
+    created = await ensure_payload_indexes(client, "itglue_entities")
+
+    assert created == ["entity_type", "entity_id"]
+    for call in client.create_payload_index.call_args_list:
+        assert call.kwargs["field_schema"] == PayloadSchemaType.KEYWORD
@@ -0,0 +1,108 @@
+"""Unit tests for background query audit logging."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.query.audit import QueryAuditLogger, summarize_response
+
+
+@pytest.fixture
+def mock_uow():
+    uow = Mock()
+    uow.commit = AsyncMock()
+    return uow
+
+
+@pytest.fixture
+def mock_db(mock_uow):
+    session = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+
+    with patch('src.query.audit.db_manager') as db_manager, \
+            patch('src.query.audit.UnitOfWork', return_value=mock_uow):
+        db_manager.get_session.return_value = session
+        yield db_manager
+
+
+def inserted_batches(db_manager) -> list[list[dict]]:
+    """Rows of each insert statement executed on the mock session."""
+    session = db_manager.get_session.return_value
+    batches = []
+    for call in session.execute.await_args_list:
+        params = call.args[0].compile(dialect=postgresql.dialect()).params
+        count = sum(1 for key in params if key.startswith("query_m"))
+        batches.append([
+            {key.removesuffix(f"_m{i}"): value for key, value in params.items() if key.endswith(f"_m{i}")}
+            for i in range(count)
+        ])
+    return batches
+
+
+def make_response(i: int) -> dict:
+    return {
+        "success": True,
+        "confidence": 0.9,
+        "source_ids": [f"entity-{i}"],
+        "response_time_ms": 12.5,
+        "data": [{"id": f"entity-{i}", "name": "Main Router"}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_records_are_written_in_batches(mock_db, mock_uow):
+    audit = QueryAuditLogger(batch_size=3, flush_interval=0.05)
+
+    for i in range(7):
+        assert audit.log(f"query {i}", "Test Co", make_response(i))
+    await audit.close()
+
+    # One multi-row insert per batch
+    batches = inserted_batches(mock_db)
+    assert [len(rows) for rows in batches] == [3, 3, 1]
+    assert [row["query"] for rows in batches for row in rows] == [f"query {i}" for i in range(7)]
+    assert mock_uow.commit.await_count == 3
+    assert mock_db.get_session.call_count == 3
+    assert audit.get_stats() == {"written": 7, "dropped": 0, "failed": 0, "queued": 0}
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_records(mock_db):
+    audit = QueryAuditLogger(max_queue_size=2, batch_size=10, flush_interval=0.05)
+
+    results = [audit.log("query", None, make_response(i)) for i in range(3)]
+    await audit.close()
+
+    assert results == [True, True, False]
+    assert audit.get_stats()["dropped"] == 1
+    assert audit.get_stats()["written"] == 2
+
+
+@pytest.mark.asyncio
+async def test_summary_mode_omits_data_payload(mock_db):
+    audit = QueryAuditLogger(flush_interval=0.05, full_response=False)
+
+    audit.log("query", None, make_response(1))
+    await audit.close()
+
+    [[row]] = inserted_batches(mock_db)
+    assert row["response"] == summarize_response(make_response(1))
+    assert "data" not in row["response"]
+    assert row["response"]["data_items"] == 1
+    assert row["source_ids"] == ["entity-1"]
+    assert row["confidence_score"] == 0.9
+
+
+@pytest.mark.asyncio
+async def test_write_failure_does_not_stop_writer(mock_db, mock_uow):
+    mock_uow.commit.side_effect = [RuntimeError("db down"), None]
+    audit = QueryAuditLogger(batch_size=1, flush_interval=0.05)
+
+    audit.log("first", None, make_response(1))
+    audit.log("second", None, make_response(2))
+    await audit.close()
+
+    assert audit.get_stats()["failed"] == 1
+    assert audit.get_stats()["written"] == 1
@@ -1,9 +1,13 @@
 """Unit tests for query engine."""
 
+import importlib
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
 
+from fastapi.testclient import TestClient
+
 from src.query.engine import QueryEngine
 from src.query.parser import QueryParser, ParsedQuery, QueryIntent
 from src.query.validator import ZeroHallucinationValidator, ValidationResult
@@ -245,4 +249,80 @@ async def test_attribute_extraction():
     # Test multiple attributes
     result = parser.parse("Get the IP and hostname of the router")
     assert "ip" in result.attributes
-    assert "hostname" in result.attributes
\ No newline at end of file
+    assert "hostname" in result.attributes
+
+@pytest.fixture
+def paged_search(query_engine):
+    """Engine whose search returns five hits hydrated from a mock database."""
+    query_engine.result_cap = 2
+    query_engine.search.search = AsyncMock(return_value=[
+        Mock(entity_id=f"entity-{i}", score=0.9) for i in range(5)
+    ])
+    query_engine.validator.validate_response = AsyncMock(
+        return_value=ValidationResult(valid=True, confidence=0.9)
+    )
+
+    entities = {}
+    for i in range(5):
+        entity = Mock(
+            id=f"entity-{i}", itglue_id=str(i), entity_type="configuration",
+            organization_id="42", attributes={}
+        )
+        entity.name = f"Server {i}"  # name= would name the mock itself
+        entities[entity.id] = entity
+    mock_uow = Mock()
+    mock_uow.itglue.get_by_ids = AsyncMock(
+        side_effect=lambda ids: [entities[entity_id] for entity_id in ids]
+    )
+    mock_uow.itglue.get_by_id = AsyncMock()
+    mock_uow.entities = entities
+
+    with patch('src.query.engine.db_manager') as mock_db, \
+         patch('src.query.engine.UnitOfWork', return_value=mock_uow):
+        mock_db.get_session.return_value.__aenter__ = AsyncMock()
+        mock_db.get_session.return_value.__aexit__ = AsyncMock(return_value=None)
+        yield mock_uow
+
+
+@pytest.mark.asyncio
+async def test_search_hydrates_in_one_batch_and_pages(query_engine, paged_search):
+    """Test that search results are hydrated with get_by_ids and capped."""
+    parsed = ParsedQuery(original_query="find servers", intent=QueryIntent.SEARCH, keywords=[])
+
+    first = await query_engine._handle_search(parsed)
+    second = await query_engine._handle_search(parsed, offset=first["next_offset"])
+
+    assert [item["id"] for item in first["data"]] == ["0", "1"]
+    assert first["has_more"] is True and first["next_offset"] == 2
+    assert [item["id"] for item in second["data"]] == ["2", "3"]
+    assert paged_search.itglue.get_by_ids.await_count == 2
+    paged_search.itglue.get_by_id.assert_not_called()
+
+    kwargs = query_engine.validator.validate_response.call_args.kwargs
+    entities = paged_search.entities
+    assert kwargs["source_entities"] == [entities["entity-2"], entities["entity-3"]]
+
+
+def test_api_pages_through_search_results(query_engine, paged_search):
+    """Test /query takes offset and returns has_more and next_offset."""
+    query_engine.parser.parse.return_value = ParsedQuery(
+        original_query="find servers", intent=QueryIntent.SEARCH, keywords=[]
+    )
+    query_engine._log_query = Mock()
+    # src.api re-exports the FastAPI app under the module's own name
+    api_module = importlib.import_module("src.api.app")
+    client = TestClient(api_module.app)
+
+    pages = []
+    offset = 0
+    with patch.object(api_module, 'query_engine', query_engine):
+        while offset is not None:
+            response = client.post("/query", json={"query": "find servers", "offset": offset})
+            assert response.status_code == 200
+            pages.append([item["id"] for item in response.json()["data"]])
+            offset = response.json()["next_offset"]
+
+        assert client.post("/query", json={"query": "x", "offset": -1}).status_code == 422
+
+    assert pages == [["0", "1"], ["2", "3"], ["4"]]
+    assert response.json()["has_more"] is False
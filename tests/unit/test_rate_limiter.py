@@ -0,0 +1,175 @@
+"""Unit tests for the IT Glue token-bucket rate limiter."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.itglue.rate_limiter import (
+    DEFAULT_RETRY_AFTER,
+    RedisTokenBucketRateLimiter,
+    TokenBucketRateLimiter,
+    parse_retry_after,
+)
+
+
+class TestParseRetryAfter:
+    """Test suite for Retry-After parsing."""
+
+    def test_delta_seconds(self):
+        assert parse_retry_after("12") == 12.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert 25 <= seconds <= 30
+
+    def test_missing_or_invalid(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestTokenBucketRateLimiter:
+    """Test suite for TokenBucketRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_not_delayed(self):
+        """Requests within the burst size go through immediately."""
+        limiter = TokenBucketRateLimiter(max_requests=60, burst=5)
+
+        with patch("src.services.itglue.rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            for _ in range(5):
+                await limiter.acquire()
+
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_requests_beyond_burst_are_paced(self):
+        """Each request beyond the burst waits one refill interval longer."""
+        limiter = TokenBucketRateLimiter(max_requests=60, burst=2)
+
+        waits = [limiter._reserve() for _ in range(4)]
+
+        assert waits[0] == 0 and waits[1] == 0
+        assert waits[2] == pytest.approx(1.0, abs=0.05)
+        assert waits[3] == pytest.approx(2.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_penalize_blocks_all_callers(self):
+        """A 429 pause applies even when tokens are available."""
+        limiter = TokenBucketRateLimiter(max_requests=600, burst=100)
+
+        await limiter.penalize(5)
+
+        assert limiter._reserve() == pytest.approx(5.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_penalize_without_retry_after_uses_default(self):
+        limiter = TokenBucketRateLimiter(max_requests=600, burst=100)
+
+        await limiter.penalize(None)
+
+        assert limiter._reserve() == pytest.approx(DEFAULT_RETRY_AFTER, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_time_until_spare_reserves_nothing(self):
+        """Spare-capacity checks leave the bucket untouched."""
+        limiter = TokenBucketRateLimiter(max_requests=60, burst=4)
+
+        assert await limiter.time_until_spare(reserve=2) == 0
+        assert await limiter.time_until_spare(reserve=2) == 0
+        for _ in range(2):
+            await limiter.acquire()
+
+        # Two tokens left: one more must refill before one is spare beyond two
+        assert await limiter.time_until_spare(reserve=2) == pytest.approx(1.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_respects_rate(self):
+        """Concurrent callers are spread out rather than released together."""
+        limiter = TokenBucketRateLimiter(max_requests=100, time_window=1, burst=1)
+
+        start = asyncio.get_event_loop().time()
+        await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+        elapsed = asyncio.get_event_loop().time() - start
+
+        assert elapsed >= 0.045
+
+
+class TestRedisTokenBucketRateLimiter:
+    """Test suite for RedisTokenBucketRateLimiter."""
+
+    @pytest.fixture
+    def from_url(self):
+        """Patch Redis client creation; each client gets fresh script mocks."""
+        def make_client(url):
+            client = MagicMock()
+            client.register_script.side_effect = lambda script: AsyncMock(return_value=0)
+            return client
+
+        with patch(
+            "src.services.itglue.rate_limiter.redis.Redis.from_url",
+            side_effect=make_client
+        ) as from_url:
+            yield from_url
+
+    @pytest.fixture
+    def limiter(self, from_url):
+        """Create distributed limiter with a patched Redis client."""
+        return RedisTokenBucketRateLimiter(max_requests=60, burst=1, redis_url="redis://localhost")
+
+    @pytest.mark.asyncio
+    async def test_waits_for_script_result(self, limiter):
+        _, acquire_script, _, _ = limiter._connect()
+        acquire_script.return_value = 250
+
+        with patch("src.services.itglue.rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            await limiter.acquire()
+
+        sleep.assert_awaited_once_with(0.25)
+        keys = acquire_script.call_args.kwargs["keys"]
+        assert keys == ["itglue:ratelimit:bucket", "itglue:ratelimit:blocked_until"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_bucket_on_redis_error(self, limiter):
+        import redis.asyncio as redis
+
+        _, acquire_script, _, _ = limiter._connect()
+        acquire_script.side_effect = redis.ConnectionError("down")
+
+        await limiter.acquire()
+
+        assert limiter._tokens == pytest.approx(0.0, abs=0.01)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [
+        RuntimeError("Event loop is closed"),
+        ConnectionRefusedError("refused"),
+        OSError("Network is unreachable"),
+    ])
+    async def test_falls_back_on_loop_and_connection_errors(self, limiter, error):
+        """Errors outside redis.RedisError also fall back to the local bucket."""
+        _, acquire_script, penalize_script, _ = limiter._connect()
+        acquire_script.side_effect = error
+        penalize_script.side_effect = error
+
+        await limiter.acquire()
+        await limiter.penalize(1)
+
+        assert limiter._reserve() == pytest.approx(1.0, abs=0.05)
+
+    def test_client_per_event_loop(self, limiter, from_url):
+        """Each event loop gets its own client; a loop reuses its client."""
+        async def acquire_twice():
+            await limiter.acquire()
+            await limiter.acquire()
+            return limiter._connect()[0]
+
+        first = asyncio.run(acquire_twice())
+        second = asyncio.run(acquire_twice())
+
+        assert from_url.call_count == 2
+        assert first is not second
+        assert second.register_script.call_count == 3
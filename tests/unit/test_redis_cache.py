@@ -15,6 +15,8 @@ from src.cache.redis_cache import (
     CacheEntry
 )
 from src.cache.cache_warmer import CacheWarmer, WarmingQuery
+from src.cache.codec import ValueCodec
+from src.services.itglue.rate_limiter import TokenBucketRateLimiter
 
 
 class TestCacheStrategy:
@@ -337,6 +339,393 @@ class TestRedisCache:
         assert stats['total_keys'] == 500
 
 
+class TestAccessTracking:
+    """Test suite for cache hit access tracking."""
+    
+    @pytest.fixture
+    def cache(self):
+        """Create cache with a mock Redis client and pipeline."""
+        cache = RedisCache(access_tracking="buffered", access_flush_interval=0.01)
+        cache.client = AsyncMock()
+        cache.client.get.return_value = json.dumps({'foo': 'bar'})
+        cache.pipeline = MagicMock()
+        cache.pipeline.execute = AsyncMock(return_value=[])
+        cache.client.pipeline = Mock(return_value=cache.pipeline)
+        cache.connected = True
+        return cache
+    
+    @pytest.mark.asyncio
+    async def test_buffered_hits_cost_one_round_trip(self, cache):
+        """Test buffered hits are flushed together in one pipeline."""
+        for _ in range(3):
+            assert await cache.get("hot") == {'foo': 'bar'}
+        await cache.get("warm")
+        
+        assert cache.client.get.await_count == 4
+        cache.client.incr.assert_not_called()
+        cache.client.pipeline.assert_not_called()
+        
+        flushed = await cache.flush_access_stats()
+        
+        assert flushed == 2
+        cache.client.pipeline.assert_called_once()
+        cache.pipeline.hincrby.assert_any_call("itglue:hot:access_stats", "count", 3)
+        cache.pipeline.hincrby.assert_any_call("itglue:warm:access_stats", "count", 1)
+        cache.pipeline.execute.assert_awaited_once()
+        assert cache._pending_hits == {}
+        
+        await cache.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_background_flush_and_popularity(self, cache):
+        """Test buffered hits are flushed in the background and still counted."""
+        cache.client.hgetall.return_value = {}
+        for _ in range(5):
+            await cache.get("hot")
+        
+        # Unflushed hits already count towards popularity
+        assert await cache.should_refresh("hot") is True
+        assert await cache.should_refresh("cold") is False
+        
+        await cache._access_flush_task
+        
+        cache.pipeline.execute.assert_awaited_once()
+        cache.client.hgetall.return_value = {
+            'count': '5', 'last_accessed': '2024-01-01T00:00:00'
+        }
+        stats = await cache.get_access_stats("hot")
+        assert stats == {'access_count': 5, 'last_accessed': '2024-01-01T00:00:00'}
+    
+    @pytest.mark.asyncio
+    async def test_sampled_hits_are_scaled(self, cache):
+        """Test sampled hits count for the hits they stand in for."""
+        cache.access_sample_rate = 0.25
+        
+        with patch('src.cache.redis_cache.random.random', side_effect=[0.1, 0.9, 0.9, 0.9]):
+            for _ in range(4):
+                await cache.get("hot")
+        
+        assert cache._pending_hits == {"itglue:hot": 4}
+        assert cache.stats['hits'] == 4
+        
+        # Disconnecting writes out what is still buffered
+        await cache.disconnect()
+        cache.pipeline.hincrby.assert_called_once_with("itglue:hot:access_stats", "count", 4)
+    
+    @pytest.mark.asyncio
+    async def test_sync_and_off_modes(self, cache):
+        """Test sync mode pipelines each hit and off mode records nothing."""
+        cache.access_tracking = "sync"
+        await cache.get("hot")
+        cache.pipeline.hincrby.assert_called_once_with("itglue:hot:access_stats", "count", 1)
+        cache.pipeline.execute.assert_awaited_once()
+        
+        cache.access_tracking = "off"
+        await cache.get("hot")
+        assert cache.pipeline.execute.await_count == 1
+        assert cache._pending_hits == {}
+    
+    def test_unknown_mode_rejected(self):
+        """Test an unknown access tracking mode is rejected."""
+        with pytest.raises(ValueError):
+            RedisCache(access_tracking="always")
+
+
+class TestValueEncoding:
+    """Test suite for binary value encoding in RedisCache."""
+    
+    @pytest.fixture
+    def cache(self, dict_cache):
+        """Create cache that compresses values over 512 bytes."""
+        return dict_cache(codec=ValueCodec('json', 'zlib', compression_threshold=512))
+    
+    @pytest.mark.asyncio
+    async def test_large_values_are_stored_compressed(self, cache):
+        """Test large values round trip through compressed binary encoding."""
+        value = {'documents': [{'id': str(i), 'content': 'step ' * 100} for i in range(20)]}
+        
+        assert await cache.set("docs", value, query_type=QueryType.DOCUMENTATION)
+        
+        stored = cache.store["itglue:docs"]
+        assert isinstance(stored, bytes)
+        assert len(stored) < len(json.dumps(value)) / 5
+        assert await cache.get("docs") == value
+        
+        stats = await cache.get_stats()
+        assert stats['encoding']['documentation']['compressed'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_legacy_json_entries_are_read(self, cache):
+        """Test entries written as plain JSON before encoding still decode."""
+        cache.store["itglue:old"] = json.dumps({'legacy': True}).encode()
+        
+        assert await cache.get("old") == {'legacy': True}
+
+
+class TestL1Cache:
+    """Test suite for the in-process L1 tier of RedisCache."""
+    
+    @pytest.fixture
+    def cache(self, dict_cache):
+        """Create cache with an L1 tier publishing on the dict-backed client."""
+        cache = dict_cache(key_prefix="query:", l1_max_entries=100)
+        cache.l1.invalidations._client = cache.client
+        return cache
+    
+    @pytest.mark.asyncio
+    async def test_hot_reads_are_served_locally(self, cache):
+        """Test values read from Redis are held for their query type's L1 TTL."""
+        writer = RedisCache(key_prefix="query:", access_tracking="off")
+        writer.client = cache.client
+        writer.connected = True
+        await writer.set("org-list", ['Acme'], query_type=QueryType.OPERATIONAL)
+        await writer.set("password", {'secret': 'x'}, query_type=QueryType.CRITICAL)
+        
+        for _ in range(3):
+            assert await cache.get("org-list") == ['Acme']
+            assert await cache.get("password") == {'secret': 'x'}
+        
+        # Critical entries are never held in process memory
+        assert cache.client.mget.await_count == 4
+        assert "query:org-list" in cache.l1._entries
+        assert "query:password" not in cache.l1._entries
+        assert cache.stats['hits'] == 6
+        
+        stats = await cache.get_stats()
+        assert stats['l1']['hits'] == 2
+    
+    @pytest.mark.asyncio
+    async def test_writes_and_invalidations_are_published(self, cache):
+        """Test local writes and invalidations are broadcast to other processes."""
+        await cache.set("org:1:docs", ['doc'], query_type=QueryType.OPERATIONAL)
+        await cache.set("org:2:docs", ['doc'], query_type=QueryType.OPERATIONAL)
+        cache.client.mget.reset_mock()
+        
+        assert await cache.get("org:1:docs") == ['doc']
+        cache.client.mget.assert_not_awaited()
+        
+        cache.client.pipeline = Mock(return_value=AsyncMock())
+        await cache.invalidate_pattern("org:1:*")
+        
+        assert "query:org:1:docs" not in cache.l1._entries
+        assert "query:org:2:docs" in cache.l1._entries
+        messages = [json.loads(call.args[1]) for call in cache.client.publish.await_args_list]
+        assert messages[0]['keys'] == ["query:org:1:docs"]
+        assert messages[-1]['pattern'] == "query:org:1:*"
+        assert cache.client.publish.await_args.args[0] == "query:invalidations:0"
+    
+    @pytest.mark.asyncio
+    async def test_remote_invalidations_evict_local_entries(self, cache):
+        """Test invalidations from other processes evict L1 entries."""
+        await cache.set("org:1:docs", ['doc'], query_type=QueryType.OPERATIONAL)
+        await cache.set("types", ['Server'], query_type=QueryType.DOCUMENTATION)
+        
+        cache.l1.apply_invalidation({'keys': ["query:types"], 'origin': 'other'})
+        assert "query:types" not in cache.l1._entries
+        
+        cache.l1.apply_invalidation({'all': True, 'origin': 'other'})
+        assert len(cache.l1) == 0
+    
+    @pytest.mark.asyncio
+    async def test_read_overtaken_by_invalidation_is_not_held(self, cache):
+        """Test a value invalidated while it was being read is not held."""
+        await cache.set("types", ['Server'], query_type=QueryType.DOCUMENTATION)
+        cache.l1.clear()
+        
+        async def mget(*keys):
+            cache.l1.apply_invalidation({'keys': [keys[0]], 'origin': 'other'})
+            return [cache.store.get(key) for key in keys]
+        
+        cache.client.mget.side_effect = mget
+        
+        assert await cache.get("types") == ['Server']
+        assert len(cache.l1) == 0
+
+
+class TestSingleFlight:
+    """Test suite for coalesced fetches in get_or_fetch."""
+    
+    @pytest.fixture
+    def cache(self, dict_cache):
+        """Create cache without the cross-process fetch lock."""
+        return dict_cache(single_flight_lock=False)
+    
+    @staticmethod
+    def slow_fetch(result=None, error=None):
+        """Create a fetch function that yields to other callers first."""
+        async def fetch(query, params):
+            await asyncio.sleep(0.01)
+            if error:
+                raise error
+            return result
+        return AsyncMock(side_effect=fetch)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, cache):
+        """Test concurrent misses for one key run the fetch once."""
+        fetch_func = self.slow_fetch(['Acme', 'Globex'])
+        
+        results = await asyncio.gather(*(
+            cache.get_or_fetch("list organizations", fetch_func) for _ in range(10)
+        ))
+        
+        assert results == [['Acme', 'Globex']] * 10
+        fetch_func.assert_awaited_once()
+        assert cache.single_flight_stats['coalesced'] == 9
+        assert cache._inflight == {}
+        
+        # Later calls are served from cache
+        assert await cache.get_or_fetch("list organizations", fetch_func) == ['Acme', 'Globex']
+        fetch_func.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_shared_and_not_cached(self, cache):
+        """Test waiters all see a failed fetch and the next miss retries."""
+        fetch_func = self.slow_fetch(error=RuntimeError("rate limited"))
+        
+        results = await asyncio.gather(*(
+            cache.get_or_fetch("list organizations", fetch_func) for _ in range(3)
+        ))
+        
+        assert results == [None, None, None]
+        fetch_func.assert_awaited_once()
+        
+        fetch_func.side_effect = None
+        fetch_func.return_value = ['Acme']
+        assert await cache.get_or_fetch("list organizations", fetch_func) == ['Acme']
+    
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_one_caller_refreshes(self, cache):
+        """Test expired values are served while a single refresh runs."""
+        await cache.get_or_fetch(
+            "list documents", AsyncMock(return_value=['v1']), stale_while_revalidate=True
+        )
+        key = cache._make_key(cache._generate_cache_key("list documents"))
+        assert cache.store[f"{key}:stale"] == cache.store[key]
+        
+        # The entry expires, leaving the stale copy
+        del cache.store[key]
+        fetch_func = self.slow_fetch(['v2'])
+        
+        results = await asyncio.gather(*(
+            cache.get_or_fetch("list documents", fetch_func, stale_while_revalidate=True)
+            for _ in range(5)
+        ))
+        
+        assert results == [['v1']] * 5
+        assert cache.single_flight_stats['stale_served'] == 5
+        
+        await asyncio.gather(*cache._inflight.values())
+        fetch_func.assert_awaited_once()
+        assert await cache.get_or_fetch("list documents", fetch_func) == ['v2']
+    
+    @pytest.mark.asyncio
+    async def test_redis_lock_coalesces_across_processes(self, cache):
+        """Test a process that loses the lock waits for the holder's value."""
+        cache.single_flight_lock = True
+        holder = RedisCache(access_tracking="off")
+        holder.client = cache.client
+        holder.connected = True
+        cache.client.set.return_value = None  # lock held elsewhere
+        fetch_func = AsyncMock(return_value=['from this process'])
+        
+        async def other_process_stores():
+            await asyncio.sleep(0.02)
+            await holder.set(cache._generate_cache_key("list organizations"), ['from holder'])
+        
+        result, _ = await asyncio.gather(
+            cache.get_or_fetch("list organizations", fetch_func),
+            other_process_stores()
+        )
+        
+        assert result == ['from holder']
+        fetch_func.assert_not_awaited()
+        assert cache.single_flight_stats['lock_waits'] == 1
+        
+        # The lock holder releases only its own lock
+        cache.client.set.return_value = True
+        await cache.get_or_fetch("list documents", fetch_func)
+        fetch_func.assert_awaited_once()
+        lock_key, token = cache.client.set.await_args.args
+        assert lock_key.startswith("itglue:lock:query:")
+        assert cache.client.eval.await_args.args[2:] == (lock_key, token)
+
+
+class TestRefreshAhead:
+    """Test suite for renewing popular entries before they expire."""
+    
+    @pytest.fixture
+    def cache(self, dict_cache):
+        """Create cache with settable popularity and an idle API rate limiter."""
+        access = {}
+        cache = dict_cache(single_flight_lock=False)
+        cache.client.hgetall.side_effect = lambda key: access.get(key.removesuffix(":access_stats"), {})
+        cache.client.pipeline = Mock(return_value=MagicMock(execute=AsyncMock(return_value=[])))
+        cache.refresh_scheduler.rate_limiter = TokenBucketRateLimiter(max_requests=600, burst=100)
+        cache.access = access
+        return cache
+    
+    @staticmethod
+    def read_now(count):
+        """Access stats of an entry read ``count`` times, last just now."""
+        return {b'count': str(count).encode(), b'last_accessed': datetime.now().isoformat().encode()}
+    
+    @pytest.mark.asyncio
+    async def test_popular_entries_reloaded_by_namespace_loader(self, cache):
+        """Test only popular entries are renewed, through their namespace's loader."""
+        versions = {'hot': 1, 'cold': 1}
+        
+        async def load_password(key):
+            versions[key] += 1
+            return {'password': f'v{versions[key]}'}
+        
+        cache.register_loader("passwords", load_password)
+        
+        with patch('src.cache.refresh.REFRESH_AT_TTL_FRACTION', 0.01):
+            for key in ('hot', 'cold'):
+                await cache.set(
+                    key, {'password': 'v1'}, query_type=QueryType.CRITICAL,
+                    namespace="passwords", ttl_override=1
+                )
+            # Entries without a loader are not scheduled
+            await cache.set("other", {'password': 'v1'}, query_type=QueryType.CRITICAL)
+            cache.access["itglue:passwords:hot"] = self.read_now(10)
+            cache.access["itglue:passwords:cold"] = self.read_now(1)
+            await asyncio.sleep(0.05)
+        
+        assert await cache.get("hot", namespace="passwords") == {'password': 'v2'}
+        assert await cache.get("cold", namespace="passwords") == {'password': 'v1'}
+        
+        stats = (await cache.get_stats())['refresh']
+        assert stats['refreshed'] == 1
+        # The renewed entry was rescheduled, then skipped as unread since
+        assert stats['scheduled'] == 3
+        assert stats['skipped_unpopular'] == 2
+        assert stats['pending'] == 0
+        
+        await cache.disconnect()
+    
+    @pytest.mark.asyncio
+    async def test_popular_fetched_results_refetched_before_expiry(self, cache):
+        """Test get_or_fetch results are refetched ahead of expiry while read."""
+        fetch_func = AsyncMock(side_effect=[['Acme'], ['Acme', 'Globex']])
+        
+        with patch('src.cache.refresh.REFRESH_AT_TTL_FRACTION', 0.0001):
+            await cache.get_or_fetch(
+                "list organizations", fetch_func, query_type=QueryType.CRITICAL
+            )
+            full_key = next(key for key in cache.store if not key.endswith(":meta"))
+            cache.access[full_key] = self.read_now(5)
+            await asyncio.sleep(0.05)
+        
+        assert fetch_func.await_count == 2
+        assert await cache.get_or_fetch(
+            "list organizations", fetch_func, query_type=QueryType.CRITICAL
+        ) == ['Acme', 'Globex']
+        
+        await cache.disconnect()
+
+
 class TestCacheManager:
     """Test suite for CacheManager."""
     
@@ -352,6 +741,15 @@ class TestCacheManager:
         
         return manager
     
+    def test_loaders_registered_on_every_cache(self):
+        """Test loaders passed to the manager reach each cache instance."""
+        load_organization = AsyncMock(return_value={'id': '1'})
+
+        manager = CacheManager(loaders={'organizations': load_organization})
+
+        for cache in manager.caches:
+            assert cache._loaders == {'organizations': load_organization}
+
     @pytest.mark.asyncio
     async def test_connect_all(self, manager):
         """Test connecting all cache instances."""
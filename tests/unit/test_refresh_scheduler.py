@@ -0,0 +1,143 @@
+"""Unit tests for the refresh-ahead scheduler."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.cache.refresh import RefreshScheduler
+from src.services.itglue.rate_limiter import TokenBucketRateLimiter
+
+
+def recorder(log, name, delay=0.0):
+    """Create a refresh that records when it ran."""
+    async def refresh():
+        log.append(name)
+        await asyncio.sleep(delay)
+    return refresh
+
+
+class TestRefreshScheduler:
+    """Test suite for RefreshScheduler."""
+
+    @pytest.fixture
+    def limiter(self):
+        """IT Glue rate limiter with plenty of spare tokens."""
+        return TokenBucketRateLimiter(max_requests=6000, burst=100)
+
+    @pytest.mark.asyncio
+    async def test_refreshes_run_in_due_order_on_one_task(self, limiter):
+        """Test jobs run by due time and rescheduling a key replaces its job."""
+        scheduler = RefreshScheduler(max_concurrency=4, max_per_minute=100, rate_limiter=limiter)
+        log = []
+
+        scheduler.schedule('late', 0.1, recorder(log, 'late'))
+        scheduler.schedule('early', 0.02, recorder(log, 'early'))
+        scheduler.schedule('dropped', 0.03, recorder(log, 'dropped'))
+        scheduler.schedule('replaced', 0.01, recorder(log, 'old'))
+        scheduler.schedule('replaced', 0.05, recorder(log, 'new'))
+        assert scheduler.cancel('dropped')
+
+        await asyncio.sleep(0.15)
+
+        assert log == ['early', 'new', 'late']
+        stats = scheduler.get_stats()
+        assert stats['refreshed'] == 3
+        assert stats['pending'] == 0
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self, limiter):
+        """Test no more than max_concurrency refreshes run at once."""
+        scheduler = RefreshScheduler(max_concurrency=2, max_per_minute=100, rate_limiter=limiter)
+        running = 0
+        peak = 0
+
+        async def refresh():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        for i in range(6):
+            scheduler.schedule(f'key:{i}', 0.01, refresh)
+
+        await asyncio.sleep(0.15)
+
+        assert peak == 2
+        assert scheduler.get_stats()['refreshed'] == 6
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_budget_defers_refreshes_until_they_would_be_too_late(self, limiter):
+        """Test over-budget jobs wait for budget, or are dropped if they cannot."""
+        scheduler = RefreshScheduler(max_concurrency=4, max_per_minute=2, rate_limiter=limiter)
+        log = []
+
+        with patch('src.cache.refresh.BUDGET_WINDOW', 0.1):
+            scheduler.schedule('a', 0.01, recorder(log, 'a'))
+            scheduler.schedule('b', 0.01, recorder(log, 'b'))
+            scheduler.schedule('late', 0.02, recorder(log, 'late'))  # expires before budget frees
+            scheduler.schedule('deferred', 0.12, recorder(log, 'deferred'))  # can wait for it
+            scheduler.schedule('pending', 1.0, recorder(log, 'pending'))
+
+            await asyncio.sleep(0.05)
+            assert sorted(log) == ['a', 'b']
+
+            await asyncio.sleep(0.1)
+
+        assert sorted(log) == ['a', 'b', 'deferred']
+        stats = scheduler.get_stats()
+        assert stats['skipped_budget'] == 1
+        assert stats['pending'] == 1
+        await scheduler.stop()
+        assert scheduler.get_stats()['pending'] == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_rate_limit_reserve_left_to_user_queries(self):
+        """Test refreshes wait while the shared API limiter is down to its reserve."""
+        limiter = TokenBucketRateLimiter(max_requests=60, time_window=1, burst=4)
+        scheduler = RefreshScheduler(max_concurrency=4, max_per_minute=100, rate_limiter=limiter)
+        log = []
+
+        # User queries leave two of four tokens, the reserve
+        for _ in range(2):
+            await limiter.acquire()
+
+        scheduler.schedule('soon', 0.01, recorder(log, 'soon'))  # expires before a token frees
+        scheduler.schedule('later', 0.1, recorder(log, 'later'))
+
+        await asyncio.sleep(0.02)
+        assert log == []
+
+        await asyncio.sleep(0.1)
+
+        assert log == ['later']
+        assert scheduler.get_stats()['skipped_budget'] == 1
+        await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_unpopular_entries_and_failures(self, limiter):
+        """Test unpopular entries are skipped and failures are counted."""
+        scheduler = RefreshScheduler(max_concurrency=1, max_per_minute=100, rate_limiter=limiter)
+        log = []
+
+        async def unpopular():
+            return False
+
+        async def failing():
+            raise ConnectionError("API unavailable")
+
+        scheduler.schedule('cold', 0.01, recorder(log, 'cold'), unpopular)
+        scheduler.schedule('broken', 0.01, failing)
+        scheduler.schedule('hot', 0.01, recorder(log, 'hot'))
+
+        await asyncio.sleep(0.05)
+
+        assert log == ['hot']
+        stats = scheduler.get_stats()
+        assert stats['skipped_unpopular'] == 1
+        assert stats['failed'] == 1
+        assert stats['refreshed'] == 1
+        await scheduler.stop()
@@ -0,0 +1,52 @@
+"""Unit tests for SemanticSearch indexing."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.search.semantic import SemanticSearch, point_id_for
+
+
+@pytest.fixture
+def search():
+    generator = MagicMock()
+    generator.get_dimension.return_value = 2
+    generator.generate_embedding_array = AsyncMock(
+        side_effect=lambda texts: np.ones((len(texts), 2), dtype=np.float32)
+    )
+    generator.generate_batch = AsyncMock(
+        side_effect=lambda texts, batch_size: np.ones((len(texts), 2), dtype=np.float32)
+    )
+
+    with patch("src.search.semantic.get_qdrant_client", return_value=AsyncMock()):
+        return SemanticSearch(embedding_generator=generator)
+
+
+def test_point_ids_are_deterministic():
+    assert point_id_for("42", 0) == point_id_for("42", 0)
+    assert point_id_for("42", 0) != point_id_for("42", 1)
+    assert point_id_for("42", 1) != point_id_for("43", 1)
+
+
+@pytest.mark.asyncio
+async def test_reindexing_reuses_point_ids(search):
+    first = await search.index_batch([{"id": "42", "text": "server"}])
+    second = await search.index_batch([{"id": "42", "text": "server v2"}])
+
+    assert first == second == [point_id_for("42")]
+
+
+@pytest.mark.asyncio
+async def test_replace_entity_chunks_deletes_stale_points(search):
+    point_ids = await search.replace_entity_chunks("42", ["a", "b"], {"entity_type": "document"})
+
+    assert point_ids == [point_id_for("42", 0), point_id_for("42", 1)]
+
+    batch = search.client.upsert.call_args.kwargs["points"]
+    assert batch.ids == point_ids
+    assert [p["chunk_index"] for p in batch.payloads] == [0, 1]
+
+    stale = search.client.delete.call_args.kwargs["points_selector"].filter
+    assert stale.must[0].key == "entity_id" and stale.must[0].match.value == "42"
+    assert stale.must_not[0].has_id == point_ids
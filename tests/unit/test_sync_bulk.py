@@ -0,0 +1,227 @@
+"""Unit tests for bulk sync database writes."""
+
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.sync.bulk import (
+    MAX_ROWS_PER_STATEMENT,
+    bulk_add_to_embedding_queue,
+    bulk_upsert_entities,
+    compute_content_hash,
+)
+from src.sync.incremental import IncrementalSync
+from src.sync.orchestrator import SyncOrchestrator
+
+
+def compile_stmt(stmt):
+    """Compile a statement for PostgreSQL."""
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+@pytest.fixture
+def entity():
+    """Factory for prepared entity rows."""
+    def make(itglue_id: str, name: str = "Server") -> dict:
+        return {
+            "itglue_id": itglue_id,
+            "entity_type": "configuration",
+            "organization_id": "42",
+            "name": name,
+            "attributes": {"name": name},
+            "relationships": {},
+            "search_text": name.lower(),
+        }
+    return make
+
+
+@pytest.fixture
+def session():
+    """Session whose execute echoes back upserted rows.
+
+    Statements containing the IT Glue ID "bad" are rejected, as the
+    database would reject a row violating a constraint.
+    """
+    session = MagicMock()
+    session.written = []
+    session.rolled_back = 0
+
+    async def execute(stmt):
+        params = compile_stmt(stmt).params
+        itglue_ids = [v for k, v in params.items() if k.startswith("itglue_id")]
+        if "bad" in itglue_ids:
+            raise ValueError("value too long for type character varying(255)")
+        session.written.extend(itglue_ids)
+        return [(uuid.uuid4(), itglue_id) for itglue_id in itglue_ids]
+
+    @asynccontextmanager
+    async def begin_nested():
+        try:
+            yield
+        except Exception:
+            session.rolled_back += 1
+            raise
+
+    session.execute = AsyncMock(side_effect=execute)
+    session.begin_nested = begin_nested
+    return session
+
+
+class TestBulkUpsert:
+    """Test bulk entity upserts."""
+
+    @pytest.mark.asyncio
+    async def test_uses_single_on_conflict_statement(self, session, entity):
+        """Test a batch is written with one ON CONFLICT statement."""
+        entities = [entity(str(i)) for i in range(50)]
+
+        ids = await bulk_upsert_entities(session, entities)
+
+        assert session.execute.await_count == 1
+        sql = str(compile_stmt(session.execute.call_args.args[0]))
+        assert "ON CONFLICT (itglue_id) DO UPDATE" in sql
+        assert "RETURNING" in sql
+        assert set(ids) == {str(i) for i in range(50)}
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_ids_last_wins(self, session, entity):
+        """Test duplicate IDs in a batch keep the last row."""
+        await bulk_upsert_entities(session, [entity("1", "Old"), entity("1", "New")])
+
+        params = compile_stmt(session.execute.call_args.args[0]).params
+        names = [v for k, v in params.items() if k.startswith("name")]
+        assert names == ["New"]
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_batches(self, session, entity):
+        """Test batches over the row limit are split across statements."""
+        entities = [entity(str(i)) for i in range(MAX_ROWS_PER_STATEMENT + 1)]
+
+        await bulk_upsert_entities(session, entities)
+
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_unchanged_rows(self, session, entity):
+        """Test rows with an unchanged content hash are not rewritten."""
+        await bulk_upsert_entities(session, [entity("1")])
+
+        compiled = compile_stmt(session.execute.call_args.args[0])
+        assert (
+            "WHERE itglue_entities.content_hash IS DISTINCT FROM excluded.content_hash"
+            in str(compiled)
+        )
+        hashes = [v for k, v in compiled.params.items() if k.startswith("content_hash")]
+        assert hashes == [compute_content_hash({"name": "Server"}, {})]
+
+    @pytest.mark.asyncio
+    async def test_can_force_update(self, session, entity):
+        """Test skip_unchanged=False rewrites every row."""
+        await bulk_upsert_entities(session, [entity("1")], skip_unchanged=False)
+
+        sql = str(compile_stmt(session.execute.call_args.args[0]))
+        assert "IS DISTINCT FROM" not in sql
+
+
+class TestContentHash:
+    """Test entity content hashing."""
+
+    def test_ignores_key_order(self):
+        """Test the hash does not depend on key order."""
+        a = compute_content_hash({"name": "x", "os": "linux"}, {"org": {"id": 1}})
+        b = compute_content_hash({"os": "linux", "name": "x"}, {"org": {"id": 1}})
+
+        assert a == b
+        assert a != compute_content_hash({"name": "y", "os": "linux"}, {"org": {"id": 1}})
+
+
+class TestEmbeddingQueue:
+    """Test bulk embedding queue inserts."""
+
+    @pytest.mark.asyncio
+    async def test_add_to_embedding_queue(self, session):
+        """Test queue items are deduplicated and inserted in one statement."""
+        count = await bulk_add_to_embedding_queue(
+            session,
+            [("a", "configurations"), ("b", "configurations"), ("a", "configurations")]
+        )
+
+        assert count == 2
+        assert session.execute.await_count == 1
+        sql = str(compile_stmt(session.execute.call_args.args[0]))
+        assert sql.startswith("INSERT INTO embedding_queue")
+
+    @pytest.mark.asyncio
+    async def test_add_to_embedding_queue_empty(self, session):
+        """Test an empty queue batch issues no statement."""
+        assert await bulk_add_to_embedding_queue(session, []) == 0
+        session.execute.assert_not_called()
+
+
+class TestProcessBatch:
+    """Test the orchestrator's batch writes."""
+
+    @pytest.fixture
+    def orchestrator(self):
+        """Create orchestrator with a mock client."""
+        return SyncOrchestrator(itglue_client=MagicMock())
+
+    @pytest.fixture
+    def batch(self):
+        """IT Glue API records for a batch."""
+        return [
+            {"id": itglue_id, "attributes": {"name": f"Server {itglue_id}"}}
+            for itglue_id in ("1", "2", "3")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_valid_batch_written_in_bulk(self, orchestrator, session, batch):
+        """Test a valid batch takes one upsert and one queue insert."""
+        changed, failed = await orchestrator._process_batch(session, "configurations", batch)
+
+        assert (changed, failed) == (3, 0)
+        assert session.execute.await_count == 2
+        assert session.rolled_back == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_entity_does_not_drop_batch(self, orchestrator, session, batch):
+        """Test one rejected entity is counted while the rest are stored."""
+        batch.insert(1, {"id": "bad", "attributes": {"name": "x" * 300}})
+        batch.append({"attributes": {"name": "No ID"}})
+
+        changed, failed = await orchestrator._process_batch(session, "configurations", batch)
+
+        assert (changed, failed) == (3, 2)
+        # Bulk attempt and the bad row are rolled back to their savepoints
+        assert session.rolled_back == 2
+        assert session.written == ["1", "2", "3"]
+        queued = [
+            call for call in session.execute.call_args_list
+            if str(compile_stmt(call.args[0])).startswith("INSERT INTO embedding_queue")
+        ]
+        assert len(queued) == 3
+
+
+class TestProcessChanges:
+    """Test the incremental sync's batch writes."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_entity_does_not_abort_sync(self, session):
+        """Test one rejected entity is skipped while the rest of its batch is stored."""
+        incremental = IncrementalSync(itglue_client=MagicMock(), batch_size=3)
+        uow = MagicMock(commit=AsyncMock())
+        changes = [
+            {"id": itglue_id, "attributes": {"name": f"Server {itglue_id}"}}
+            for itglue_id in ("1", "bad", "2", "3")
+        ]
+
+        count = await incremental._process_changes(uow, session, "configurations", changes)
+
+        assert count == 3
+        assert session.written == ["1", "2", "3"]
+        # Bulk attempt of the first batch and the bad row are rolled back
+        assert session.rolled_back == 2
+        assert uow.commit.await_count == 2
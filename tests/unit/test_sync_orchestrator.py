@@ -0,0 +1,40 @@
+"""Unit tests for the sync orchestrator."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.itglue.client import ITGlueClient
+from src.sync.orchestrator import SyncOrchestrator
+
+
+class TestClientLifetime:
+    """Test which IT Glue sessions a sync closes."""
+
+    @pytest.mark.asyncio
+    async def test_shared_client_left_open(self):
+        """Test a client passed in keeps serving other callers after a sync."""
+        client = ITGlueClient(api_key="test-key")
+        orchestrator = SyncOrchestrator(itglue_client=client)
+
+        async with orchestrator._connected_client():
+            session = client.session
+            assert session is not None
+
+        assert client.session is session
+        assert not session.closed
+
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_own_client_closed(self):
+        """Test the orchestrator closes the client it created."""
+        with patch('src.sync.orchestrator.ITGlueClient', return_value=ITGlueClient(api_key="test-key")):
+            orchestrator = SyncOrchestrator()
+
+        with patch.object(orchestrator.client, 'disconnect', AsyncMock()) as disconnect:
+            async with orchestrator._connected_client():
+                assert orchestrator.client.session is not None
+
+        disconnect.assert_awaited_once()
+        await orchestrator.client.session.close()
@@ -0,0 +1,103 @@
+"""Unit tests for the concurrent sync scheduler."""
+
+import asyncio
+
+import pytest
+
+from src.sync.scheduler import JobStatus, SyncCheckpoint, SyncJob, SyncScheduler
+
+
+def make_jobs(orgs=("1", "2", "3"), entity_types=("configurations", "contacts")):
+    return [SyncJob(org, entity_type) for org in orgs for entity_type in entity_types]
+
+
+@pytest.mark.asyncio
+async def test_runs_jobs_concurrently_under_cap():
+    in_flight = 0
+    peak = 0
+
+    async def runner(job):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 5
+
+    scheduler = SyncScheduler(runner, max_concurrency=3)
+    stats = await scheduler.run(make_jobs())
+
+    assert stats["completed"] == 6
+    assert stats["total_synced"] == 30
+    assert 1 < peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_reports_progress_per_job():
+    seen = []
+
+    async def runner(job):
+        return 1
+
+    scheduler = SyncScheduler(
+        runner,
+        max_concurrency=2,
+        progress_callback=lambda job, finished, total: seen.append((job.key, finished, total))
+    )
+    await scheduler.run(make_jobs())
+
+    assert len(seen) == 6
+    assert sorted(finished for _, finished, _ in seen) == [1, 2, 3, 4, 5, 6]
+    assert all(total == 6 for _, _, total in seen)
+
+
+@pytest.mark.asyncio
+async def test_retries_then_marks_failed():
+    attempts = {}
+
+    async def runner(job):
+        attempts[job.key] = attempts.get(job.key, 0) + 1
+        if job.organization_id == "2":
+            raise RuntimeError("API down")
+        return 1
+
+    scheduler = SyncScheduler(runner, max_concurrency=4, max_attempts=3, retry_delay=0)
+    stats = await scheduler.run(make_jobs())
+
+    assert stats["failed"] == 2
+    assert attempts["2:configurations"] == 3
+    assert attempts["1:configurations"] == 1
+    failed = [job for job in stats["jobs"] if job["status"] == JobStatus.FAILED.value]
+    assert {job["error"] for job in failed} == {"API down"}
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_completed_jobs(tmp_path):
+    calls = []
+    fail = True
+
+    async def runner(job):
+        calls.append(job.key)
+        if fail and job.key == "3:contacts":
+            raise RuntimeError("boom")
+        return 1
+
+    first = SyncScheduler(
+        runner, max_attempts=1, checkpoint=SyncCheckpoint("run-1", directory=tmp_path)
+    )
+    stats = await first.run(make_jobs())
+    assert stats["failed"] == 1
+    assert (tmp_path / "run-1.json").exists()
+
+    calls.clear()
+    fail = False
+    resumed = SyncScheduler(
+        runner, max_attempts=1, checkpoint=SyncCheckpoint("run-1", directory=tmp_path)
+    )
+    stats = await resumed.run(make_jobs())
+
+    assert calls == ["3:contacts"]
+    assert stats["skipped"] == 5
+    assert stats["failed"] == 0
+    # Checkpoint is cleared once everything finished
+    assert not (tmp_path / "run-1.json").exists()
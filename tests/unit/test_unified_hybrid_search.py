@@ -0,0 +1,133 @@
+"""Unit tests for UnifiedHybridSearch source fan-out."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.search.unified_hybrid import UnifiedHybridSearch, UnifiedSearchResults
+
+
+def make_search(delays: dict, **kwargs) -> UnifiedHybridSearch:
+    search = UnifiedHybridSearch(**kwargs)
+
+    async def keyword(*args):
+        await asyncio.sleep(delays["keyword"])
+        return [("1", 1.0, {"name": "Server", "entity_type": "configuration"})]
+
+    async def semantic(*args):
+        await asyncio.sleep(delays["semantic"])
+        return [("1", 0.9, {}), ("2", 0.8, {"name": "Firewall"})]
+
+    async def graph(*args):
+        await asyncio.sleep(delays["graph"])
+        return [("1", 0.5, [{"type": "DEPENDS_ON"}])]
+
+    search._get_keyword_results = keyword
+    search._get_semantic_results = semantic
+    search._get_graph_results = graph
+    return search
+
+
+@pytest.mark.asyncio
+async def test_sources_run_concurrently():
+    search = make_search({"keyword": 0.1, "semantic": 0.1, "graph": 0.1})
+
+    start = time.monotonic()
+    results = await search._hybrid_search("server", None, None, limit=10, min_score=0.0)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.25
+    assert isinstance(results, UnifiedSearchResults)
+    assert not results.partial
+    assert results[0].entity_id == "1"
+    assert results[0].sources == ["keyword", "semantic", "graph"]
+
+
+@pytest.mark.asyncio
+async def test_late_source_yields_partial_results():
+    search = make_search(
+        {"keyword": 0.0, "semantic": 5.0, "graph": 0.0},
+        source_timeouts={"semantic": 0.05}
+    )
+
+    start = time.monotonic()
+    results = await search._hybrid_search("server", None, None, limit=10, min_score=0.0)
+
+    assert time.monotonic() - start < 1.0
+    assert results.partial
+    assert results.timed_out_sources == ["semantic"]
+    assert [r.entity_id for r in results] == ["1"]
+    assert results[0].sources == ["keyword", "graph"]
+
+
+@pytest.fixture
+def db_session():
+    """Patch db_manager with a session returning entities for any lookup."""
+    session = MagicMock()
+
+    async def execute(stmt):
+        itglue_ids = stmt.compile().params["itglue_id_1"]
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [
+            SimpleNamespace(
+                id=f"uuid-{itglue_id}", itglue_id=itglue_id, name=f"Entity {itglue_id}",
+                entity_type="configuration", organization_id="42", attributes={}
+            )
+            for itglue_id in itglue_ids
+        ]
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+
+    @asynccontextmanager
+    async def get_session():
+        yield session
+
+    with patch("src.search.unified_hybrid.db_manager") as db_manager:
+        db_manager.get_session = get_session
+        yield session
+
+
+@pytest.mark.asyncio
+async def test_graph_only_hits_are_hydrated_in_one_query(db_session):
+    search = make_search({"keyword": 0.0, "semantic": 0.0, "graph": 0.0})
+
+    async def graph(*args):
+        return [("1", 0.5, []), ("7", 0.9, []), ("8", 0.8, [])]
+
+    search._get_graph_results = graph
+
+    results = await search._hybrid_search("server", None, None, limit=10, min_score=0.0)
+
+    assert db_session.execute.await_count == 1
+    assert db_session.execute.call_args.args[0].compile().params["itglue_id_1"] == ["7", "8"]
+    assert {r.entity_id for r in results} == {"1", "2", "7", "8"}
+
+
+@pytest.mark.asyncio
+async def test_entity_details_are_cached(db_session):
+    search = UnifiedHybridSearch()
+
+    first = await search._fetch_entities_details(["7", "8"])
+    second = await search._fetch_entities_details(["8", "9"])
+
+    assert first["8"] is second["8"]
+    assert db_session.execute.await_count == 2
+    assert db_session.execute.call_args.args[0].compile().params["itglue_id_1"] == ["9"]
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_uses_shared_generator():
+    generator = MagicMock()
+    generator.generate_embeddings = AsyncMock(return_value=[[0.1, 0.2]])
+    search = UnifiedHybridSearch(embedding_generator=generator)
+
+    assert await search._generate_embedding("server") == [0.1, 0.2]
+    generator.generate_embeddings.assert_awaited_once_with(["server"])
+
+    generator.generate_embeddings.side_effect = RuntimeError("No embedding generation method available")
+    assert await search._generate_embedding("server") is None
@@ -296,4 +296,20 @@ async def test_batch_validation():
     assert len(results) == 3
     assert results[0].valid is True
     assert results[1].valid is False  # Low confidence
-    assert results[2].valid is False  # No sources
\ No newline at end of file
+    assert results[2].valid is False  # No sources
+
+@pytest.mark.asyncio
+async def test_verify_sources_uses_preloaded_entities(validator):
+    """Test that preloaded entities are not fetched again."""
+    entities = [
+        Mock(id="entity-1", itglue_id="1", name="Router 1", entity_type="router",
+             attributes={}, last_synced=None),
+        Mock(id="entity-2", itglue_id="2", name="Router 2", entity_type="router",
+             attributes={}, last_synced=None)
+    ]
+
+    with patch('src.query.validator.db_manager') as mock_db:
+        documents = await validator._verify_sources(["entity-2"], entities)
+
+    mock_db.get_session.assert_not_called()
+    assert [doc["id"] for doc in documents] == ["entity-2"]